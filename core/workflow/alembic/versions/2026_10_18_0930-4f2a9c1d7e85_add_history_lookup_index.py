@@ -0,0 +1,31 @@
+"""add history lookup index
+
+Revision ID: 4f2a9c1d7e85
+Revises: b13356244aea
+Create Date: 2026-10-18 09:30:12.418305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "4f2a9c1d7e85"
+down_revision: Union[str, None] = "b13356244aea"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the per-node "latest N records" history lookup of a flow and user
+    op.create_index(
+        "idx_flow_uid_node_time",
+        "workflow_node_history",
+        ["flow_id", "uid", "node_id", "create_time"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_flow_uid_node_time", table_name="workflow_node_history")
@@ -21,9 +21,10 @@ from workflow.consts.runtime_env import RuntimeEnv
 from workflow.domain.entities.chat import ChatVo, ResumeVo
 from workflow.domain.entities.response import Streaming
 from workflow.engine.callbacks.openai_types_sse import LLMGenerate
+from workflow.engine.entities.provider_credentials import ProviderCredentials
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
-from workflow.extensions.middleware.getters import get_session
+from workflow.extensions.middleware.getters import get_async_session
 from workflow.extensions.otlp.metric.meter import Meter
 from workflow.extensions.otlp.trace.span import Span
 from workflow.service import app_service, audit_service, chat_service, flow_service
@@ -51,22 +52,18 @@ async def chat_debug(
     ) as span_context:
         m.set_label("flow_id", chat_vo.flow_id)
         try:
-            session = next(get_session())
-
-            db_flow = flow_service.get_flow_by_version(
-                chat_vo.flow_id, session, span_context, chat_vo.version
-            )
-            spark_dsl = db_flow.data
-
-            app_info = await app_service.get_info(app_id, session, span)
-
+            async with get_async_session() as session:
+                db_flow = await flow_service.get_flow_by_version_async(
+                    chat_vo.flow_id, session, span_context, chat_vo.version
+                )
+                app_info = await app_service.get_info_async(app_id, session, span)
+            credentials: Optional[ProviderCredentials] = None
             if not os.getenv("RUNTIME_ENV", RuntimeEnv.Local.value) in [
                 RuntimeEnv.Dev.value,
                 RuntimeEnv.Test.value,
             ]:
-                # Replace app_id, api_key, api_secret in protocol
-                db_flow.data = chat_service.change_dsl_triplets(
-                    spark_dsl,
+                # Run model nodes with the caller's app_id, api_key, api_secret
+                credentials = ProviderCredentials(
                     app_id=app_id,
                     api_key=app_info.api_key,
                     api_secret=app_info.api_secret,
@@ -95,6 +92,7 @@ async def chat_debug(
                     False,
                     app_audit_policy,
                     span_context,
+                    credentials,
                 ),
                 StreamingResponse if chat_vo.stream else JSONResponse,
             )
@@ -165,8 +163,8 @@ async def resume_debug(request: ResumeVo) -> Union[StreamingResponse, JSONRespon
                 )
 
             # Input audit
-            session = next(get_session())
-            app_info = await app_service.get_info(event.app_id, session, span)
+            async with get_async_session() as session:
+                app_info = await app_service.get_info_async(event.app_id, session, span)
             if app_info.audit_policy == AppAuditPolicy.AGENT_PLATFORM.value:
                 await audit_service.input_audit(content, span)
 
@@ -10,31 +10,31 @@ import json
 import os
 from typing import Annotated, Optional, Union
 
-from fastapi import APIRouter, Depends, Header
-
-from workflow.consts.engine.chat_status import ChatStatus
-from workflow.consts.runtime_env import RuntimeEnv
-
-try:
-    from sqlmodel import Session  # type: ignore[import]
-except ImportError:
-    from sqlalchemy.orm import Session  # type: ignore[assignment]
-
 from common.utils.snowfake import get_id
+from fastapi import APIRouter, Header
 from starlette.responses import JSONResponse, StreamingResponse
 
 from workflow.cache.event_registry import Event, EventRegistry
 from workflow.consts.app_audit import AppAuditPolicy
+from workflow.consts.engine.chat_status import ChatStatus
+from workflow.consts.runtime_env import RuntimeEnv
 from workflow.consts.tenant_publish_matrix import Platform, TenantPublishMatrix
 from workflow.domain.entities.chat import ChatVo, ResumeVo
 from workflow.domain.entities.response import Streaming
 from workflow.engine.callbacks.openai_types_sse import LLMGenerate
+from workflow.engine.entities.provider_credentials import ProviderCredentials
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
-from workflow.extensions.middleware.getters import get_session
+from workflow.extensions.middleware.getters import get_async_session
 from workflow.extensions.otlp.metric.meter import Meter
 from workflow.extensions.otlp.trace.span import Span
-from workflow.service import app_service, audit_service, chat_service, flow_service
+from workflow.service import (
+    app_service,
+    audit_service,
+    chat_service,
+    flow_service,
+    warm_start_service,
+)
 
 router = APIRouter(tags=["SSE_OPENAPI"])
 
@@ -43,13 +43,11 @@ router = APIRouter(tags=["SSE_OPENAPI"])
 async def chat_open(
     x_consumer_username: Annotated[str, Header()],
     chat_vo: ChatVo,
-    db_session: Session = Depends(get_session),
 ) -> Union[StreamingResponse, JSONResponse]:
     """
     Handle chat completions for open API
     :param x_consumer_username: Consumer username from header
     :param chat_vo: Chat request data
-    :param db_session: Database session dependency
     :return: Streaming or JSON response
     """
     m = Meter()
@@ -60,17 +58,15 @@ async def chat_open(
         attributes={"flow_id": chat_vo.flow_id},
     ) as span_context:
         try:
-            db_flow = await asyncio.to_thread(
-                flow_service.get_latest_published_flow_by,
-                chat_vo.flow_id,
-                app_id,
-                db_session,
-                span_context,
-                chat_vo.version,
-            )
-            spark_dsl = db_flow.release_data
-            app_info = await app_service.get_info(app_id, db_session, span)
-
+            async with get_async_session() as db_session:
+                db_flow = await flow_service.get_latest_published_flow_by_async(
+                    chat_vo.flow_id,
+                    app_id,
+                    db_session,
+                    span_context,
+                    chat_vo.version,
+                )
+                app_info = await app_service.get_info_async(app_id, db_session, span)
             app_audit_policy = (
                 AppAuditPolicy.DEFAULT
                 if not app_info.audit_policy
@@ -102,13 +98,13 @@ async def chat_open(
                     JSONResponse,
                 )
 
+            credentials: Optional[ProviderCredentials] = None
             if not os.getenv("RUNTIME_ENV", RuntimeEnv.Local.value) in [
                 RuntimeEnv.Dev.value,
                 RuntimeEnv.Test.value,
             ]:
-                # Replace app_id, api_key, api_secret in protocol
-                db_flow.release_data = chat_service.change_dsl_triplets(
-                    spark_dsl,
+                # Run model nodes with the caller's app_id, api_key, api_secret
+                credentials = ProviderCredentials(
                     app_id=app_id,
                     api_key=app_info.api_key,
                     api_secret=app_info.api_secret,
@@ -123,6 +119,7 @@ async def chat_open(
                 is_stream=chat_vo.stream,
             )
             await asyncio.to_thread(EventRegistry().init_event, event)
+            warm_start_service.record_request(chat_vo.flow_id, app_id, chat_vo.version)
             return await Streaming.send(
                 await chat_service.event_stream(
                     app_id,
@@ -133,6 +130,7 @@ async def chat_open(
                     True,
                     app_audit_policy,
                     span_context,
+                    credentials,
                 ),
                 StreamingResponse if chat_vo.stream else JSONResponse,
             )
@@ -202,8 +200,8 @@ async def resume_open(request: ResumeVo) -> Union[StreamingResponse, JSONRespons
                 )
 
             # Input audit
-            session = next(get_session())
-            app_info = await app_service.get_info(event.app_id, session, span)
+            async with get_async_session() as session:
+                app_info = await app_service.get_info_async(event.app_id, session, span)
             if app_info.audit_policy == AppAuditPolicy.AGENT_PLATFORM.value:
                 await audit_service.input_audit(content, span)
 
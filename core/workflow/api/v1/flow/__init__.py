@@ -7,6 +7,7 @@ layout management, and flow protocol handling.
 
 from workflow.api.v1.flow.auth import router as auth_router
 from workflow.api.v1.flow.file import router as file_router
+from workflow.api.v1.flow.knowledge import router as knowledge_router
 from workflow.api.v1.flow.layout import router as layout_router
 
-__all__ = ["layout_router", "file_router", "auth_router"]
+__all__ = ["layout_router", "file_router", "auth_router", "knowledge_router"]
@@ -5,7 +5,6 @@ This module provides API endpoints for uploading single and multiple files
 to the workflow system with proper validation and storage handling.
 """
 
-import uuid
 from typing import Annotated, List
 
 from fastapi import APIRouter, File, Header, UploadFile
@@ -14,7 +13,6 @@ from fastapi.responses import JSONResponse
 from workflow.domain.entities.response import Resp
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
-from workflow.extensions.middleware.getters import get_oss_service
 from workflow.extensions.otlp.metric.meter import Meter
 from workflow.extensions.otlp.trace.span import Span
 from workflow.service import file_service
@@ -38,17 +36,7 @@ async def upload_file(
     span = Span(app_id=app_id)
     with span.start() as span_context:
         try:
-            contents = await file.read()
-            file_service.check(file, contents, span_context)
-            if not file.filename:
-                raise CustomException(
-                    err_code=CodeEnum.FILE_INVALID_ERROR,
-                    err_msg="File name cannot be empty",
-                )
-            extension = file.filename.split(".")[-1].lower()
-            file_url = await get_oss_service().upload_file_async(
-                f"{str(uuid.uuid4())}.{extension}", contents
-            )
+            file_url = await file_service.upload(file, span_context)
             m.in_success_count()
             return Resp.success(data={"url": file_url}, sid=span_context.sid)
         except CustomException as e:
@@ -83,17 +71,7 @@ async def upload_files(
         try:
             file_urls = []
             for file in files:
-                contents = await file.read()
-                file_service.check(file, contents, span_context)
-                if not file.filename:
-                    raise CustomException(
-                        err_code=CodeEnum.FILE_INVALID_ERROR,
-                        err_msg="File name cannot be empty",
-                    )
-                extension = file.filename.split(".")[-1].lower()
-                file_url = await get_oss_service().upload_file_async(
-                    f"{str(uuid.uuid4())}.{extension}", contents
-                )
+                file_url = await file_service.upload(file, span_context)
                 file_urls.append(file_url)
             m.in_success_count()
             return Resp.success(data={"urls": file_urls}, sid=span_context.sid)
@@ -0,0 +1,47 @@
+"""
+Knowledge cache API endpoints for workflow system.
+
+This module provides the hook through which changes to knowledge repositories
+invalidate the retrieval results cached by knowledge nodes.
+"""
+
+import asyncio
+
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from workflow.cache.knowledge import bump_knowledge_repo_versions
+from workflow.domain.entities.flow import KnowledgeCacheInvalidateInput
+from workflow.domain.entities.response import Resp
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.otlp.trace.span import Span
+
+router = APIRouter(tags=["Flows"])
+
+
+@router.post("/knowledge/cache/invalidate")
+async def invalidate_knowledge_cache(
+    invalidate_input: KnowledgeCacheInvalidateInput,
+) -> JSONResponse:
+    """
+    Invalidate cached knowledge retrieval results of changed repositories.
+
+    :param invalidate_input: IDs of the repositories that changed
+    :return: Success response
+    """
+    span = Span()
+    with span.start(
+        attributes={"repo_ids": ",".join(invalidate_input.repo_ids)},
+    ) as span_context:
+        try:
+            await asyncio.to_thread(
+                bump_knowledge_repo_versions, invalidate_input.repo_ids
+            )
+        except Exception as err:
+            span_context.record_exception(err)
+            return Resp.error(
+                code=CodeEnum.KNOWLEDGE_REQUEST_ERROR.code,
+                message=f"Failed to invalidate knowledge cache, Error details: {err}",
+                sid=span_context.sid,
+            )
+        return Resp.success(sid=span_context.sid)
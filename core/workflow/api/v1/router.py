@@ -12,7 +12,12 @@ from workflow.api.v1.chat import (
     sse_debug_chat_router,
     sse_openapi_router,
 )
-from workflow.api.v1.flow import auth_router, file_router, layout_router
+from workflow.api.v1.flow import (
+    auth_router,
+    file_router,
+    knowledge_router,
+    layout_router,
+)
 
 # Main workflow router with v1 prefix
 workflow_router = APIRouter(prefix="/workflow/v1")
@@ -22,6 +27,7 @@ workflow_router.include_router(layout_router)
 workflow_router.include_router(auth_router)
 workflow_router.include_router(node_debug_router)
 workflow_router.include_router(file_router)
+workflow_router.include_router(knowledge_router)
 workflow_router.include_router(sse_debug_chat_router)
 workflow_router.include_router(sse_openapi_router)
 
@@ -0,0 +1,38 @@
+"""
+Workflow engine plan cache module.
+
+Published flows are immutable, so the engine built from a published DSL is
+serialized once and stored under a key derived from the DSL content. Workers
+deserialize it instead of validating and building the DSL again.
+"""
+
+from workflow.extensions.middleware.getters import get_cache_service
+
+# Redis key prefix for serialized engine plans
+REDIS_ENGINE_PLAN_HEAD = "workflow:engine_plan"
+
+
+def get_engine_plan(plan_key: str) -> bytes | None:
+    """
+    Retrieve a serialized engine plan.
+
+    :param plan_key: Plan key derived from the workflow DSL
+    :return: Serialized engine if present, None otherwise
+    """
+    key = f"{REDIS_ENGINE_PLAN_HEAD}:{plan_key}"
+    cache_service = get_cache_service()
+    return cache_service[key]
+
+
+def set_engine_plan(plan_key: str, plan: bytes, expire_time: int) -> None:
+    """
+    Store a serialized engine plan.
+
+    :param plan_key: Plan key derived from the workflow DSL
+    :param plan: Serialized engine
+    :param expire_time: Expiration time in seconds
+    :return: None
+    """
+    key = f"{REDIS_ENGINE_PLAN_HEAD}:{plan_key}"
+    cache_service = get_cache_service()
+    cache_service.set(key=key, value=plan, expire_time=expire_time)
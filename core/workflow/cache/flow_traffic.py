@@ -0,0 +1,63 @@
+"""
+Workflow flow traffic cache module.
+
+This module counts open API requests per published flow in time buckets, so
+restarting workers can find the flows that received the most recent traffic.
+"""
+
+import json
+import time
+from typing import Dict, List, Tuple
+
+from workflow.extensions.middleware.getters import get_cache_service
+
+# Redis key prefix for flow request counters
+REDIS_FLOW_TRAFFIC_HEAD = "workflow:flow_traffic"
+
+
+def _bucket_key(bucket: int) -> str:
+    return f"{REDIS_FLOW_TRAFFIC_HEAD}:{bucket}"
+
+
+def record_flow_requests(counts: Dict[Tuple[str, str, str], int], window: int) -> None:
+    """
+    Count requests to published flows in the current traffic bucket.
+
+    :param counts: Number of requests per (flow_id, app_id, version), the
+                   version being empty for the latest one
+    :param window: Length of a traffic bucket in seconds
+    :return: None
+    """
+    if not counts:
+        return
+    key = _bucket_key(int(time.time()) // window)
+    with get_cache_service().pipeline() as pipe:
+        for flow, count in counts.items():
+            pipe.zincrby(key, count, json.dumps(list(flow)))
+        # Keep the bucket while it still counts as the previous one
+        pipe.expire(key, window * 2)
+        pipe.execute()
+
+
+def get_hot_flows(limit: int, window: int) -> List[Tuple[str, str, str]]:
+    """
+    Retrieve the most requested flows of the current and previous bucket.
+
+    :param limit: Maximum number of flows to return
+    :param window: Length of a traffic bucket in seconds
+    :return: (flow_id, app_id, version) tuples, most requested first
+    """
+    bucket = int(time.time()) // window
+    with get_cache_service().pipeline() as pipe:
+        pipe.zrevrange(_bucket_key(bucket), 0, limit - 1, withscores=True)
+        pipe.zrevrange(_bucket_key(bucket - 1), 0, limit - 1, withscores=True)
+        results = pipe.execute()
+
+    scores: Dict[str, float] = {}
+    for entries in results:
+        for member, score in entries or []:
+            if isinstance(member, bytes):
+                member = member.decode("utf-8")
+            scores[member] = scores.get(member, 0) + score
+    hot = sorted(scores, key=lambda member: scores[member], reverse=True)[:limit]
+    return [tuple(json.loads(member)) for member in hot]  # type: ignore[misc]
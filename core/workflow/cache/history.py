@@ -0,0 +1,81 @@
+"""
+Chat history version cache module.
+
+Every worker keeps recently read chat history in memory. To keep those
+in-process copies coherent across workers, each flow/user pair has a version
+token in Redis that is replaced whenever new history is persisted. A worker's
+copy is only served while its token still matches the one in Redis.
+"""
+
+import uuid
+from typing import Dict, List, Tuple
+
+from workflow.extensions.middleware.getters import get_cache_service
+
+# Redis key prefix for chat history versions
+REDIS_HISTORY_VERSION_HEAD = "workflow:history_version"
+
+
+def get_history_version(flow_id: str, uid: str) -> str | None:
+    """
+    Retrieve the current history version token of a flow/user pair.
+
+    :param flow_id: Flow ID
+    :param uid: User ID
+    :return: Version token if present, None otherwise
+    """
+    key = f"{REDIS_HISTORY_VERSION_HEAD}:{flow_id}:{uid}"
+    cache_service = get_cache_service()
+    return cache_service[key]
+
+
+def bump_history_version(flow_id: str, uid: str) -> str:
+    """
+    Replace the history version token of a flow/user pair.
+
+    :param flow_id: Flow ID
+    :param uid: User ID
+    :return: The new version token
+    """
+    return swap_history_version(flow_id, uid)[1]
+
+
+def swap_history_version(flow_id: str, uid: str) -> Tuple[str | None, str]:
+    """
+    Atomically replace the history version token of a flow/user pair.
+
+    Comparing a cached copy against the returned previous token tells whether
+    any other version was published since the copy was read, even when other
+    workers replace the token concurrently.
+
+    :param flow_id: Flow ID
+    :param uid: User ID
+    :return: (previous token or None, new token)
+    """
+    return swap_history_versions([(flow_id, uid)])[(flow_id, uid)]
+
+
+def swap_history_versions(
+    pairs: List[Tuple[str, str]],
+) -> Dict[Tuple[str, str], Tuple[str | None, str]]:
+    """
+    Atomically replace the history version tokens of several flow/user pairs
+    in a single round trip.
+
+    :param pairs: (flow_id, uid) pairs
+    :return: (previous token or None, new token) by (flow_id, uid)
+    """
+    versions = {pair: uuid.uuid4().hex for pair in pairs}
+    previous = get_cache_service().getset_many(
+        {
+            f"{REDIS_HISTORY_VERSION_HEAD}:{flow_id}:{uid}": version
+            for (flow_id, uid), version in versions.items()
+        }
+    )
+    return {
+        (flow_id, uid): (
+            previous[f"{REDIS_HISTORY_VERSION_HEAD}:{flow_id}:{uid}"],
+            version,
+        )
+        for (flow_id, uid), version in versions.items()
+    }
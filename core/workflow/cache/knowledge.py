@@ -0,0 +1,73 @@
+"""
+Knowledge retrieval result cache module.
+
+Knowledge node results are cached in Redis under a key derived from the
+normalized query, the retrieval parameters and the version tokens of the
+referenced repositories. Bumping a repository's version token makes every
+cached result that references it unreachable, which is how changes to a
+repository invalidate the cache.
+"""
+
+import uuid
+from typing import Dict, List
+
+from workflow.extensions.middleware.getters import get_cache_service
+
+# Redis key prefix for knowledge retrieval results
+REDIS_KNOWLEDGE_RESULT_HEAD = "workflow:knowledge_result"
+
+# Redis hash holding the version token of each knowledge repository
+REDIS_KNOWLEDGE_REPO_VERSION = "workflow:knowledge_repo_version"
+
+
+def get_knowledge_result(cache_key: str) -> str | None:
+    """
+    Retrieve a cached knowledge retrieval result.
+
+    :param cache_key: Result cache key
+    :return: Cached retrieval result if present, None otherwise
+    """
+    key = f"{REDIS_KNOWLEDGE_RESULT_HEAD}:{cache_key}"
+    cache_service = get_cache_service()
+    return cache_service[key]
+
+
+def set_knowledge_result(cache_key: str, result: str, expire_time: int) -> None:
+    """
+    Store a knowledge retrieval result.
+
+    :param cache_key: Result cache key
+    :param result: Retrieval result to store
+    :param expire_time: Expiration time in seconds
+    :return: None
+    """
+    key = f"{REDIS_KNOWLEDGE_RESULT_HEAD}:{cache_key}"
+    cache_service = get_cache_service()
+    cache_service.set(key=key, value=result, expire_time=expire_time)
+
+
+def get_knowledge_repo_versions(repo_ids: List[str]) -> Dict[str, str]:
+    """
+    Retrieve the version tokens of knowledge repositories.
+
+    :param repo_ids: Repository IDs
+    :return: Version token of each repository that has one
+    """
+    cache_service = get_cache_service()
+    return cache_service.hash_get_many(REDIS_KNOWLEDGE_REPO_VERSION, repo_ids)
+
+
+def bump_knowledge_repo_versions(repo_ids: List[str]) -> None:
+    """
+    Replace the version tokens of knowledge repositories, invalidating every
+    cached result that references them.
+
+    :param repo_ids: Repository IDs
+    :return: None
+    """
+    cache_service = get_cache_service()
+    cache_service.hash_set_many(
+        REDIS_KNOWLEDGE_REPO_VERSION,
+        {repo_id: uuid.uuid4().hex for repo_id in repo_ids},
+        None,
+    )
@@ -56,10 +56,22 @@ class FileConfig(BaseSettings):
 
     This model represents the file configuration with its categories.
     :param categories: The categories of the file configuration
+    :param check_timeout: Deadline in seconds for validating all file inputs
+                          of a single request
+    :param check_cache_ttl: Seconds a file URL's metadata is cached for
+    :param upload_part_size: Bytes read and stored per part of an uploaded file,
+                             at least the 5 MiB minimum part size of S3
+    :param upload_concurrency: Parts of one uploaded file stored concurrently
     """
 
     model_config = {"env_prefix": "", "case_sensitive": False}
     categories: List[FileCategory] = Field(default_factory=list, alias="FILE_POLICY")
+    check_timeout: float = Field(default=10.0, alias="FILE_CHECK_TIMEOUT")
+    check_cache_ttl: int = Field(default=300, alias="FILE_CHECK_CACHE_TTL")
+    upload_part_size: int = Field(
+        default=8 * 1024 * 1024, ge=5 * 1024 * 1024, alias="FILE_UPLOAD_PART_SIZE"
+    )
+    upload_concurrency: int = Field(default=4, alias="FILE_UPLOAD_CONCURRENCY")
 
     def _get_category(self, category: str) -> Optional[FileCategory]:
         """
@@ -215,9 +227,117 @@ class DatabaseConfig(BaseSettings):
     database: str = Field(default="", alias="MYSQL_DB")
 
 
+class HistoryConfig(BaseSettings):
+    """
+    Chat history configuration model.
+
+    :param cache_ttl: Seconds a worker keeps the chat history of a flow/user
+                      in memory, 0 disables the cache
+    :param cache_size: Maximum number of flow/user histories kept per worker
+    :param write_async_enable: Whether history is persisted by the background
+                               batch writer instead of one commit per record
+    :param write_batch_size: Maximum number of records per multi-row insert
+    :param write_flush_interval: Maximum seconds a record waits before flushing
+    :param write_queue_size: Maximum number of queued records before producers
+                             have to wait
+    :param write_max_retries: Retries of a failed multi-row insert before the
+                              records are written one at a time
+    :param write_retry_backoff: Seconds before the first retry, doubled on each
+                                further retry
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    cache_ttl: int = Field(default=300, alias="HISTORY_CACHE_TTL")
+    cache_size: int = Field(default=2048, alias="HISTORY_CACHE_SIZE")
+    write_async_enable: bool = Field(default=True, alias="HISTORY_WRITE_ASYNC_ENABLE")
+    write_batch_size: int = Field(default=200, alias="HISTORY_WRITE_BATCH_SIZE")
+    write_flush_interval: float = Field(
+        default=0.5, alias="HISTORY_WRITE_FLUSH_INTERVAL"
+    )
+    write_queue_size: int = Field(default=10000, alias="HISTORY_WRITE_QUEUE_SIZE")
+    write_max_retries: int = Field(default=2, alias="HISTORY_WRITE_MAX_RETRIES")
+    write_retry_backoff: float = Field(default=0.5, alias="HISTORY_WRITE_RETRY_BACKOFF")
+
+
+class LookupCacheConfig(BaseSettings):
+    """
+    Flow and application lookup cache configuration model.
+
+    :param negative_ttl: Seconds a worker remembers that a flow or application
+                         lookup found nothing, 0 disables negative caching
+    :param negative_size: Maximum number of negative entries kept per worker
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    negative_ttl: float = Field(default=5.0, alias="LOOKUP_NEGATIVE_CACHE_TTL")
+    negative_size: int = Field(default=4096, alias="LOOKUP_NEGATIVE_CACHE_SIZE")
+
+
+class GlobalVariableConfig(BaseSettings):
+    """
+    Global variable node configuration model.
+
+    :param run_cache: Whether values read or written by global variable nodes
+                      are reused for the rest of the same run instead of being
+                      read from Redis again
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    run_cache: bool = Field(default=False, alias="GLOBAL_VARIABLE_RUN_CACHE")
+
+
+class LLMRateLimitConfig(BaseSettings):
+    """
+    LLM call scheduling configuration model.
+
+    :param max_concurrency: Concurrent calls per model endpoint and credentials,
+                            0 disables scheduling
+    :param max_wait: Seconds an LLM call waits for provider capacity
+    :param cooldown: Seconds a provider is paused after throttling without a
+                     retry-after hint
+    :param token_reserve: Remaining provider token budget below which calls
+                          wait for the token window reset
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    max_concurrency: int = Field(default=0, alias="LLM_RATE_LIMIT_MAX_CONCURRENCY")
+    max_wait: float = Field(default=30.0, alias="LLM_RATE_LIMIT_MAX_WAIT")
+    cooldown: float = Field(default=1.0, alias="LLM_RATE_LIMIT_COOLDOWN")
+    token_reserve: int = Field(default=1000, alias="LLM_RATE_LIMIT_TOKEN_RESERVE")
+
+
+class DecisionNodeConfig(BaseSettings):
+    """
+    Decision node configuration model.
+
+    :param early_exit: Whether prompt-based decision nodes abort the LLM
+                       generation once the chosen intent has been streamed.
+                       Token usage is not reported for aborted generations
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    early_exit: bool = Field(default=False, alias="DECISION_NODE_EARLY_EXIT")
+
+
+class ParamsExtractorConfig(BaseSettings):
+    """
+    Parameter extractor node configuration model.
+
+    :param early_exit: Whether prompt-based extraction aborts the LLM generation
+                       once every output parameter has been streamed.
+                       Token usage is not reported for aborted generations
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    early_exit: bool = Field(default=False, alias="PARAMS_EXTRACTOR_EARLY_EXIT")
+
+
 class KnowledgeNodeLLMConfig(BaseSettings):
     """
     KnowledgeNode LLM configuration model for adaptive knowledge search.
+
+    :param speculative_retrieval: Whether adaptive mode starts retrieval while
+                                  the LLM is still deciding whether to use it
     """
 
     model_config = {"env_prefix": "", "case_sensitive": False}
@@ -227,6 +347,126 @@ class KnowledgeNodeLLMConfig(BaseSettings):
     temperature: float = Field(default=1.0, alias="KNOWLEDGE_NODE_LLM_TEMPERATURE")
     max_tokens: int = Field(default=2048, alias="KNOWLEDGE_NODE_LLM_MAX_TOKENS")
     top_k: int = Field(default=3, alias="KNOWLEDGE_NODE_LLM_TOP_K")
+    speculative_retrieval: bool = Field(
+        default=False, alias="KNOWLEDGE_NODE_SPECULATIVE_RETRIEVAL"
+    )
+
+
+class KnowledgeCacheConfig(BaseSettings):
+    """
+    Knowledge node result cache configuration model.
+
+    :param ttl: Seconds a knowledge retrieval result is reused by nodes that
+                enable the result cache
+    :param local_size: Maximum number of results kept in memory per worker
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    ttl: int = Field(default=300, alias="KNOWLEDGE_RESULT_CACHE_TTL")
+    local_size: int = Field(default=1024, alias="KNOWLEDGE_RESULT_CACHE_SIZE")
+
+
+class EnginePlanCacheConfig(BaseSettings):
+    """
+    Engine plan cache configuration model.
+
+    :param ttl: Seconds a serialized engine plan of a published flow is kept,
+                0 disables the plan cache
+    :param local_size: Maximum number of serialized plans kept in memory per worker
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    ttl: int = Field(default=604800, alias="ENGINE_PLAN_CACHE_TTL")
+    local_size: int = Field(default=256, alias="ENGINE_PLAN_CACHE_SIZE")
+
+
+class NodeMemoConfig(BaseSettings):
+    """
+    Pure node memoization configuration model.
+
+    :param ttl: Seconds the outputs of a pure node are reused for the same
+                configuration and inputs, 0 disables memoization
+    :param local_size: Maximum number of memoized node results kept in memory
+                       per worker
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    ttl: int = Field(default=600, alias="NODE_MEMO_CACHE_TTL")
+    local_size: int = Field(default=4096, alias="NODE_MEMO_CACHE_SIZE")
+
+
+class ChatAdmissionConfig(BaseSettings):
+    """
+    Chat admission control configuration model.
+
+    :param max_inflight: Maximum number of workflow runs per worker,
+                         0 disables admission control
+    :param app_share: Fraction of the runs a single app may hold
+    :param max_queue: Maximum number of chat requests waiting for a run slot
+    :param queue_timeout: Seconds a chat request waits for a run slot
+    :param max_loop_lag: Event loop lag in seconds above which chat requests
+                         are rejected, 0 disables the check
+    :param max_executor_queue: Pending thread pool jobs above which chat
+                               requests are rejected, 0 disables the check
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    max_inflight: int = Field(default=0, alias="CHAT_ADMISSION_MAX_INFLIGHT")
+    app_share: float = Field(default=0.5, alias="CHAT_ADMISSION_APP_SHARE")
+    max_queue: int = Field(default=100, alias="CHAT_ADMISSION_MAX_QUEUE")
+    queue_timeout: float = Field(default=2.0, alias="CHAT_ADMISSION_QUEUE_TIMEOUT")
+    max_loop_lag: float = Field(default=0.5, alias="CHAT_ADMISSION_MAX_LOOP_LAG")
+    max_executor_queue: int = Field(
+        default=200, alias="CHAT_ADMISSION_MAX_EXECUTOR_QUEUE"
+    )
+
+
+class WarmStartConfig(BaseSettings):
+    """
+    Worker warm start configuration model.
+
+    :param top_flows: Number of most requested flows prepared before the worker
+                      serves requests, 0 disables warm start
+    :param window: Seconds of recent traffic flows are ranked by
+    :param timeout: Seconds the warm start may delay worker startup
+    :param node_types: Comma separated node types whose modules are imported
+                       on startup, "*" for all of them
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    top_flows: int = Field(default=0, alias="WARM_START_TOP_FLOWS")
+    window: int = Field(default=3600, alias="WARM_START_WINDOW")
+    timeout: float = Field(default=30.0, alias="WARM_START_TIMEOUT")
+    node_types: str = Field(default="", alias="WARM_START_NODE_TYPES")
+
+
+class RunRecordConfig(BaseSettings):
+    """
+    Workflow run recording configuration model.
+
+    :param record_dir: Directory run tapes are written to, empty disables
+                       recording
+    :param flows: Comma separated flow IDs whose runs are recorded, "*" for
+                  all flows
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    record_dir: str = Field(default="", alias="RUN_RECORD_DIR")
+    flows: str = Field(default="", alias="RUN_RECORD_FLOWS")
+
+
+class AuditBatchConfig(BaseSettings):
+    """
+    Output audit batching configuration model.
+
+    :param max_sentences: Maximum number of sentences submitted in one output
+                          audit call
+    :param window: Seconds an output audit window stays open for more sentences
+    """
+
+    model_config = {"env_prefix": "", "case_sensitive": False}
+    max_sentences: int = Field(default=8, ge=1, alias="AUDIT_BATCH_MAX_SENTENCES")
+    window: float = Field(default=0.05, alias="AUDIT_BATCH_WINDOW")
 
 
 class WorkflowConfig(BaseModel):
@@ -238,6 +478,31 @@ class WorkflowConfig(BaseModel):
     pgsql_config: PgsqlConfig = Field(default_factory=PgsqlConfig)
     code_executor_config: CodeExecutorConfig = Field(default_factory=CodeExecutorConfig)
     database_config: DatabaseConfig = Field(default_factory=DatabaseConfig)
+    history_config: HistoryConfig = Field(default_factory=HistoryConfig)
+    lookup_cache_config: LookupCacheConfig = Field(default_factory=LookupCacheConfig)
+    global_variable_config: GlobalVariableConfig = Field(
+        default_factory=GlobalVariableConfig
+    )
+    llm_rate_limit_config: LLMRateLimitConfig = Field(
+        default_factory=LLMRateLimitConfig
+    )
+    decision_node_config: DecisionNodeConfig = Field(default_factory=DecisionNodeConfig)
+    params_extractor_config: ParamsExtractorConfig = Field(
+        default_factory=ParamsExtractorConfig
+    )
     knowledge_node_llm_config: KnowledgeNodeLLMConfig = Field(
         default_factory=KnowledgeNodeLLMConfig
     )
+    knowledge_cache_config: KnowledgeCacheConfig = Field(
+        default_factory=KnowledgeCacheConfig
+    )
+    engine_plan_cache_config: EnginePlanCacheConfig = Field(
+        default_factory=EnginePlanCacheConfig
+    )
+    node_memo_config: NodeMemoConfig = Field(default_factory=NodeMemoConfig)
+    chat_admission_config: ChatAdmissionConfig = Field(
+        default_factory=ChatAdmissionConfig
+    )
+    warm_start_config: WarmStartConfig = Field(default_factory=WarmStartConfig)
+    run_record_config: RunRecordConfig = Field(default_factory=RunRecordConfig)
+    audit_batch_config: AuditBatchConfig = Field(default_factory=AuditBatchConfig)
@@ -105,3 +105,13 @@ class AuthInput(BaseModel):
 
     flow_id: str = Field(..., description="Flow ID")
     app_id: str = Field(..., description="App ID")
+
+
+class KnowledgeCacheInvalidateInput(BaseModel):
+    """
+    Input data for invalidating cached knowledge retrieval results.
+
+    :param repo_ids: IDs of the knowledge repositories that changed
+    """
+
+    repo_ids: list[str] = Field(..., min_length=1, description="Repository IDs")
@@ -213,6 +213,40 @@ class ChatCallBacks:
         )
         await self._put_frame_into_queue(node_id, resp)
 
+    async def on_node_item_progress(
+        self,
+        node_id: str,
+        alias_name: str,
+        index: int,
+        total: int,
+        status: str,
+        outputs: dict,
+    ) -> None:
+        """
+        Handle the completion of one item of a node processing a batch.
+
+        :param node_id: Unique identifier of the node processing the batch
+        :param alias_name: Human-readable name for the node
+        :param index: Index of the finished item within the batch
+        :param total: Number of items in the batch
+        :param status: Execution status of the finished item
+        :param outputs: Outputs produced for the finished item
+        """
+        resp = LLMGenerate.node_item_progress(
+            sid=self.sid,
+            node_id=node_id,
+            alias_name=alias_name,
+            node_executed_time=round(
+                time.time() - self.node_execute_start_time.get(node_id, 0), 3
+            ),
+            progress=self._get_node_progress(node_id),
+            index=index,
+            total=total,
+            status=status,
+            outputs=outputs,
+        )
+        await self._put_frame_into_queue(node_id, resp)
+
     async def on_node_interrupt(
         self,
         event_id: str,
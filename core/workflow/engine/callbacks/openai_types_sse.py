@@ -12,6 +12,9 @@ from pydantic import BaseModel, Field
 
 from workflow.consts.engine.chat_status import ChatStatus
 
+# Node extension key of the index, batch size and status of a finished item
+ITEM_PROGRESS_EXT = "item_progress"
+
 
 def current_time() -> int:
     """
@@ -533,6 +536,53 @@ class LLMGenerate(BaseModel):
             reasoning_content=reasoning_content,
         )
 
+    @staticmethod
+    def node_item_progress(
+        sid: str,
+        node_id: str,
+        alias_name: str,
+        node_executed_time: float,
+        progress: float,
+        index: int,
+        total: int,
+        status: str,
+        outputs: dict,
+        code: int = 0,
+        message: str = "Success",
+    ) -> "LLMGenerate":
+        """
+        Build item progress event response result for nodes processing a batch.
+
+        :param sid: Session or request unique identifier for tracking the workflow
+        :param node_id: Unique identifier of the node processing the batch
+        :param alias_name: Alias name of the node, typically used for display or friendly identification
+        :param node_executed_time: Time the node has been executing, in seconds, for performance statistics
+        :param progress: Current workflow execution progress, typically in range [0,1]
+        :param index: Index of the finished item within the batch
+        :param total: Number of items in the batch
+        :param status: Execution status of the finished item
+        :param outputs: Outputs produced for the finished item
+        :param code: Status code, default 0 indicates success
+        :param message: Status message description, default "Success"
+        :return: LLMGenerate instance for item progress event
+        """
+        node_info = NodeInfo(
+            id=node_id,
+            alias_name=alias_name,
+            finish_reason=None,
+            inputs={},
+            outputs=outputs,
+            executed_time=node_executed_time,
+            ext={ITEM_PROGRESS_EXT: {"index": index, "total": total, "status": status}},
+        )
+        return LLMGenerate._common(
+            sid=sid,
+            code=code,
+            message=message,
+            node_info=node_info,
+            progress=progress,
+        )
+
     @staticmethod
     def node_interrupt(
         sid: str,
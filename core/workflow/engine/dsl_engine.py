@@ -7,6 +7,7 @@ and various execution strategies for different node types.
 """
 
 import asyncio
+import hashlib
 import pickle
 import time
 from abc import ABC, abstractmethod
@@ -22,6 +23,7 @@ from workflow.consts.engine.value_type import ValueType
 from workflow.domain.entities.chat import HistoryItem
 from workflow.engine.callbacks.callback_handler import ChatCallBacks
 from workflow.engine.entities.chains import Chains, SimplePath
+from workflow.engine.entities.engine_snapshot import EngineSnapshot
 from workflow.engine.entities.msg_or_end_dep_info import MsgOrEndDepInfo
 from workflow.engine.entities.node_entities import (
     CONTINUE_ON_ERROR_NOT_STREAM_NODE_TYPE,
@@ -1795,6 +1797,112 @@ class WorkflowEngine(BaseModel):
             span.record_exception(e)
             return None, 0
 
+    def plan_version(self) -> str:
+        """
+        Get the version of the immutable execution plan of this engine.
+
+        :return: Digest of the workflow DSL the engine was built from
+        """
+        return hashlib.sha256(
+            self.workflow_dsl.model_dump_json().encode("utf-8")
+        ).hexdigest()
+
+    def _is_node_complete(self, node_id: str) -> bool:
+        status = self.engine_ctx.node_run_status.get(node_id)
+        return bool(status and status.complete.is_set() and not status.not_run.is_set())
+
+    def dump_snapshot(self, span: Span, interrupt_node: str = "") -> bytes:
+        """
+        Serialize only the mutable run state of the engine.
+
+        Unlike ``dumps``, nodes, chains and dependencies are left out and
+        referenced by the plan version, which keeps paused sessions small.
+
+        :param span: Tracing span for observability
+        :param interrupt_node: ID of the node waiting for user input
+        :return: Serialized snapshot as bytes, empty on failure
+        """
+        try:
+            variable_pool = self.engine_ctx.variable_pool
+            completed = [
+                node_id
+                for node_id in self.engine_ctx.node_run_status
+                if self._is_node_complete(node_id)
+            ]
+
+            def _produced(mapping: Dict[str, Any]) -> Dict[str, Any]:
+                return {
+                    key: value.get("value")
+                    for key, value in mapping.items()
+                    if any(key.startswith(f"{node_id}-") for node_id in completed)
+                }
+
+            snapshot = EngineSnapshot(
+                plan_version=self.plan_version(),
+                build_timestamp=self.engine_ctx.build_timestamp,
+                node_status={
+                    node_id: status.dump()
+                    for node_id, status in self.engine_ctx.node_run_status.items()
+                },
+                outputs=_produced(variable_pool.output_variable_mapping),
+                end_inputs=_produced(variable_pool.input_variable_mapping),
+                responses=self.engine_ctx.responses,
+                interrupt_node=interrupt_node,
+                system_params=variable_pool.system_params.dump(),
+                chat_id=variable_pool.chat_id,
+                history_mapping=variable_pool.history_mapping,
+                history_v2=variable_pool.history_v2,
+            )
+            return pickle.dumps(snapshot)
+        except Exception as e:
+            # External exception caught, do not return to user
+            span.record_exception(e)
+            return b""
+
+    @staticmethod
+    def load_snapshot(
+        snapshot_bytes: bytes, plan: "WorkflowEngine", span: Span
+    ) -> Tuple[Optional["WorkflowEngine"], str]:
+        """
+        Restore run state produced by ``dump_snapshot`` onto a freshly built engine.
+
+        :param snapshot_bytes: Byte object generated by dump_snapshot
+        :param plan: Engine built from the same workflow DSL, not yet run
+        :param span: Tracing span for observability
+        :return: Tuple of (restored engine, pending interrupt node ID), the
+                 engine is None if the snapshot is invalid or the plan changed
+        """
+        try:
+            snapshot: EngineSnapshot = pickle.loads(snapshot_bytes)
+            if snapshot.plan_version != plan.plan_version():
+                span.add_error_event(
+                    f"snapshot plan version {snapshot.plan_version} "
+                    f"does not match {plan.plan_version()}"
+                )
+                return None, ""
+
+            variable_pool = plan.engine_ctx.variable_pool
+            for node_id, names in snapshot.node_status.items():
+                if node_id in plan.engine_ctx.node_run_status:
+                    plan.engine_ctx.node_run_status[node_id].load(names)
+            for key, value in snapshot.outputs.items():
+                if key in variable_pool.output_variable_mapping:
+                    variable_pool.output_variable_mapping[key]["value"] = value
+            for key, value in snapshot.end_inputs.items():
+                if key in variable_pool.input_variable_mapping:
+                    variable_pool.input_variable_mapping[key]["value"] = value
+            variable_pool.system_params.update(**snapshot.system_params)
+            variable_pool.chat_id = snapshot.chat_id
+            variable_pool.history_mapping = snapshot.history_mapping
+            variable_pool.history_v2 = snapshot.history_v2
+            plan.engine_ctx.responses = snapshot.responses
+            plan.engine_ctx.build_timestamp = snapshot.build_timestamp
+            return plan, snapshot.interrupt_node
+        except Exception as e:
+            # External exception caught, do not return to user
+            span.record_exception(e)
+            return None, ""
+
 
 class WorkflowEngineFactory:
     """
@@ -0,0 +1,45 @@
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from workflow.engine.entities.history import History
+from workflow.engine.nodes.entities.node_run_result import NodeRunResult
+
+
+class EngineSnapshot(BaseModel):
+    """
+    Mutable run state of a paused workflow engine.
+
+    The immutable plan (nodes, chains, dependencies and schemas) is not part of
+    the snapshot. It is referenced by ``plan_version`` and rebuilt from the
+    workflow DSL on resume, then the state recorded here is applied onto it.
+    """
+
+    # Digest of the workflow DSL the state was produced by
+    plan_version: str
+
+    # Build timestamp of the engine the snapshot was taken from
+    build_timestamp: int = 0
+
+    # Node ID mapped to the names of its status events that were set
+    node_status: Dict[str, List[str]] = Field(default_factory=dict)
+
+    # Output variable values of completed nodes, keyed by mapping key
+    outputs: Dict[str, Any] = Field(default_factory=dict)
+
+    # Input variable values of completed end nodes, keyed by mapping key
+    end_inputs: Dict[str, Any] = Field(default_factory=dict)
+
+    # Results of nodes that already ran
+    responses: List[NodeRunResult] = Field(default_factory=list)
+
+    # Node waiting for user input when the snapshot was taken
+    interrupt_node: str = ""
+
+    # System parameters of the run (uid, app, flow, credentials overlay, ...),
+    # keyed by parameter name
+    system_params: Dict[str, Any] = Field(default_factory=dict)
+
+    chat_id: str = ""
+    history_mapping: Dict[str, Any] = Field(default_factory=dict)
+    history_v2: Optional[History] = None
@@ -7,7 +7,14 @@ from workflow.configs import workflow_config
 from workflow.engine.entities.node_entities import NodeType
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.fastapi.lifespan.http_client import HttpClient
 from workflow.extensions.otlp.trace.span import Span
+from workflow.utils.cache import TTLCache
+
+# File URL -> Content-Length, shared by all requests of this worker
+_file_size_cache: TTLCache[str, str] = TTLCache(
+    ttl=workflow_config.file_config.check_cache_ttl, max_size=4096
+)
 
 
 class FileVarInfo:
@@ -111,27 +118,33 @@ class File(BaseModel):
         raise NotImplementedError
 
     @classmethod
-    def get_file_size(cls, input_file_url: str) -> str:
+    async def get_file_size(cls, input_file_url: str) -> str:
         """
         Get the size of a file from its URL.
 
+        Sizes are looked up with a HEAD request on the shared HTTP session and
+        cached per URL for a short period, since clients resend the same files
+        across conversation turns.
+
         :param input_file_url: URL of the file to check
         :return: File size in bytes as string
         """
+        cached_size = _file_size_cache.get(input_file_url)
+        if cached_size is not None:
+            return cached_size
         try:
-            # Send HEAD request
-            import requests  # type: ignore
-
-            response = requests.head(input_file_url)
-            # Get file metadata from response headers
-            content_length = response.headers.get(
-                "Content-Length"
-            )  # File size in bytes
+            session = HttpClient.get_session()
+            async with session.head(input_file_url) as response:
+                # Get file metadata from response headers
+                content_length = response.headers.get(
+                    "Content-Length"
+                )  # File size in bytes
             if not content_length:
                 raise CustomException(
                     err_code=CodeEnum.FILE_INVALID_TYPE_ERROR,
                     cause_error="File content is empty",
                 )
+            _file_size_cache.set(input_file_url, content_length)
             return content_length
         except CustomException as err:
             raise err
@@ -156,7 +169,7 @@ class File(BaseModel):
             await span_context.add_info_event_async(
                 f"allowed file type: {allowed_file_type}"
             )
-            file_size = int(cls.get_file_size(input_file_url))
+            file_size = int(await cls.get_file_size(input_file_url))
             pattern = workflow_config.file_config.get_extensions_pattern()
 
             file_extension = ""
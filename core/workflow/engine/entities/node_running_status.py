@@ -32,3 +32,31 @@ class NodeRunningStatus:
         self.processing = Event()
         self.complete = Event()
         self.not_run = Event()
+
+    def dump(self) -> list[str]:
+        """
+        Get the names of the status events that are set.
+
+        :return: Names of the set events
+        """
+        return [name for name in _STATUS_EVENTS if getattr(self, name).is_set()]
+
+    def load(self, names: list[str]) -> None:
+        """
+        Set the status events with the given names.
+
+        :param names: Names of the events to set, as returned by dump
+        """
+        for name in names:
+            if name in _STATUS_EVENTS:
+                getattr(self, name).set()
+
+
+# Status events recorded in engine snapshots
+_STATUS_EVENTS = (
+    "start_with_thread",
+    "pre_processing",
+    "processing",
+    "complete",
+    "not_run",
+)
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+
+from workflow.engine.entities.node_entities import NodeType
+
+# Node types whose model provider credentials are replaced by the run overlay
+CREDENTIAL_OVERLAY_NODE_TYPES = frozenset(
+    {
+        NodeType.LLM.value,
+        NodeType.DECISION_MAKING.value,
+        NodeType.PARAMETER_EXTRACTOR.value,
+        NodeType.AGENT.value,
+        NodeType.DATABASE.value,
+    }
+)
+
+
+class ProviderCredentials(BaseModel):
+    """
+    Model provider credentials used by a node for one workflow run.
+
+    Open API runs bill model calls to the calling application, so its
+    credentials are put into the variable pool as an overlay instead of being
+    written into the workflow DSL.
+
+    :param app_id: Application ID for model provider
+    :param api_key: API key for model provider
+    :param api_secret: API secret for model provider
+    """
+
+    app_id: str
+    api_key: str
+    api_secret: str
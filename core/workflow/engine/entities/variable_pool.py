@@ -168,6 +168,8 @@ class ParamKey(str, Enum):
     Uid = "uid"
     AppId = "app_id"
     Ext = "ext"
+    Credentials = "credentials"
+    GlobalVariables = "global_variables"
 
 
 class SystemParams:
@@ -228,6 +230,14 @@ class SystemParams:
             self._data[ParamKey(k)] = v
         return self
 
+    def dump(self) -> dict[str, Any]:
+        """
+        Export all system parameters.
+
+        :return: Parameter values keyed by parameter name, accepted by ``update``
+        """
+        return {key.value: value for key, value in self._data.items()}
+
 
 class VariablePool:
     """
@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Optional, Union, cast
 from loguru import logger
 from pydantic import BaseModel
 
+from workflow.configs import workflow_config
 from workflow.engine.callbacks.callback_handler import ChatCallBacks
 from workflow.engine.entities.chains import Chains
 from workflow.engine.entities.msg_or_end_dep_info import MsgOrEndDepInfo
@@ -24,7 +25,14 @@ from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.log_trace.workflow_log import WorkflowLog
 from workflow.extensions.otlp.trace.span import Span
-from workflow.service.history_service import add_history
+from workflow.service.history_service import add_history_async
+from workflow.utils.cache import TTLCache
+
+# Results of pure nodes keyed by a digest of their configuration and inputs
+_node_memo: TTLCache[str, NodeRunResult] = TTLCache(
+    ttl=workflow_config.node_memo_config.ttl,
+    max_size=workflow_config.node_memo_config.local_size,
+)
 
 
 class NodeParameterStrategy(ABC):
@@ -162,7 +170,7 @@ class NodeExecutionTemplate:
                 await span_context.add_info_events_async(
                     {"config": str(self.node.node_instance)}
                 )
-                result = await self.node.node_instance.async_execute(**parameters)
+                result = await self._execute_node_instance(parameters, span_context)
                 self.node.gather_node_event_log(result)
 
                 await self._handle_execution_result(result, span_context, **kwargs)
@@ -176,6 +184,35 @@ class NodeExecutionTemplate:
             finally:
                 self.node.node_log.set_end()
 
+    async def _execute_node_instance(
+        self, parameters: Dict[str, Any], span_context: Span
+    ) -> NodeRunResult:
+        """Run the node logic, reusing the memoized result of a pure node.
+
+        :param parameters: Execution parameters of the node
+        :param span_context: Tracing span context
+        :return: Node execution result
+        """
+        node_instance = self.node.node_instance
+        variable_pool = parameters.get("variable_pool")
+        memo_key = None
+        if (
+            _node_memo.ttl > 0
+            and isinstance(variable_pool, VariablePool)
+            and node_instance.is_memoizable()
+        ):
+            memo_key = node_instance.memo_key(variable_pool, span_context)
+        if memo_key:
+            cached = _node_memo.get(memo_key)
+            if cached is not None:
+                await span_context.add_info_events_async({"node_memo": "hit"})
+                return cached.model_copy(deep=True)
+
+        result = await node_instance.async_execute(**parameters)
+        if memo_key and result.status == WorkflowNodeExecutionStatus.SUCCEEDED:
+            _node_memo.set(memo_key, result.model_copy(deep=True))
+        return result
+
     def _build_execution_parameters(
         self, span_context: Span, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -275,7 +312,7 @@ class NodeExecutionTemplate:
         variable_pool = cast(VariablePool, kwargs.get("variable_pool"))
         callbacks = cast(ChatCallBacks, kwargs.get("callbacks"))
 
-        self._add_chat_history_if_needed(result, event_log_trace, variable_pool)
+        await self._add_chat_history_if_needed(result, event_log_trace, variable_pool)
         await self._add_variable_to_pool(result, variable_pool, span_context)
         await self._log_success_result(result, span_context)
         await self._handle_node_end_callback(result, callbacks)
@@ -283,7 +320,7 @@ class NodeExecutionTemplate:
         if event_log_trace:
             event_log_trace.add_node_log([self.node.node_log])
 
-    def _add_chat_history_if_needed(
+    async def _add_chat_history_if_needed(
         self,
         result: NodeRunResult,
         event_log_trace: WorkflowLog,
@@ -306,7 +343,7 @@ class NodeExecutionTemplate:
         ).nodeParam.get("enableChatHistory", False)
 
         if enable_chat_history_v1:
-            add_history(
+            await add_history_async(
                 flow_id=event_log_trace.flow_id,
                 node_id=result.node_id,
                 uid=event_log_trace.uid,
@@ -675,7 +712,8 @@ class NodeFactory:
 
         from workflow.engine.nodes.cache_node import tool_classes
 
-        node_class = tool_classes.get(node.get_node_type())
+        # Node classes take different constructor arguments
+        node_class: Any = tool_classes.get(node.get_node_type())
         if not node_class:
             raise CustomException(
                 CodeEnum.ENG_NODE_PROTOCOL_VALIDATE_ERROR,
@@ -13,6 +13,7 @@ from workflow.engine.callbacks.openai_types_sse import GenerateUsage
 from workflow.engine.entities.history import EnableChatHistoryV2
 from workflow.engine.entities.msg_or_end_dep_info import MsgOrEndDepInfo
 from workflow.engine.entities.private_config import PrivateConfig
+from workflow.engine.entities.provider_credentials import ProviderCredentials
 from workflow.engine.entities.variable_pool import VariablePool
 from workflow.engine.nodes.base_node import BaseNode
 from workflow.engine.nodes.entities.node_run_result import (
@@ -27,6 +28,7 @@ from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.iflytek_spark.schemas import StreamOutputMsg
+from workflow.infra.providers.llm.rate_scheduler import llm_scheduler, provider_key
 
 
 # Temporarily unused
@@ -215,14 +217,16 @@ class AgentNode(BaseNode):
 
         self._normalize_tools()
 
+        credentials = self.get_provider_credentials(variable_pool)
+
         # Construct request headers
         headers = {
             "Content-Type": "application/json",
-            "x-consumer-username": self.appId,
+            "x-consumer-username": credentials.app_id,
         }
 
         req_body = self._generate_agent_request(
-            reasoning_instruction, answer_instruction, messages, span
+            reasoning_instruction, answer_instruction, messages, credentials, span
         )
         await span.add_info_event_async(f"req header: {headers}")
         await span.add_info_event_async(f"req body: {req_body}")
@@ -247,19 +251,28 @@ class AgentNode(BaseNode):
                 total=30 * 60, sock_connect=30, sock_read=interval_timeout
             )
 
-            async with aiohttp.ClientSession(
-                timeout=timeout_config, read_bufsize=1024 * 1024  # 1MB high_water
-            ) as session:
-                async with session.post(
-                    url=f"{os.getenv('AGENT_BASE_URL')}/agent/v1/custom/chat/completions",
-                    headers=headers,
-                    json=req_body,
-                ) as response:
-                    content_list, reasoning_content_list, token_usage = (
-                        await self._process_stream_response(
-                            response, variable_pool, msg_or_end_node_deps, span
+            # The agent service calls the configured model, so the run counts
+            # against that model's provider budget
+            rate_limit_key = provider_key(
+                self.modelConfig.api,
+                self.modelConfig.domain,
+                credentials.app_id,
+                credentials.api_key,
+            )
+            async with llm_scheduler.slot(rate_limit_key, span.app_id):
+                async with aiohttp.ClientSession(
+                    timeout=timeout_config, read_bufsize=1024 * 1024  # 1MB high_water
+                ) as session:
+                    async with session.post(
+                        url=f"{os.getenv('AGENT_BASE_URL')}/agent/v1/custom/chat/completions",
+                        headers=headers,
+                        json=req_body,
+                    ) as response:
+                        content_list, reasoning_content_list, token_usage = (
+                            await self._process_stream_response(
+                                response, variable_pool, msg_or_end_node_deps, span
+                            )
                         )
-                    )
         except asyncio.TimeoutError as e:
             raise CustomException(
                 err_code=CodeEnum.AGENT_NODE_EXECUTION_ERROR,
@@ -384,6 +397,7 @@ class AgentNode(BaseNode):
         reasoning_instruction: str,
         answer_instruction: str,
         messages: List[Dict],
+        credentials: ProviderCredentials,
         span: Span,
     ) -> dict:
         """Generate request body for agent service call.
@@ -391,6 +405,7 @@ class AgentNode(BaseNode):
         :param reasoning_instruction: Processed reasoning instruction
         :param answer_instruction: Processed answer instruction
         :param messages: List of conversation messages
+        :param credentials: Model provider credentials for this run
         :param span: Tracing span for monitoring
         :return: Request body dictionary
         """
@@ -399,9 +414,9 @@ class AgentNode(BaseNode):
                 "domain": self.modelConfig.domain,
                 "api": self.modelConfig.api,
                 "api_key": (
-                    f"{self.apiKey}:{self.apiSecret}"
+                    f"{credentials.api_key}:{credentials.api_secret}"
                     if self.source == ModelProviderEnum.XINGHUO.value
-                    else self.apiKey
+                    else credentials.api_key
                 ),
             },
             "instruction": {
@@ -1,11 +1,24 @@
 import asyncio
 import base64
+import hashlib
 import json
 import os
 import time
 from abc import abstractmethod
 from asyncio import Event
-from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Tuple
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    cast,
+)
 
 from pydantic import BaseModel, Field, PrivateAttr
 
@@ -26,6 +39,10 @@ from workflow.engine.entities.node_entities import NodeType
 from workflow.engine.entities.node_running_status import NodeRunningStatus
 from workflow.engine.entities.output_mode import EndNodeOutputModeEnum
 from workflow.engine.entities.private_config import PrivateConfig
+from workflow.engine.entities.provider_credentials import (
+    CREDENTIAL_OVERLAY_NODE_TYPES,
+    ProviderCredentials,
+)
 from workflow.engine.entities.retry_config import RetryConfig
 from workflow.engine.entities.variable_pool import ParamKey, VariablePool
 from workflow.engine.nodes.entities.node_run_result import (
@@ -54,7 +71,9 @@ from workflow.infra.providers.llm.iflytek_spark.schemas import (
     SparkAiMessage,
     StreamOutputMsg,
 )
+from workflow.infra.providers.llm.rate_scheduler import llm_scheduler
 from workflow.infra.providers.llm.types import SystemUserMsg
+from workflow.utils.replay import stream_interaction
 
 
 class BaseNode(BaseModel):
@@ -73,8 +92,13 @@ class BaseNode(BaseModel):
     :param stream_node_first_token: Event to track if streaming node has sent first token
     :param remarkVisible: Whether the remark is visible in UI
     :param remark: Additional remarks or notes for the node
+    :param enableMemoization: Whether the engine may reuse outputs of a pure node
     """
 
+    # Whether the node output depends only on its resolved inputs and its
+    # configuration, letting the engine memoize it
+    pure: ClassVar[bool] = False
+
     input_identifier: List[Any]
     output_identifier: List[Any]
     node_type: str = ""
@@ -87,10 +111,57 @@ class BaseNode(BaseModel):
     )  # Event to track if streaming node has sent first token
     remarkVisible: bool = False
     remark: str = ""
+    enableMemoization: bool = True
 
     class Config:
         arbitrary_types_allowed = True
 
+    def is_memoizable(self) -> bool:
+        """
+        Check whether the engine may reuse outputs of this node.
+
+        :return: True if the node is pure and memoization is not disabled
+        """
+        return self.pure and self.enableMemoization
+
+    def input_names(self) -> List[str]:
+        """
+        List the names of the variables this node reads.
+
+        :return: Input variable names
+        """
+        return list(self.input_identifier)
+
+    def memo_key(self, variable_pool: VariablePool, span: Span) -> Optional[str]:
+        """
+        Derive the memoization key of this node for the current inputs.
+
+        :param variable_pool: Pool containing variables and their values
+        :param span: Tracing span for monitoring and debugging
+        :return: Digest of the node configuration and resolved inputs, or None
+                 if the inputs cannot be resolved or serialized
+        """
+        try:
+            inputs = {
+                key: variable_pool.get_variable(
+                    node_id=self.node_id, key_name=key, span=span
+                )
+                for key in self.input_names()
+            }
+            content = json.dumps(
+                {
+                    "config": self.model_dump(
+                        mode="json", exclude={"stream_node_first_token"}
+                    ),
+                    "inputs": inputs,
+                },
+                sort_keys=True,
+                ensure_ascii=False,
+            )
+        except Exception:
+            return None
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
     @abstractmethod
     async def async_execute(
         self,
@@ -114,6 +185,33 @@ class BaseNode(BaseModel):
         """
         raise NotImplementedError
 
+    def get_provider_credentials(
+        self, variable_pool: VariablePool
+    ) -> ProviderCredentials:
+        """
+        Get the model provider credentials this node uses for the current run.
+
+        The run's credential overlay takes precedence over the credentials in
+        the node DSL, except for nodes backed by OpenAI-compatible providers,
+        which keep their own keys.
+
+        :param variable_pool: Pool containing variables and system parameters
+        :return: Credentials for building provider requests
+        """
+        credentials = variable_pool.system_params.get(ParamKey.Credentials)
+        if (
+            credentials is not None
+            and self.node_id.split(":")[0] in CREDENTIAL_OVERLAY_NODE_TYPES
+            and getattr(self, "source", ModelProviderEnum.XINGHUO.value)
+            != ModelProviderEnum.OPENAI.value
+        ):
+            return credentials
+        return ProviderCredentials(
+            app_id=getattr(self, "appId", ""),
+            api_key=getattr(self, "apiKey", ""),
+            api_secret=getattr(self, "apiSecret", ""),
+        )
+
     async def put_stream_content(
         self,
         node_id: str,
@@ -1060,15 +1158,23 @@ class BaseLLMNode(BaseNode):
     searchDisable: bool = Field(default=True)
     extraParams: dict = Field(default_factory=dict)
 
-    def _get_chat_ai(self, uid: str = "") -> ChatAI:
+    def _get_chat_ai(
+        self, uid: str = "", credentials: Optional[ProviderCredentials] = None
+    ) -> ChatAI:
         """
         Get or create the ChatAI instance for this LLM node.
 
         This method initializes the ChatAI instance using the ChatAIFactory
         with the node's configuration parameters.
 
+        :param uid: User identifier
+        :param credentials: Provider credentials, the node's own if omitted
         :return: ChatAI instance configured for this node
         """
+        if credentials is None:
+            credentials = ProviderCredentials(
+                app_id=self.appId, api_key=self.apiKey, api_secret=self.apiSecret
+            )
 
         return ChatAIFactory.get_chat_ai(
             model_source=(
@@ -1080,9 +1186,9 @@ class BaseLLMNode(BaseNode):
             model_name=self.domain,
             spark_version="",
             temperature=self.temperature if hasattr(self, "temperature") else None,
-            app_id=self.appId,
-            api_key=self.apiKey,
-            api_secret=self.apiSecret,
+            app_id=credentials.app_id,
+            api_key=credentials.api_key,
+            api_secret=credentials.api_secret,
             max_tokens=self.maxTokens if hasattr(self, "maxTokens") else None,
             top_k=self.topK if hasattr(self, "topK") else None,
             patch_id=self.patch_id,
@@ -1231,6 +1337,7 @@ class BaseLLMNode(BaseNode):
         image_url: str = "",
         stream: bool = False,
         event_log_node_trace: NodeLog | None = None,
+        stop_when: Callable[[str], bool] | None = None,
     ) -> Tuple[dict, str, str, list]:
         """
         Chat with the LLM and process the response.
@@ -1249,10 +1356,14 @@ class BaseLLMNode(BaseNode):
         :param image_url: URL of image to include
         :param stream: Whether to enable streaming mode
         :param event_log_node_trace: Node trace logging
+        :param stop_when: Optional predicate called with each newly received
+                          chunk of text; once it returns True the rest of the
+                          generation is aborted
         :return: Tuple containing (token_usage, response_text, reasoning_content, processed_history)
         """
         chat_ai = self._get_chat_ai(
-            uid=variable_pool.system_params.get(ParamKey.Uid, default="")
+            uid=variable_pool.system_params.get(ParamKey.Uid, default=""),
+            credentials=self.get_provider_credentials(variable_pool),
         )
         system_user_msg = await self._process_history(
             user_input=prompt_template,
@@ -1272,20 +1383,30 @@ class BaseLLMNode(BaseNode):
         think_contents = None
         token_usage = {}
         processed_history = system_user_msg.processed_history
-        try:
-            async for llm_response in chat_ai.achat(
-                user_message=user_message,
-                event_log_node_trace=event_log_node_trace,
-                span=span,
-                flow_id=flow_id,
-                extra_params=self.extraParams,
-                timeout=(
-                    self.retry_config.timeout
-                    if self.retry_config.should_retry
-                    else self._private_config.timeout
+        # Wait for the provider's budget; retries of a throttled call queue here
+        # behind the provider cooldown instead of failing again right away
+        async with llm_scheduler.slot(
+            chat_ai.rate_limit_key(),
+            variable_pool.system_params.get(ParamKey.AppId, default=""),
+        ):
+            llm_stream = stream_interaction(
+                "llm",
+                self.node_id,
+                lambda: chat_ai.achat(
+                    user_message=user_message,
+                    event_log_node_trace=event_log_node_trace,
+                    span=span,
+                    flow_id=flow_id,
+                    extra_params=self.extraParams,
+                    timeout=(
+                        self.retry_config.timeout
+                        if self.retry_config.should_retry
+                        else self._private_config.timeout
+                    ),
+                    search_disable=self.searchDisable,
                 ),
-                search_disable=self.searchDisable,
-            ):
+            )
+            async for llm_response in llm_stream:
                 msg = llm_response.msg
                 status, content, reasoning_content, token_usage = (
                     self._get_chat_ai().decode_message(msg)
@@ -1304,24 +1425,15 @@ class BaseLLMNode(BaseNode):
                         llm_content=msg,
                     )
                 texts.append(content if content else "")
+                if await self._stop_early(stop_when, content, llm_stream, span):
+                    break
                 if status in [
                     SparkLLMStatus.END.value,
                     ChatStatus.FINISH_REASON.value,
                 ]:
                     token_usage = token_usage
                     break
-                if (
-                    self.source == ModelProviderEnum.OPENAI.value
-                    and status
-                    and status
-                    not in [
-                        SparkLLMStatus.END.value,
-                        ChatStatus.FINISH_REASON.value,
-                    ]
-                ):
-                    # Exception case: finish_reason has value but not "stop", report the issue
-                    # For example, openai-gpt-4o gives "length" when max_token is very small
-                    raise CustomException(err_code=CodeEnum.OPEN_AI_REQUEST_ERROR)
+                self._check_finish_status(status)
 
             if texts:
                 res = "".join(texts)
@@ -1340,8 +1452,50 @@ class BaseLLMNode(BaseNode):
                     err_msg="LLM returned empty result",
                     cause_error="LLM returned empty result",
                 )
-        except Exception as e:
-            raise e
+
+    def _check_finish_status(self, status: Any) -> None:
+        """
+        Reject OpenAI responses that finished for a reason other than "stop".
+
+        :param status: Status decoded from the LLM response
+        :raises CustomException: If the generation finished abnormally
+        """
+        if (
+            self.source == ModelProviderEnum.OPENAI.value
+            and status
+            and status
+            not in [
+                SparkLLMStatus.END.value,
+                ChatStatus.FINISH_REASON.value,
+            ]
+        ):
+            # Exception case: finish_reason has value but not "stop", report the issue
+            # For example, openai-gpt-4o gives "length" when max_token is very small
+            raise CustomException(err_code=CodeEnum.OPEN_AI_REQUEST_ERROR)
+
+    @staticmethod
+    async def _stop_early(
+        stop_when: Callable[[str], bool] | None,
+        content: str,
+        llm_stream: AsyncIterator[Any],
+        span: Span,
+    ) -> bool:
+        """
+        Abort the LLM stream once the caller has what it needs.
+
+        :param stop_when: Optional predicate on each newly received chunk
+        :param content: Newly received chunk of text
+        :param llm_stream: Stream of LLM responses
+        :param span: Tracing span for monitoring
+        :return: True if the stream was aborted
+        """
+        if stop_when is None or not content or not stop_when(content):
+            return False
+        await span.add_info_event_async(
+            "Result determined, aborting the rest of the generation"
+        )
+        await cast(AsyncGenerator, llm_stream).aclose()
+        return True
 
     async def put_llm_content(
         self,
@@ -7,61 +7,139 @@ node type identifiers to their respective node classes for dynamic instantiation
 
 The registry includes all supported node types in the workflow engine, from basic
 nodes like start/end to complex nodes like LLM, decision-making, and iteration nodes.
+Node modules are only imported when their node type is first looked up, so a
+worker does not load the dependencies of node types its flows never use.
 """
 
-from workflow.engine.nodes.agent.agent_node import AgentNode
-from workflow.engine.nodes.code.code_node import CodeNode
-from workflow.engine.nodes.decision.decision_node import DecisionNode
-from workflow.engine.nodes.end.end_node import EndNode
-from workflow.engine.nodes.flow.flow_node import FlowNode
-from workflow.engine.nodes.global_variables.global_variables_node import (
-    GlobalVariablesNode,
-)
-from workflow.engine.nodes.if_else.if_else_node import IFElseNode
-from workflow.engine.nodes.iteration.iteration_node import (
-    IterationEndNode,
-    IterationNode,
-    IterationStartNode,
-)
-from workflow.engine.nodes.knowledge.knowledge_node import KnowledgeNode
-from workflow.engine.nodes.knowledge_pro.knowledge_pro_node import KnowledgeProNode
-from workflow.engine.nodes.llm.spark_llm_node import SparkLLMNode
-from workflow.engine.nodes.mcp.mcp_node import MCPNode
-from workflow.engine.nodes.message.message_node import MessageNode
-from workflow.engine.nodes.params_extractor.pe_node import ParamsExtractorNode
-from workflow.engine.nodes.pgsql.pgsql_node import PGSqlNode
-from workflow.engine.nodes.plugin_tool.plugin_node import PluginNode
-from workflow.engine.nodes.question_answer.question_answer_node import (
-    QuestionAnswerNode,
-)
-from workflow.engine.nodes.rpa.rpa_node import RPANode
-from workflow.engine.nodes.start.start_node import StartNode
-from workflow.engine.nodes.text_joiner.text_joiner_node import TextJoinerNode
-
-# TODO: Implement automatic loading mechanism for dynamic node discovery
-# Registry mapping node types to their corresponding node classes
-# This dictionary serves as a factory registry for creating node instances
-tool_classes = {
-    "ifly-code": CodeNode,  # Code execution node for running custom code
-    "node-start": StartNode,  # Workflow start node that initiates execution
-    "node-end": EndNode,  # Workflow end node that terminates execution
-    "plugin": PluginNode,  # Plugin tool node for external integrations
-    "knowledge-base": KnowledgeNode,  # Knowledge base node for information retrieval
-    "knowledge-pro-base": KnowledgeProNode,  # Professional knowledge base node with advanced features
-    "extractor-parameter": ParamsExtractorNode,  # Parameter extraction node for data parsing
-    "spark-llm": SparkLLMNode,  # Spark LLM node for language model interactions
-    "decision-making": DecisionNode,  # Decision making node for conditional logic
-    "if-else": IFElseNode,  # Conditional branching node for flow control
-    "message": MessageNode,  # Message output node for displaying results
-    "iteration": IterationNode,  # Iteration node for loop operations
-    "iteration-node-start": IterationStartNode,  # Iteration start node for loop initialization
-    "iteration-node-end": IterationEndNode,  # Iteration end node for loop termination
-    "text-joiner": TextJoinerNode,  # Text joining node for content concatenation
-    "node-variable": GlobalVariablesNode,  # Global variables node for state management
-    "flow": FlowNode,  # Sub-flow node for nested workflow execution
-    "agent": AgentNode,  # Agent node for autonomous task execution
-    "question-answer": QuestionAnswerNode,  # Question-answer node for Q&A processing
-    "database": PGSqlNode,  # PostgreSQL database node for data operations
-    "rpa": RPANode,
-    "mcp": MCPNode,
+import importlib
+import threading
+from typing import Dict, Iterable, Iterator, Mapping, Optional, Tuple, Type
+
+from workflow.engine.nodes.base_node import BaseNode
+
+# Registry mapping node types to the module and class implementing them
+node_modules: Dict[str, Tuple[str, str]] = {
+    # Code execution node for running custom code
+    "ifly-code": ("workflow.engine.nodes.code.code_node", "CodeNode"),
+    # Workflow start node that initiates execution
+    "node-start": ("workflow.engine.nodes.start.start_node", "StartNode"),
+    # Workflow end node that terminates execution
+    "node-end": ("workflow.engine.nodes.end.end_node", "EndNode"),
+    # Plugin tool node for external integrations
+    "plugin": ("workflow.engine.nodes.plugin_tool.plugin_node", "PluginNode"),
+    # Knowledge base node for information retrieval
+    "knowledge-base": (
+        "workflow.engine.nodes.knowledge.knowledge_node",
+        "KnowledgeNode",
+    ),
+    # Professional knowledge base node with advanced features
+    "knowledge-pro-base": (
+        "workflow.engine.nodes.knowledge_pro.knowledge_pro_node",
+        "KnowledgeProNode",
+    ),
+    # Parameter extraction node for data parsing
+    "extractor-parameter": (
+        "workflow.engine.nodes.params_extractor.pe_node",
+        "ParamsExtractorNode",
+    ),
+    # Spark LLM node for language model interactions
+    "spark-llm": ("workflow.engine.nodes.llm.spark_llm_node", "SparkLLMNode"),
+    # Decision making node for conditional logic
+    "decision-making": (
+        "workflow.engine.nodes.decision.decision_node",
+        "DecisionNode",
+    ),
+    # Conditional branching node for flow control
+    "if-else": ("workflow.engine.nodes.if_else.if_else_node", "IFElseNode"),
+    # Message output node for displaying results
+    "message": ("workflow.engine.nodes.message.message_node", "MessageNode"),
+    # Iteration node for loop operations
+    "iteration": ("workflow.engine.nodes.iteration.iteration_node", "IterationNode"),
+    # Iteration start node for loop initialization
+    "iteration-node-start": (
+        "workflow.engine.nodes.iteration.iteration_node",
+        "IterationStartNode",
+    ),
+    # Iteration end node for loop termination
+    "iteration-node-end": (
+        "workflow.engine.nodes.iteration.iteration_node",
+        "IterationEndNode",
+    ),
+    # Text joining node for content concatenation
+    "text-joiner": (
+        "workflow.engine.nodes.text_joiner.text_joiner_node",
+        "TextJoinerNode",
+    ),
+    # Global variables node for state management
+    "node-variable": (
+        "workflow.engine.nodes.global_variables.global_variables_node",
+        "GlobalVariablesNode",
+    ),
+    # Sub-flow node for nested workflow execution
+    "flow": ("workflow.engine.nodes.flow.flow_node", "FlowNode"),
+    # Agent node for autonomous task execution
+    "agent": ("workflow.engine.nodes.agent.agent_node", "AgentNode"),
+    # Question-answer node for Q&A processing
+    "question-answer": (
+        "workflow.engine.nodes.question_answer.question_answer_node",
+        "QuestionAnswerNode",
+    ),
+    # PostgreSQL database node for data operations
+    "database": ("workflow.engine.nodes.pgsql.pgsql_node", "PGSqlNode"),
+    "rpa": ("workflow.engine.nodes.rpa.rpa_node", "RPANode"),
+    "mcp": ("workflow.engine.nodes.mcp.mcp_node", "MCPNode"),
 }
+
+
+class LazyNodeRegistry(Mapping[str, Type[BaseNode]]):
+    """
+    Read-only mapping from node type to node class that imports on first use.
+    """
+
+    def __init__(self, modules: Dict[str, Tuple[str, str]]) -> None:
+        """
+        Initialize the registry.
+
+        :param modules: Node type mapped to (module path, class name)
+        """
+        self._modules = modules
+        self._classes: Dict[str, Type[BaseNode]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, node_type: str) -> Type[BaseNode]:
+        node_class = self._classes.get(node_type)
+        if node_class is not None:
+            return node_class
+        module_path, class_name = self._modules[node_type]
+        # Engines are also built in worker threads, import each module once
+        with self._lock:
+            node_class = self._classes.get(node_type)
+            if node_class is None:
+                module = importlib.import_module(module_path)
+                node_class = getattr(module, class_name)
+                self._classes[node_type] = node_class
+        return node_class
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules)
+
+    def __contains__(self, node_type: object) -> bool:
+        return node_type in self._modules
+
+    def preload(self, node_types: Optional[Iterable[str]] = None) -> None:
+        """
+        Import the modules of the given node types ahead of their first use.
+
+        :param node_types: Node types to import, all registered types if None;
+                           unknown types are ignored
+        """
+        for node_type in self._modules if node_types is None else node_types:
+            if node_type in self._modules:
+                self[node_type]
+
+
+# Factory registry for creating node instances
+tool_classes = LazyNodeRegistry(node_modules)
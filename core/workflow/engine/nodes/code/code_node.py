@@ -46,6 +46,20 @@ class CodeNode(BaseNode):
     code: str = Field(..., description="Code")
     appId: str = Field(..., description="App ID")
     uid: str = Field(..., description="User ID")
+    deterministic: bool = Field(
+        default=False, description="Whether the code output depends only on its inputs"
+    )
+
+    def is_memoizable(self) -> bool:
+        """
+        Check whether the engine may reuse outputs of this node.
+
+        User code may read the clock, randomness or remote services, so it is
+        only memoized when marked deterministic.
+
+        :return: True if the code is deterministic and memoization is not disabled
+        """
+        return self.deterministic and self.enableMemoization
 
     async def _get_actual_parameter(
         self, variable_pool: VariablePool, span_context: Span
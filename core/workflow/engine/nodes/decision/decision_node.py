@@ -2,12 +2,13 @@ import copy
 import json
 import re
 import time
-from typing import Any, Dict, cast
+from typing import Any, Callable, Dict, Optional, cast
 
 from jsonschema import ValidationError, validate  # type: ignore
 from loguru import logger
 from pydantic import BaseModel, Field
 
+from workflow.configs import workflow_config
 from workflow.engine.callbacks.callback_handler import ChatCallBacks
 from workflow.engine.callbacks.openai_types_sse import GenerateUsage
 from workflow.engine.entities.history import History
@@ -69,6 +70,93 @@ def _custom_parser(multiline_string: str) -> str:
     return multiline_string
 
 
+def _find_string_field(text: str, field: str) -> Optional[str]:
+    """
+    Find a completed string field in partially streamed JSON output.
+
+    The value is only returned once its closing quote has been received, so it
+    can no longer change as more output arrives.
+
+    :param text: JSON output received so far
+    :param field: Field name to look for
+    :return: The decoded field value, or None if it is not complete yet
+    """
+    match = re.search(rf'"{field}"\s*:\s*"((?:[^"\\]|\\.)*)"', text)
+    if match is None:
+        return None
+    try:
+        return cast(str, json.loads(f'"{match.group(1)}"'))
+    except ValueError:
+        return None
+
+
+def _stop_on_field(field: str) -> Optional[Callable[[str], bool]]:
+    """
+    Build an early-exit predicate for decisions carried by a single JSON field.
+
+    :param field: Field holding the decision
+    :return: Predicate for the LLM stream, or None if early exit is disabled
+    """
+    if not workflow_config.decision_node_config.early_exit:
+        return None
+    return _FieldWatcher(field)
+
+
+class _FieldWatcher:
+    """
+    Early-exit predicate fed with each streamed chunk of JSON output.
+
+    Until the field name has been seen only the last few characters are kept,
+    and afterwards only the text from the field name on, so each chunk costs
+    time proportional to the field rather than to the whole output.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self.key = f'"{field}"'
+        self.text = ""
+        self.key_found = False
+
+    def __call__(self, chunk: str) -> bool:
+        """
+        Take a newly received chunk of output.
+
+        :param chunk: Newly received output
+        :return: True once the field value is complete
+        """
+        self.text += chunk
+        if not self.key_found:
+            key_pos = self.text.find(self.key)
+            if key_pos < 0:
+                # Keep enough text to find a name split across chunks
+                self.text = self.text[-len(self.key) :]
+                return False
+            self.text = self.text[key_pos:]
+            self.key_found = True
+        return _find_string_field(self.text, self.field) is not None
+
+
+def _parse_decision(res: str, json_str: str, field: str) -> dict:
+    """
+    Parse the decision JSON returned by the LLM.
+
+    Output that was cut short after the decision field had been streamed
+    falls back to that single field.
+
+    :param res: Raw LLM output
+    :param json_str: Extracted and sanitized JSON string
+    :param field: Field holding the decision
+    :return: Parsed decision object
+    """
+    try:
+        return cast(dict, json.loads(json_str))
+    except ValueError:
+        value = _find_string_field(res, field)
+        if value is None:
+            raise
+        return {field: value}
+
+
 class IntentChain(BaseModel):
     """
     Intent chain.
@@ -158,14 +246,15 @@ class DecisionNode(BaseLLMNode):
             span=span,
         )
         # Initialize Spark Function Call AI client
+        credentials = self.get_provider_credentials(variable_pool)
         fc_ai = SparkFunctionCallAi(
             model_url=self.url,
             model_name=self.domain,
             spark_version="",
             temperature=self.temperature,
-            app_id=self.appId,
-            api_key=self.apiKey,
-            api_secret=self.apiSecret,
+            app_id=credentials.app_id,
+            api_key=credentials.api_key,
+            api_secret=credentials.api_secret,
             max_tokens=self.maxTokens,
             top_k=self.topK,
             patch_id=self.patch_id,
@@ -372,6 +461,7 @@ class DecisionNode(BaseLLMNode):
                 prompt_template=user_input_template,
                 variable_pool=variable_pool,
                 event_log_node_trace=event_log_node_trace,
+                stop_when=_stop_on_field("category_name"),
             )
             # Attach processed chat history to inputs for front-end debugging
             if processed_history:
@@ -383,7 +473,7 @@ class DecisionNode(BaseLLMNode):
             json_str = res if match is None else match.group(2)
             json_str = _custom_parser(json_str.strip())
             await span.add_info_event_async(f"json_str: {json_str}")
-            result = json.loads(json_str)
+            result = _parse_decision(res, json_str, "category_name")
 
             schema = {
                 "type": "object",
@@ -537,6 +627,7 @@ class DecisionNode(BaseLLMNode):
                 prompt_template=user_input_template,
                 variable_pool=variable_pool,
                 event_log_node_trace=event_log_node_trace,
+                stop_when=_stop_on_field("destination"),
             )
             # Attach processed chat history to inputs for front-end debugging
             if processed_history:
@@ -548,7 +639,7 @@ class DecisionNode(BaseLLMNode):
             json_str = res if match is None else match.group(2)
             json_str = json_str.strip()
             json_str = _custom_parser(json_str)
-            result = json.loads(json_str)
+            result = _parse_decision(res, json_str, "destination")
 
             schema = {
                 "type": "object",
@@ -8,6 +8,7 @@ from typing import Any, Dict, Optional, Tuple
 import aiohttp
 from aiohttp import ClientTimeout
 from pydantic import Field
+from sqlmodel import select
 
 from workflow.consts.engine.chat_status import ChatStatus
 from workflow.consts.runtime_env import RuntimeEnv
@@ -26,8 +27,7 @@ from workflow.engine.nodes.entities.node_run_result import (
 )
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
-from workflow.extensions.middleware.database.utils import session_getter
-from workflow.extensions.middleware.getters import get_db_service
+from workflow.extensions.middleware.getters import get_async_session
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 
@@ -365,9 +365,10 @@ class FlowNode(BaseNode):
             )
 
         # Query application credentials from database
-        with session_getter(get_db_service()) as session:
+        async with get_async_session() as session:
             start_time = time.time() * 1000
-            app = session.query(App).filter_by(alias_id=self.appId).first()
+            result = await session.exec(select(App).where(App.alias_id == self.appId))
+            app = result.first()
 
             # Log database query performance
             await span.add_info_events_async(
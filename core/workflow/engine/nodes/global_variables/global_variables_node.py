@@ -8,10 +8,11 @@ that extends BaseNode to handle global variable operations (set/get) in workflow
 
 import asyncio
 import json
-from typing import Any, Literal
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import Field
 
+from workflow.configs import workflow_config
 from workflow.engine.entities.variable_pool import ParamKey, VariablePool
 from workflow.engine.nodes.base_node import BaseNode
 from workflow.engine.nodes.entities.node_run_result import (
@@ -23,6 +24,7 @@ from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.middleware.getters import get_cache_service
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
+from workflow.utils.replay import interaction
 
 # Cache expiration time for parameters (7 days in seconds)
 PARAMETER_EXPIRE_TIME_S = 60 * 60 * 24 * 7
@@ -68,10 +70,7 @@ class VariablesManage:
         :param variable_name: Name of the variable to store
         :param value: Value to store for the variable
         """
-        if self.chat_id is None:
-            name = f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}"
-        else:
-            name = f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}:{self.chat_id}"
+        name = self._hash_name()
         cache_service = get_cache_service()
         # Store variable with no expiration (previously used PARAMETER_EXPIRE_TIME_S)
         cache_service.hash_set_ex(name, variable_name, value, None)
@@ -83,36 +82,56 @@ class VariablesManage:
         :param variable_name: Name of the variable to retrieve
         :return: The value of the variable, or None if not found
         """
-        if self.chat_id is None:
-            name = f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}"
-        else:
-            name = f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}:{self.chat_id}"
+        name = self._hash_name()
         cache_service = get_cache_service()
         return cache_service.hash_get(name, variable_name)
 
+    def add_variables(self, variables: Dict[str, Any]) -> None:
+        """
+        Add several global variables to the cache in one round trip.
+
+        :param variables: Variable names and the values to store
+        """
+        cache_service = get_cache_service()
+        cache_service.hash_set_many(self._hash_name(), variables, None)
+
+    def get_variables(self, variable_names: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve several global variables from the cache in one round trip.
+
+        :param variable_names: Names of the variables to retrieve
+        :return: Dictionary of the variables that were found and their values
+        """
+        cache_service = get_cache_service()
+        return cache_service.hash_get_many(self._hash_name(), variable_names)
+
     def get_all_variables(self) -> dict:
         """
         Retrieve all global variables from the cache.
 
         :return: Dictionary containing all variables and their values
         """
-        if self.chat_id is None:
-            name = f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}"
-        else:
-            name = f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}:{self.chat_id}"
+        name = self._hash_name()
         cache_service = get_cache_service()
         return cache_service.hash_get_all(name)
 
+    def _hash_name(self) -> str:
+        """
+        Build the Redis hash name holding the variables of this context.
+
+        :return: Redis hash name
+        """
+        if self.chat_id is None:
+            return f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}"
+        return f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}:{self.chat_id}"
+
     def clear(self) -> None:
         """
         Clear all global variables from the cache.
 
         :return: Result of the cache deletion operation
         """
-        if self.chat_id is None:
-            name = f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}"
-        else:
-            name = f"{VARIABLE_POOL_PREFIX}:{self.flow_id}:{self.uid}:{self.app_id}:{self.chat_id}"
+        name = self._hash_name()
         cache_service = get_cache_service()
         return cache_service.delete(name)
 
@@ -174,35 +193,16 @@ class GlobalVariablesNode(BaseNode):
                 app_id=app_id,
                 chat_id=chat_id,
             )
+            run_cache = self._get_run_cache(variable_pool)
             # Handle 'set' operation: store input variables as global variables
             if self.method == "set":
-                for key in self.input_identifier:
-                    inputs[key] = variable_pool.get_variable(
-                        node_id=self.node_id, key_name=key, span=span
-                    )
-                    await asyncio.to_thread(var_manager.add_variable, key, inputs[key])
-                await span.add_info_events_async(
-                    {"set": json.dumps(inputs, ensure_ascii=False)}
+                inputs = await self._set_variables(
+                    variable_pool, var_manager, redis_key, run_cache, span
                 )
-
             # Handle 'get' operation: retrieve global variables
             elif self.method == "get":
-                global_vars = await asyncio.to_thread(var_manager.get_all_variables)
-                for key in self.output_identifier:
-                    if key in global_vars:
-                        # Use global variable if available
-                        outputs.update({key: global_vars.get(key)})
-                    else:
-                        # Fallback to local variable pool if global variable not found
-                        outputs.update(
-                            {
-                                key: variable_pool.get_variable(
-                                    node_id=self.node_id, key_name=key, span=span
-                                )
-                            }
-                        )
-                await span.add_info_events_async(
-                    {"get": json.dumps(outputs, ensure_ascii=False)}
+                outputs = await self._get_variables(
+                    variable_pool, var_manager, redis_key, run_cache, span
                 )
             # Order outputs according to output_identifier sequence
             order_outputs = {}
@@ -241,3 +241,100 @@ class GlobalVariablesNode(BaseNode):
                 alias_name=self.alias_name,
                 node_type=self.node_type,
             )
+
+    async def _set_variables(
+        self,
+        variable_pool: VariablePool,
+        var_manager: VariablesManage,
+        redis_key: Dict[str, str],
+        run_cache: Optional[Dict[str, Any]],
+        span: Span,
+    ) -> Dict[str, Any]:
+        """
+        Store the node inputs as global variables.
+
+        :param variable_pool: Variable pool containing workflow variables
+        :param var_manager: Variable manager of the run context
+        :param redis_key: Components of the Redis key, for tracing and replay
+        :param run_cache: Run-scoped variable cache, None if disabled
+        :param span: Tracing span for monitoring and logging
+        :return: The stored variables
+        """
+        inputs: Dict[str, Any] = {}
+        for key in self.input_identifier:
+            inputs[key] = variable_pool.get_variable(
+                node_id=self.node_id, key_name=key, span=span
+            )
+        if inputs:
+            await interaction(
+                "redis",
+                ("add_variables", redis_key, inputs),
+                lambda: asyncio.to_thread(var_manager.add_variables, inputs),
+            )
+        if run_cache is not None:
+            run_cache.update(inputs)
+        await span.add_info_events_async(
+            {"set": json.dumps(inputs, ensure_ascii=False)}
+        )
+        return inputs
+
+    async def _get_variables(
+        self,
+        variable_pool: VariablePool,
+        var_manager: VariablesManage,
+        redis_key: Dict[str, str],
+        run_cache: Optional[Dict[str, Any]],
+        span: Span,
+    ) -> Dict[str, Any]:
+        """
+        Read the node outputs from global variables, falling back to the
+        variable pool for variables that were never set.
+
+        :param variable_pool: Variable pool containing workflow variables
+        :param var_manager: Variable manager of the run context
+        :param redis_key: Components of the Redis key, for tracing and replay
+        :param run_cache: Run-scoped variable cache, None if disabled
+        :param span: Tracing span for monitoring and logging
+        :return: The output values
+        """
+        global_vars = dict(run_cache) if run_cache is not None else {}
+        missing = [key for key in self.output_identifier if key not in global_vars]
+        if missing:
+            fetched = await interaction(
+                "redis",
+                ("get_variables", redis_key, missing),
+                lambda: asyncio.to_thread(var_manager.get_variables, missing),
+            )
+            global_vars.update(fetched)
+            if run_cache is not None:
+                run_cache.update(fetched)
+        outputs: Dict[str, Any] = {}
+        for key in self.output_identifier:
+            if key in global_vars:
+                # Use global variable if available
+                outputs[key] = global_vars.get(key)
+            else:
+                # Fallback to local variable pool if global variable not found
+                outputs[key] = variable_pool.get_variable(
+                    node_id=self.node_id, key_name=key, span=span
+                )
+        await span.add_info_events_async(
+            {"get": json.dumps(outputs, ensure_ascii=False)}
+        )
+        return outputs
+
+    @staticmethod
+    def _get_run_cache(variable_pool: VariablePool) -> Optional[Dict[str, Any]]:
+        """
+        Get the global variables already read or written in this run.
+
+        :param variable_pool: Variable pool of the current run
+        :return: Run-scoped variable cache, or None if run caching is disabled
+        """
+        if not workflow_config.global_variable_config.run_cache:
+            return None
+        run_cache = variable_pool.system_params.get(ParamKey.GlobalVariables)
+        if run_cache is None:
+            run_cache = {}
+            variable_pool.system_params.set(ParamKey.GlobalVariables, run_cache)
+        return run_cache
@@ -1,6 +1,6 @@
 import json
 import re
-from typing import Any, List, Literal
+from typing import Any, ClassVar, List, Literal
 
 from pydantic import BaseModel, Field
 
@@ -80,8 +80,27 @@ class IFElseNode(BaseNode):
     operators for strings, numbers, and collections.
     """
 
+    pure: ClassVar[bool] = True
+
     cases: List[IfElseNodeData] = Field(min_length=2)
 
+    def input_names(self) -> List[str]:
+        """
+        List the names of the variables the conditions compare.
+
+        The input identifier of an if-else node holds a single mapping from
+        condition variable indexes to variable names.
+
+        :return: Input variable names
+        """
+        names = {
+            name
+            for identifier in self.input_identifier
+            for name in identifier.values()
+            if name
+        }
+        return sorted(names)
+
     async def do_one_branch(
         self,
         variable_pool: VariablePool,
@@ -32,6 +32,8 @@ class IterationNode(BaseNode):
 
     # Node ID of the first node in the workflow subgraph within this iteration
     IterationStartNodeId: str
+    # Stream a progress frame with the outputs of each item once it finishes
+    streamItemProgress: bool = False
     _private_config: PrivateConfig = PrivateAttr(
         default_factory=lambda: PrivateConfig(timeout=None)
     )
@@ -90,7 +92,7 @@ class IterationNode(BaseNode):
 
                 batch_result_dict: dict[str, list] = {}
                 temp_variable_pool = copy.deepcopy(variable_pool)
-                for batch_data in batch_datas:
+                for index, batch_data in enumerate(batch_datas):
                     # iteration_one_engine.engine_ctx.built_nodes = built_nodes
                     res = await self._process_single_batch(
                         batch_data,
@@ -102,6 +104,15 @@ class IterationNode(BaseNode):
                         callbacks,
                         event_log_trace,
                     )
+                    if self.streamItemProgress and isinstance(callbacks, ChatCallBacks):
+                        await callbacks.on_node_item_progress(
+                            node_id=self.node_id,
+                            alias_name=self.alias_name,
+                            index=index,
+                            total=len(batch_datas),
+                            status=res.status.value,
+                            outputs=res.outputs,
+                        )
                     cur_batch_res = res.outputs
                     for res_k, res_v in cur_batch_res.items():
                         if res_k not in batch_result_dict:
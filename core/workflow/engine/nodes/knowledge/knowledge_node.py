@@ -1,10 +1,17 @@
+import asyncio
+import hashlib
 import json
 import os
 from enum import Enum
-from typing import Any, Literal
+from typing import Any, Literal, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
+from workflow.cache.knowledge import (
+    get_knowledge_repo_versions,
+    get_knowledge_result,
+    set_knowledge_result,
+)
 from workflow.configs import workflow_config
 from workflow.consts.engine.model_provider import ModelProviderEnum
 from workflow.engine.callbacks.openai_types_sse import GenerateUsage
@@ -26,6 +33,38 @@ from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
+from workflow.utils.cache import SingleFlight, TTLCache
+from workflow.utils.replay import interaction
+
+# In-process tier of the knowledge result cache, keyed like the Redis tier
+_knowledge_results: TTLCache[str, str] = TTLCache(
+    ttl=workflow_config.knowledge_cache_config.ttl,
+    max_size=workflow_config.knowledge_cache_config.local_size,
+)
+_knowledge_flight: SingleFlight[str, str] = SingleFlight()
+
+
+def _result_cache_key(config: KnowledgeConfig, repo_versions: dict[str, str]) -> str:
+    """
+    Build the result cache key of a knowledge retrieval.
+
+    :param config: Retrieval configuration
+    :param repo_versions: Version token of each referenced repository
+    :return: Result cache key
+    """
+    repo_ids = sorted(config.repo_id)
+    params = {
+        "query": " ".join(config.query.split()),
+        "top_n": config.top_n,
+        "rag_type": config.rag_type,
+        "threshold": config.threshold,
+        "repo_ids": repo_ids,
+        "repo_versions": [repo_versions.get(repo_id, "") for repo_id in repo_ids],
+        "doc_ids": sorted(config.doc_ids),
+        "history": config.history,
+    }
+    raw = json.dumps(params, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
 
 
 class SearchMode(str, Enum):
@@ -90,6 +129,9 @@ class KnowledgeNode(BaseLLMNode):
     domain: str = Field(default="")
     appId: str = Field(default="")
     source: str = Field(default=ModelProviderEnum.OPENAI.value)
+    enableResultCache: bool = Field(
+        default=False
+    )  # Reuse results of identical retrievals for a short time
 
     @property
     def run_s(self) -> WorkflowNodeExecutionStatus:
@@ -244,6 +286,196 @@ class KnowledgeNode(BaseLLMNode):
             return RepoAndDocIds(repo_ids=repo_ids, doc_ids=doc_ids)
         return RepoAndDocIds(repo_ids=self.repoId, doc_ids=self.docIds)
 
+    async def _retrieve(
+        self,
+        query: str,
+        history: list,
+        variable_pool: VariablePool,
+        span: Span,
+        event_log_node_trace: Optional[NodeLog],
+    ) -> str:
+        """
+        Search the configured knowledge repositories.
+
+        :param query: User query
+        :param history: Chat history passed to the knowledge service
+        :param variable_pool: Variable pool for accessing system parameters
+        :param span: Span object for tracing and logging
+        :param event_log_node_trace: Optional node log trace object
+        :return: JSON string containing the retrieved knowledge base results
+        """
+        # Get repository and document IDs
+        repo_and_doc_ids = self._get_repo_and_doc_ids()
+
+        # Get knowledge base URL from environment variables
+        knowledge_base_url = os.getenv("KNOWLEDGE_BASE_URL")
+        if not knowledge_base_url:
+            raise CustomException(
+                err_code=CodeEnum.KNOWLEDGE_NODE_EXECUTION_ERROR,
+                err_msg="Knowledge base URL is not set",
+                cause_error="Knowledge base URL is not set",
+            )
+        knowledge_recall_url = f"{knowledge_base_url}/knowledge/v1/chunk/query"
+        flow_id: str = variable_pool.system_params.get(ParamKey.FlowId)
+        knowledge_config = KnowledgeConfig(
+            top_n=self.topN,
+            rag_type=self.ragType,
+            repo_id=repo_and_doc_ids.repo_ids,
+            url=knowledge_recall_url,
+            query=str(query),
+            flow_id=flow_id,
+            doc_ids=repo_and_doc_ids.doc_ids,
+            threshold=self.score,
+            history=history,
+        )
+        # Perform knowledge base search
+        client = KnowledgeClient(config=knowledge_config)
+        if not self.enableResultCache:
+            return await client.top_k(
+                request_span=span, event_log_node_trace=event_log_node_trace
+            )
+        return await self._cached_top_k(client, span, event_log_node_trace)
+
+    async def _cached_top_k(
+        self,
+        client: KnowledgeClient,
+        span: Span,
+        event_log_node_trace: Optional[NodeLog],
+    ) -> str:
+        """
+        Search the knowledge base through the local and Redis result caches.
+
+        Cache failures fall back to a plain search.
+
+        :param client: Knowledge client holding the retrieval configuration
+        :param span: Span object for tracing and logging
+        :param event_log_node_trace: Optional node log trace object
+        :return: JSON string containing the retrieved knowledge base results
+        """
+        try:
+            repo_versions = await interaction(
+                "redis",
+                ("get_knowledge_repo_versions", client.config.repo_id),
+                lambda: asyncio.to_thread(
+                    get_knowledge_repo_versions, client.config.repo_id
+                ),
+            )
+            cache_key = _result_cache_key(client.config, repo_versions)
+            result = _knowledge_results.get(cache_key)
+            if result is None:
+                result = await interaction(
+                    "redis",
+                    ("get_knowledge_result", cache_key),
+                    lambda: asyncio.to_thread(get_knowledge_result, cache_key),
+                )
+                if result is not None:
+                    _knowledge_results.set(cache_key, result)
+        except Exception as e:
+            span.add_error_event(f"Knowledge result cache unavailable: {e}")
+            return await client.top_k(
+                request_span=span, event_log_node_trace=event_log_node_trace
+            )
+        if result is not None:
+            await span.add_info_events_async({"knowledge_result_cache": "hit"})
+            return result
+
+        async def load() -> str:
+            result = await client.top_k(
+                request_span=span, event_log_node_trace=event_log_node_trace
+            )
+            _knowledge_results.set(cache_key, result)
+            try:
+                await interaction(
+                    "redis",
+                    ("set_knowledge_result", cache_key),
+                    lambda: asyncio.to_thread(
+                        set_knowledge_result,
+                        cache_key,
+                        result,
+                        workflow_config.knowledge_cache_config.ttl,
+                    ),
+                )
+            except Exception as e:
+                span.add_error_event(f"Failed to cache knowledge result: {e}")
+            return result
+
+        return await _knowledge_flight.do(cache_key, load)
+
+    @staticmethod
+    def _discard_retrieval(
+        retrieval: asyncio.Task,
+        span: Span,
+        event_log_node_trace: Optional[NodeLog],
+    ) -> None:
+        """
+        Cancel a speculative retrieval the LLM decided against and record it as wasted.
+
+        :param retrieval: Speculative retrieval task
+        :param span: Span object for tracing and logging
+        :param event_log_node_trace: Optional node log trace object
+        """
+        retrieval.cancel()
+        # Mark the outcome as retrieved so a failed search does not log
+        retrieval.add_done_callback(lambda t: t.cancelled() or t.exception())
+        span.set_attribute("speculative_retrieval", "wasted")
+        if event_log_node_trace:
+            event_log_node_trace.add_info_log(
+                "Speculative knowledge retrieval discarded by adaptive decision"
+            )
+
+    async def _adaptive_retrieve(
+        self,
+        query: str,
+        history: list,
+        variable_pool: VariablePool,
+        span: Span,
+        event_log_node_trace: Optional[NodeLog],
+    ) -> Tuple[Optional[str], dict[str, int]]:
+        """
+        Let the LLM decide whether the knowledge base is needed and search it
+        if so.
+
+        With speculative retrieval enabled, the search runs while the LLM
+        decides and is discarded when the decision is negative.
+
+        :param query: Search query
+        :param history: Chat history passed to the search
+        :param variable_pool: Pool containing workflow variables
+        :param span: Span object for tracing and logging
+        :param event_log_node_trace: Optional node log trace object
+        :return: (search result, or None if the LLM decided against the
+                 search, token usage of the decision)
+        """
+        retrieval: Optional[asyncio.Task] = None
+        if workflow_config.knowledge_node_llm_config.speculative_retrieval:
+            # Retrieve while the LLM decides, so a positive decision does
+            # not wait for the search afterwards
+            retrieval = asyncio.create_task(
+                self._retrieve(
+                    query, history, variable_pool, span, event_log_node_trace
+                )
+            )
+        try:
+            should_use, token_usage = await self._should_use_knowledge(
+                query, span, variable_pool
+            )
+        except asyncio.CancelledError:
+            if retrieval is not None:
+                retrieval.cancel()
+            raise
+        if not should_use:
+            if retrieval is not None:
+                self._discard_retrieval(retrieval, span, event_log_node_trace)
+            return None, token_usage
+        if retrieval is None:
+            search_result = await self._retrieve(
+                query, history, variable_pool, span, event_log_node_trace
+            )
+        else:
+            span.set_attribute("speculative_retrieval", "used")
+            search_result = await retrieval
+        return search_result, token_usage
+
     async def execute(
         self, variable_pool: VariablePool, span: Span, **kwargs: Any
     ) -> NodeRunResult:
@@ -281,10 +513,10 @@ class KnowledgeNode(BaseLLMNode):
             history = self._get_chat_history(variable_pool)
 
             if self.search_mode == SearchMode.ADAPTIVE.value:
-                should_use, token_usage = await self._should_use_knowledge(
-                    query, span, variable_pool
+                adaptive_result, token_usage = await self._adaptive_retrieve(
+                    query, history, variable_pool, span, event_log_node_trace
                 )
-                if not should_use:
+                if adaptive_result is None:
                     outputs = {self.output_identifier[0]: []}
                     return self._create_node_result(
                         status=status,
@@ -292,35 +524,11 @@ class KnowledgeNode(BaseLLMNode):
                         outputs=outputs,
                         token_usage=token_usage,
                     )
-
-            # Get repository and document IDs
-            repo_and_doc_ids = self._get_repo_and_doc_ids()
-
-            # Get knowledge base URL from environment variables
-            knowledge_base_url = os.getenv("KNOWLEDGE_BASE_URL")
-            if not knowledge_base_url:
-                raise CustomException(
-                    err_code=CodeEnum.KNOWLEDGE_NODE_EXECUTION_ERROR,
-                    err_msg="Knowledge base URL is not set",
-                    cause_error="Knowledge base URL is not set",
+                search_result = adaptive_result
+            else:
+                search_result = await self._retrieve(
+                    query, history, variable_pool, span, event_log_node_trace
                 )
-            knowledge_recall_url = f"{knowledge_base_url}/knowledge/v1/chunk/query"
-            flow_id: str = variable_pool.system_params.get(ParamKey.FlowId)
-            knowledge_config = KnowledgeConfig(
-                top_n=self.topN,
-                rag_type=self.ragType,
-                repo_id=repo_and_doc_ids.repo_ids,
-                url=knowledge_recall_url,
-                query=str(query),
-                flow_id=flow_id,
-                doc_ids=repo_and_doc_ids.doc_ids,
-                threshold=self.score,
-                history=history,
-            )
-            # Perform knowledge base search
-            search_result = await KnowledgeClient(config=knowledge_config).top_k(
-                request_span=span, event_log_node_trace=event_log_node_trace
-            )
             result_dict = json.loads(search_result)["results"]
             outputs = {self.output_identifier[0]: result_dict}
 
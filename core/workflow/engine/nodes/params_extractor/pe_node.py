@@ -7,6 +7,7 @@ from typing import Any, cast
 from common.utils.json_schema.json_schema_validator import JsonSchemaValidator
 from pydantic import Field
 
+from workflow.configs import workflow_config
 from workflow.engine.callbacks.callback_handler import ChatCallBacks
 from workflow.engine.callbacks.openai_types_sse import GenerateUsage
 from workflow.engine.entities.variable_pool import ParamKey, VariablePool
@@ -17,6 +18,7 @@ from workflow.engine.nodes.entities.node_run_result import (
     WorkflowNodeExecutionStatus,
 )
 from workflow.engine.nodes.params_extractor.prompt import pe_system_prompt
+from workflow.engine.nodes.util.json_stream import JsonObjectStream
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
@@ -116,21 +118,19 @@ class ParamsExtractorNode(BaseLLMNode):
                 .replace("{{user_text}}", usr_input)
             )
 
+            params_stream = JsonObjectStream()
             token_usage, res, _, _ = await self._chat_with_llm(
                 span=span,
                 flow_id=flow_id,
                 variable_pool=variable_pool,
                 prompt_template=user_prompt,
                 event_log_node_trace=event_log_node_trace,
+                stop_when=lambda chunk: self._on_params_streamed(
+                    params_stream, chunk, span
+                ),
             )
 
-            match = re.search(r"```(json)?(.*)```", res, re.DOTALL)
-            if match is None:
-                json_str = res
-            else:
-                json_str = match.group(2)
-
-            extra_params = json.loads(json_str)
+            extra_params = self._parse_extraction(res, params_stream)
 
             res_dict = {}
             for output in self.output_identifier:
@@ -183,6 +183,49 @@ class ParamsExtractorNode(BaseLLMNode):
                 ),
             )
 
+    @staticmethod
+    def _parse_extraction(res: str, params_stream: JsonObjectStream) -> Any:
+        """
+        Parse the extraction output of the LLM.
+
+        Output that was cut short once every parameter had been streamed falls
+        back to the parameters parsed while streaming.
+
+        :param res: Raw LLM output
+        :param params_stream: Incremental parser of the extraction output
+        :return: Extracted parameters
+        """
+        match = re.search(r"```(json)?(.*)```", res, re.DOTALL)
+        json_str = res if match is None else match.group(2)
+        try:
+            return json.loads(json_str)
+        except ValueError:
+            if not params_stream.members:
+                raise
+            return params_stream.members
+
+    def _on_params_streamed(
+        self, params_stream: JsonObjectStream, chunk: str, span: Span
+    ) -> bool:
+        """
+        Parse the streamed extraction output and report each completed parameter.
+
+        :param params_stream: Incremental parser of the extraction output
+        :param chunk: Newly received output
+        :param span: Tracing span for monitoring
+        :return: True if the generation can be aborted because every output
+                 parameter is complete
+        """
+        completed = params_stream.feed(chunk)
+        for name, value in completed.items():
+            if name in self.output_identifier:
+                span.add_info_events(
+                    {"extracted_param": json.dumps({name: value}, ensure_ascii=False)}
+                )
+        return workflow_config.params_extractor_config.early_exit and all(
+            output in params_stream.members for output in self.output_identifier
+        )
+
     async def async_execute(
         self,
         variable_pool: VariablePool,
@@ -217,14 +260,15 @@ class ParamsExtractorNode(BaseLLMNode):
                 await span.add_info_events_async(
                     {"fc_schema": json.dumps(function.dict(), ensure_ascii=False)}
                 )
+            credentials = self.get_provider_credentials(variable_pool)
             fc_ai = SparkFunctionCallAi(
                 model_url=self.url,
                 model_name=self.domain,
                 spark_version="",
                 temperature=self.temperature,
-                app_id=self.appId,
-                api_key=self.apiKey,
-                api_secret=self.apiSecret,
+                app_id=credentials.app_id,
+                api_key=credentials.api_key,
+                api_secret=credentials.api_secret,
                 max_tokens=self.maxTokens,
                 top_k=self.topK,
                 patch_id=self.patch_id,
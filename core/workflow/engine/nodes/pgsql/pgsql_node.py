@@ -8,6 +8,7 @@ from sqlalchemy import text
 
 from workflow.configs import workflow_config
 from workflow.consts.database import DBMode, ExecuteEnv
+from workflow.engine.entities.provider_credentials import ProviderCredentials
 from workflow.engine.entities.variable_pool import ParamKey, VariablePool
 from workflow.engine.nodes.base_node import BaseNode
 from workflow.engine.nodes.entities.node_run_result import (
@@ -482,12 +483,14 @@ class PGSqlNode(BaseNode):
         self,
         inputs: dict,
         is_release: bool,
+        credentials: ProviderCredentials,
         span: Span,
     ) -> PGSqlConfig:
         """Generate PostgreSQL configuration for database operations.
 
         :param inputs: Input data dictionary containing variable values
         :param is_release: Whether this is a production release
+        :param credentials: Credentials used to authenticate against the service
         :param span: Tracing span for monitoring
         :return: Configured PGSqlConfig object
         :raises CustomException: If required parameters are missing
@@ -505,8 +508,8 @@ class PGSqlNode(BaseNode):
             )
         # Create PostgreSQL configuration object
         pgsql_config = PGSqlConfig(
-            appId=self.appId,
-            apiKey=self.apiKey,
+            appId=credentials.app_id,
+            apiKey=credentials.api_key,
             database_id=self.dbId,
             uid=self.uid,
             spaceId=str(self.spaceId) if self.spaceId else "",
@@ -602,7 +605,12 @@ class PGSqlNode(BaseNode):
             self.check_table_key_valid(inputs)
             # Get release status and generate PostgreSQL configuration
             is_release = variable_pool.system_params.get(ParamKey.IsRelease)
-            pgsql_config = await self.generate_config(inputs, is_release, span)
+            pgsql_config = await self.generate_config(
+                inputs,
+                is_release,
+                self.get_provider_credentials(variable_pool),
+                span,
+            )
             exec_result = await PGSqlClient(config=pgsql_config).exec_dml(span)
             # INSERT and UPDATE statements only return IDs, need to fetch full records for outputList
             if self.mode in [
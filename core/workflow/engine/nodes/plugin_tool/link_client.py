@@ -7,6 +7,7 @@ from workflow.exception.e import CustomException
 from workflow.exception.errors.code_convert import CodeConvert
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.trace.span import Span
+from workflow.utils.replay import interaction
 
 
 class Tool:
@@ -168,6 +169,19 @@ class Tool:
             return b64encode(json.dumps(payload, ensure_ascii=True).encode()).decode()
         return payload
 
+    async def _post(self, payload: Dict[str, Any]) -> Any:
+        """
+        Make an asynchronous HTTP request to the Link system.
+
+        :param payload: Link system request payload
+        :return: Decoded JSON response
+        """
+        from aiohttp import ClientSession
+
+        async with ClientSession() as session:
+            async with session.post(self.run_url, json=payload) as response:
+                return await response.json()
+
     async def run(
         self, action_input: dict, business_input: dict, span: Span, **kwargs: Any
     ) -> Dict[str, Any]:
@@ -265,28 +279,21 @@ class Tool:
             import requests  # type: ignore
 
             try:
-                from aiohttp import ClientSession
-
-                # Make asynchronous HTTP request to Link system
-                async with ClientSession() as session:
-                    start_time = time.time() * 1000
-                    async with session.post(
-                        self.run_url, json=run_link_payload
-                    ) as response:
-                        link_response = await response.json()
-                        # Log response timing and content
-                        await link_tool_span.add_info_events_async(
-                            {
-                                "plugin_node_link_post_cost_time": f"{time.time() * 1000 - start_time}"
-                            }
-                        )
-                        await link_tool_span.add_info_events_async(
-                            {
-                                "link_response": json.dumps(
-                                    link_response, ensure_ascii=False
-                                )
-                            }
-                        )
+                start_time = time.time() * 1000
+                link_response = await interaction(
+                    "http",
+                    (self.run_url, run_link_payload),
+                    lambda: self._post(run_link_payload),
+                )
+                # Log response timing and content
+                await link_tool_span.add_info_events_async(
+                    {
+                        "plugin_node_link_post_cost_time": f"{time.time() * 1000 - start_time}"
+                    }
+                )
+                await link_tool_span.add_info_events_async(
+                    {"link_response": json.dumps(link_response, ensure_ascii=False)}
+                )
             except requests.ConnectionError as e:
                 # Handle connection errors
                 raise CustomException(
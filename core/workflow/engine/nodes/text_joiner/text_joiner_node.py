@@ -1,7 +1,7 @@
 # Standard library imports
 import json
 from enum import Enum
-from typing import Any, Dict, List, Literal, Union
+from typing import Any, ClassVar, Dict, List, Literal, Union
 
 from pydantic import Field
 
@@ -53,6 +53,8 @@ class TextJoinerNode(BaseNode):
         separator: Delimiter used for text splitting in SEPARATE_MODE
     """
 
+    pure: ClassVar[bool] = True
+
     mode: Literal[0, 1] = Field(default=0)  # Text processing mode (0=JOIN, 1=SEPARATE)
     prompt: str = Field(default="")  # Template for text concatenation
     separator: str = Field(default="")  # Delimiter for text separation
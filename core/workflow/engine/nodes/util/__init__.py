@@ -6,12 +6,14 @@ operations in workflow engine nodes, including:
 
 - Dictionary utilities for key format conversion
 - Frame processors for handling different LLM response formats
+- Incremental parsing of streamed JSON objects
 - Prompt processing and variable replacement utilities
 - String parsing utilities for template processing
 
 Modules:
     dict_util: Dictionary manipulation utilities
     frame_processor: LLM response frame processing
+    json_stream: Incremental parsing of streamed JSON objects
     prompt: Prompt template processing and variable replacement
     string_parse: String parsing and template unit processing
 """
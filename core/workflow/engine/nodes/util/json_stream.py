@@ -0,0 +1,213 @@
+import json
+from typing import Any, Dict, Optional, Tuple
+
+# Characters that end a scalar (number, true, false, null) value
+_SCALAR_TERMINATORS = frozenset(",}] \t\r\n")
+
+
+def _scan_string(text: str, start: int) -> Optional[int]:
+    """
+    Find the end of a JSON string.
+
+    :param text: Text being scanned
+    :param start: Index of the opening quote
+    :return: Index just past the closing quote, or None if it has not arrived yet
+    """
+    i = start + 1
+    while i < len(text):
+        char = text[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == '"':
+            return i + 1
+        i += 1
+    return None
+
+
+def _scan_container(text: str, start: int) -> Optional[int]:
+    """
+    Find the end of a JSON object or array.
+
+    :param text: Text being scanned
+    :param start: Index of the opening bracket
+    :return: Index just past the matching closing bracket, or None if it has
+             not arrived yet
+    """
+    depth = 0
+    i = start
+    while i < len(text):
+        char = text[i]
+        if char == '"':
+            end = _scan_string(text, i)
+            if end is None:
+                return None
+            i = end
+            continue
+        if char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return None
+
+
+def _scan_value(text: str, start: int) -> Optional[int]:
+    """
+    Find the end of a JSON value.
+
+    Scalars are only complete once a terminator follows them, since more
+    digits or letters may still arrive.
+
+    :param text: Text being scanned
+    :param start: Index of the first character of the value
+    :return: Index just past the value, or None if it has not arrived yet
+    """
+    char = text[start]
+    if char == '"':
+        return _scan_string(text, start)
+    if char in "{[":
+        return _scan_container(text, start)
+    i = start
+    while i < len(text):
+        if text[i] in _SCALAR_TERMINATORS:
+            return i
+        i += 1
+    return None
+
+
+def _skip_whitespace(text: str, i: int) -> int:
+    """
+    Skip JSON whitespace.
+
+    :param text: Text being scanned
+    :param i: Index to start from
+    :return: Index of the next non-whitespace character
+    """
+    while i < len(text) and text[i] in " \t\r\n":
+        i += 1
+    return i
+
+
+class JsonObjectStream:
+    """
+    Incremental parser for the top-level members of a streamed JSON object.
+
+    Text before the opening brace (such as a markdown code fence) is skipped.
+    A member is reported as soon as its value is complete, so consumers can act
+    on early members while later ones are still being generated. Members whose
+    value is not valid JSON are skipped and left to the final full parse.
+    """
+
+    def __init__(self) -> None:
+        # Received text that has not been parsed into members yet
+        self.text = ""
+        self.members: Dict[str, Any] = {}
+        self.closed = False
+        # Index in text where parsing resumes, -1 until the opening brace is found
+        self._pos = -1
+
+    def feed(self, chunk: str) -> Dict[str, Any]:
+        """
+        Append streamed text and parse every member it completes.
+
+        :param chunk: Newly received text
+        :return: Members completed by this chunk
+        """
+        self.text += chunk
+        completed: Dict[str, Any] = {}
+        if self.closed or not self._find_object_start():
+            return completed
+        while True:
+            member = self._scan_member()
+            if member is None:
+                break
+            key_start, key_end, value_start, value_end = member
+            self._pos = value_end
+            try:
+                key = json.loads(self.text[key_start:key_end])
+                value = json.loads(self.text[value_start:value_end])
+            except ValueError:
+                continue
+            self.members[key] = value
+            completed[key] = value
+        # Drop parsed text so that later chunks do not scan or copy it again
+        self.text = self.text[self._pos :]
+        self._pos = 0
+        return completed
+
+    def _find_object_start(self) -> bool:
+        """
+        Locate the opening brace of the object.
+
+        :return: True once the opening brace has been received
+        """
+        if self._pos >= 0:
+            return True
+        brace = self.text.find("{")
+        if brace < 0:
+            return False
+        self._pos = brace + 1
+        return True
+
+    def _scan_member(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Find the next complete member.
+
+        :return: (key start, key end, value start, value end) indexes, or None
+                 if the member has not fully arrived or the object ended
+        """
+        key_start = self._member_start()
+        if key_start is None:
+            return None
+        key_end = _scan_string(self.text, key_start)
+        if key_end is None:
+            return None
+        value_start = self._value_start(key_end)
+        if value_start is None:
+            return None
+        value_end = _scan_value(self.text, value_start)
+        if value_end is None:
+            return None
+        return key_start, key_end, value_start, value_end
+
+    def _member_start(self) -> Optional[int]:
+        """
+        Skip the separator before the next member.
+
+        :return: Index of the opening quote of the next key, or None if it has
+                 not arrived yet or the object ended
+        """
+        text = self.text
+        i = _skip_whitespace(text, self._pos)
+        if i < len(text) and text[i] == ",":
+            i = _skip_whitespace(text, i + 1)
+        if i >= len(text):
+            return None
+        if text[i] != '"':
+            # Closing brace, or not a JSON object member left to the full parse
+            self.closed = True
+            return None
+        return i
+
+    def _value_start(self, key_end: int) -> Optional[int]:
+        """
+        Skip the colon between a key and its value.
+
+        :param key_end: Index just past the closing quote of the key
+        :return: Index of the first character of the value, or None if it has
+                 not arrived yet or the colon is missing
+        """
+        text = self.text
+        colon = _skip_whitespace(text, key_end)
+        if colon >= len(text):
+            return None
+        if text[colon] != ":":
+            self.closed = True
+            return None
+        value_start = _skip_whitespace(text, colon + 1)
+        if value_start >= len(text):
+            return None
+        return value_start
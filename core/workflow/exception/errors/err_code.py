@@ -138,6 +138,10 @@ class CodeEnum(Enum):
     )
 
     OPEN_AI_REQUEST_ERROR = (20380, "External large model request failed")
+    LLM_RATE_LIMIT_ERROR = (
+        20381,
+        "Model service rate limit exceeded, please try again later",
+    )
 
     # 20400
 
@@ -162,6 +166,7 @@ class CodeEnum(Enum):
     # OpenAPI errors
     OPEN_API_STREAM_QUEUE_TIMEOUT_ERROR = (20804, "OpenAPI output timeout")
     OPEN_API_ERROR = (20805, "OpenAPI output error")
+    OPEN_API_OVERLOAD_ERROR = (20806, "Service is busy, please try again later")
 
     # Authentication and rate limiting errors
     MASDK_LICC_LIMIT_ERROR = (
@@ -1,13 +1,14 @@
 import asyncio
 import json
 import os
-from typing import Any
+import time
+from typing import Any, Optional, Set, Tuple
 
 import httpx
 from common.utils.hmac_auth import HMACAuth
 from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from loguru import logger
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
@@ -18,23 +19,92 @@ from workflow.extensions.fastapi.base import (
 )
 from workflow.extensions.middleware.getters import get_cache_service
 from workflow.extensions.otlp.trace.span import Span
+from workflow.utils.cache import SingleFlight, TTLCache
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
+class AuthMiddleware:
     """
     Authentication middleware
+
+    Resolved api_key -> app_id mappings are kept in memory per worker. An entry
+    is refreshed in the background shortly before it expires, and an expired
+    entry is still served for a short grace period while the refresh runs, so
+    a slow management platform does not delay chat requests. Concurrent
+    lookups of the same api key share one request.
     """
 
+    # Pooled client shared by all requests to the management platform
+    _client: Optional[httpx.AsyncClient] = None
+
     def __init__(self, app: ASGIApp):
         """
         Initialize the authentication middleware
 
         :param app: The ASGI application
         """
-        super().__init__(app)
+        self.app = app
         self.need_auth_paths = CHAT_OPEN_API_PATHS + AUTH_OPEN_API_PATHS
         self.api_key = os.getenv("APP_MANAGE_PLAT_KEY", "")
         self.api_secret = os.getenv("APP_MANAGE_PLAT_SECRET", "")
+        self.cache_ttl = float(os.getenv("AUTH_APP_ID_CACHE_TTL", "300"))
+        self.refresh_ahead = float(os.getenv("AUTH_APP_ID_REFRESH_AHEAD", "30"))
+        self.stale_ttl = float(os.getenv("AUTH_APP_ID_STALE_TTL", "60"))
+        # api_key -> (app_id, monotonic time it was resolved)
+        self._app_ids: TTLCache[str, Tuple[str, float]] = TTLCache(
+            ttl=self.cache_ttl + self.stale_ttl,
+            max_size=int(os.getenv("AUTH_APP_ID_CACHE_SIZE", "10000")),
+        )
+        self._flight: SingleFlight[str, str] = SingleFlight()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """
+        Get the pooled client used to call the management platform.
+
+        :return: The shared httpx client
+        """
+        if cls._client is None or cls._client.is_closed:
+            cls._client = httpx.AsyncClient(
+                timeout=float(os.getenv("AUTH_REMOTE_TIMEOUT", "5")),
+                limits=httpx.Limits(
+                    max_connections=int(os.getenv("AUTH_CLIENT_POOL_SIZE", "100")),
+                    max_keepalive_connections=int(
+                        os.getenv("AUTH_CLIENT_POOL_SIZE", "100")
+                    ),
+                ),
+            )
+        return cls._client
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Close the pooled client.
+        This method is called when the application closes.
+        """
+        if cls._client is not None and not cls._client.is_closed:
+            await cls._client.aclose()
+        cls._client = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Authenticate http requests as a plain ASGI middleware, so streamed
+        responses are passed through without extra buffering tasks.
+
+        :param scope: The ASGI connection scope
+        :param receive: The ASGI receive channel
+        :param send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def call_next(request: Request) -> None:
+            await self.app(request.scope, receive, send)
+
+        response = await self.dispatch(Request(scope, receive), call_next)
+        if response is not None:
+            await response(scope, receive, send)
 
     async def dispatch(self, request: Request, call_next: Any) -> Any:
         """
@@ -47,7 +117,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
 
         :param request: The request object
         :param call_next: The next function to call
-        :return: The response object
+        :return: The error response, or the result of ``call_next``
         """
         # Check if the path is in the exclude paths
         if request.url.path not in self.need_auth_paths:
@@ -121,9 +191,6 @@ class AuthMiddleware(BaseHTTPMiddleware):
         :param span: The span object
         :return: The app source detail
         """
-
-        url = f"{os.getenv('APP_MANAGE_PLAT_BASE_URL')}/v2/app/key/api_key"
-
         api_key = authorization.split(" ")[1].split(":")[0]
         if not api_key:
             raise CustomException(
@@ -131,16 +198,70 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 err_msg="authorization header is invalid",
             )
 
-        app_id = await asyncio.to_thread(self._get_app_id_with_cache, api_key)
-        if app_id:
+        entry = self._app_ids.get(api_key)
+        if entry is not None:
+            # Entries are dropped once past their stale grace period
+            app_id, resolved_at = entry
+            if time.monotonic() - resolved_at >= self.cache_ttl - self.refresh_ahead:
+                # Near or past expiry: refresh without holding up this request
+                self._refresh_in_background(api_key)
             return app_id
 
-        url = f"{url}/{api_key}"
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(url, headers=self._gen_app_auth_header(url))
-        await span.add_info_event_async(
-            f"Application management platform response: {resp.text}"
+        return await self._flight.do(
+            api_key, lambda: self._resolve_app_id(api_key, span)
         )
+
+    def _refresh_in_background(self, api_key: str) -> None:
+        """
+        Re-resolve an api key in the background unless a lookup is in flight.
+
+        :param api_key: The api key
+        """
+        if self._flight.is_running(api_key):
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._flight.do(
+                    api_key, lambda: self._resolve_app_id(api_key, None)
+                )
+            except Exception as e:
+                logger.warning(f"Refreshing app id of api key failed: {e}")
+
+        task = asyncio.create_task(refresh())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _resolve_app_id(self, api_key: str, span: Optional[Span]) -> str:
+        """
+        Resolve the app id of an api key from the shared cache or the
+        management platform, and remember it in memory.
+
+        :param api_key: The api key
+        :param span: The span object, None for background refreshes
+        :return: The app id
+        """
+        app_id = await asyncio.to_thread(self._get_app_id_with_cache, api_key)
+        if not app_id:
+            app_id = await self._fetch_app_id(api_key, span)
+            await asyncio.to_thread(self._set_app_id_with_cache, api_key, app_id)
+        self._app_ids.set(api_key, (app_id, time.monotonic()))
+        return app_id
+
+    async def _fetch_app_id(self, api_key: str, span: Optional[Span]) -> str:
+        """
+        Fetch the app id of an api key from the management platform
+
+        :param api_key: The api key
+        :param span: The span object, None for background refreshes
+        :return: The app id
+        """
+        url = f"{os.getenv('APP_MANAGE_PLAT_BASE_URL')}/v2/app/key/api_key/{api_key}"
+        resp = await self.get_client().get(url, headers=self._gen_app_auth_header(url))
+        if span is not None:
+            await span.add_info_event_async(
+                f"Application management platform response: {resp.text}"
+            )
         if resp.status_code != 200:
             raise CustomException(
                 CodeEnum.APP_GET_WITH_REMOTE_FAILED_ERROR, cause_error=resp.text
@@ -173,7 +294,6 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 err_msg="appid is null",
                 cause_error=json.dumps(resp.json(), ensure_ascii=False),
             )
-        await asyncio.to_thread(self._set_app_id_with_cache, api_key, app_id)
         return app_id
 
     def _get_app_id_with_cache(self, api_key: str) -> str:
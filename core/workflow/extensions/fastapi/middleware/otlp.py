@@ -1,13 +1,12 @@
 from typing import Any
 
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from workflow.extensions.otlp.trace.span import Span
 
 
-class OtlpMiddleware(BaseHTTPMiddleware):
+class OtlpMiddleware:
 
     def __init__(self, app: ASGIApp):
         """
@@ -15,7 +14,25 @@ class OtlpMiddleware(BaseHTTPMiddleware):
 
         :param app: The ASGI application
         """
-        super().__init__(app)
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Trace http requests as a plain ASGI middleware, so streamed responses
+        are passed through without extra buffering tasks.
+
+        :param scope: The ASGI connection scope
+        :param receive: The ASGI receive channel
+        :param send: The ASGI send channel
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def call_next(request: Request) -> None:
+            await self.app(request.scope, receive, send)
+
+        await self.dispatch(Request(scope, receive), call_next)
 
     async def dispatch(self, request: Request, call_next: Any) -> Any:
         """
@@ -23,7 +40,7 @@ class OtlpMiddleware(BaseHTTPMiddleware):
 
         :param request: The request object
         :param call_next: The next function to call
-        :return: The response object
+        :return: The result of ``call_next``
         """
         span = Span()
         with span.start(func_name=request.url.path):
@@ -1,6 +1,6 @@
 import abc
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from workflow.extensions.middleware.utils import ServiceType
 
@@ -34,13 +34,15 @@ class BaseCacheService(abc.ABC):
         """
 
     @abc.abstractmethod
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, expire_time: int | None = None) -> None:
         """
         Add an item to the cache.
 
         Args:
             key: The key of the item.
             value: The value to cache.
+            expire_time: Optional expiration time in seconds, defaults to the
+                cache's own expiration time.
         """
 
     @abc.abstractmethod
@@ -56,6 +58,18 @@ class BaseCacheService(abc.ABC):
         :param expire_time: Expiration time in seconds for the hash key.
         """
 
+    @abc.abstractmethod
+    def hash_set_many(
+        self, name: str, mapping: Dict[str, Any], expire_time: int | None
+    ) -> None:
+        """
+        Add several hash items to the cache in one round trip.
+
+        :param name: The hash key name.
+        :param mapping: Field keys and the values to cache.
+        :param expire_time: Expiration time in seconds for the hash key.
+        """
+
     @abc.abstractmethod
     def hash_get(self, name: str, key: str) -> Any:
         """
@@ -66,6 +80,16 @@ class BaseCacheService(abc.ABC):
         :return: The value associated with the field, or None if not found.
         """
 
+    @abc.abstractmethod
+    def hash_get_many(self, name: str, keys: List[str]) -> Dict[str, Any]:
+        """
+        Retrieve several hash field values from the cache in one round trip.
+
+        :param name: The hash key name.
+        :param keys: The field keys within the hash.
+        :return: A dictionary of the fields that were found and their values.
+        """
+
     @abc.abstractmethod
     def hash_del(self, name: str, key: str) -> Any:
         """
@@ -190,3 +214,35 @@ class BaseCacheService(abc.ABC):
         Returns:
             True if the key was set, False if the key already exists.
         """
+
+    @abc.abstractmethod
+    def getset(self, key: str, value: Any, expire_time: int | None = None) -> Any:
+        """
+        Atomically set key to value and return the value it replaced.
+
+        Args:
+            key: The key to set.
+            value: The value to set.
+            expire_time: Optional expiration time in seconds, defaults to the
+                cache's own expiration time.
+
+        Returns:
+            The previous value, or None if the key did not exist.
+        """
+
+    @abc.abstractmethod
+    def getset_many(
+        self, mapping: Dict[str, Any], expire_time: int | None = None
+    ) -> Dict[str, Any]:
+        """
+        Atomically set each key to its value and return the values replaced,
+        in a single round trip.
+
+        Args:
+            mapping: Values to set by key.
+            expire_time: Optional expiration time in seconds, defaults to the
+                cache's own expiration time.
+
+        Returns:
+            The previous value by key, None for keys that did not exist.
+        """
@@ -1,6 +1,6 @@
 import pickle
 import re
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Tuple
 
 from loguru import logger
 
@@ -101,17 +101,21 @@ class RedisCache(BaseCacheService, Service):
         value = self._client.get(key)
         return pickle.loads(value) if value else None
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, expire_time: int | None = None) -> None:
         """
         Add an item to the cache.
 
         Args:
             key: The key of the item.
             value: The value to cache.
+            expire_time: Optional expiration time in seconds, defaults to the
+                cache's own expiration time.
         """
         try:
             if pickled := pickle.dumps(value):
-                result = self._client.setex(key, self.expiration_time, pickled)
+                result = self._client.setex(
+                    key, expire_time or self.expiration_time, pickled
+                )
                 if not result:
                     raise ValueError("RedisCache could not set the value.")
         except TypeError as exc:
@@ -145,6 +149,33 @@ class RedisCache(BaseCacheService, Service):
                 "RedisCache only accepts values that can be pickled. "
             ) from exc
 
+    def hash_set_many(
+        self, name: str, mapping: Dict[str, Any], expire_time: int | None
+    ) -> None:
+        """
+        Set several hash fields with a single HSET.
+
+        :param name: The hash key name
+        :param mapping: Field keys and the values to cache
+        :param expire_time: Expiration time in seconds for the hash key
+        :raises TypeError: If a value cannot be pickled
+        """
+        if not mapping:
+            return
+        try:
+            pickled = {key: pickle.dumps(value) for key, value in mapping.items()}
+        except TypeError as exc:
+            raise TypeError(
+                "RedisCache only accepts values that can be pickled. "
+            ) from exc
+        if not expire_time:
+            self._client.hset(name=name, mapping=pickled)
+            return
+        pipe = self._client.pipeline()
+        pipe.hset(name=name, mapping=pickled)
+        pipe.expire(name=name, time=expire_time)
+        pipe.execute()
+
     def hash_get(self, name: str, key: str) -> Any:
         """
         Get a hash field value.
@@ -165,6 +196,30 @@ class RedisCache(BaseCacheService, Service):
                 "RedisCache only accepts values that can be pickled. "
             ) from exc
 
+    def hash_get_many(self, name: str, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several hash field values with a single HMGET.
+
+        :param name: The hash key name
+        :param keys: The field keys within the hash
+        :return: Dictionary of the fields that were found and their unpickled values
+        :raises TypeError: If a value cannot be unpickled
+        """
+        if not keys:
+            return {}
+        result = {}
+        for key, value in zip(keys, self._client.hmget(name, keys)):
+            if not value:
+                continue
+            try:
+                result[key] = pickle.loads(value)
+            except (pickle.PickleError, ValueError, EOFError) as exc:
+                raise TypeError(
+                    f"RedisCache only accepts values that can be pickled. "
+                    f"Failed to unpickle field '{key}'"
+                ) from exc
+        return result
+
     def hash_del(self, name: str, *key: str) -> Tuple[bool, Dict[str, str]]:
         """
         Delete hash fields.
@@ -336,6 +391,48 @@ class RedisCache(BaseCacheService, Service):
         )
         return bool(result)
 
+    def getset(self, key: str, value: Any, expire_time: int | None = None) -> Any:
+        """
+        Atomically set key to value and return the value it replaced.
+
+        :param key: The key to set
+        :param value: The value to set
+        :param expire_time: Optional expiration time in seconds, defaults to the
+                            cache's own expiration time
+        :return: The previous value, or None if the key did not exist
+        :raises TypeError: If the value cannot be pickled
+        """
+        return self.getset_many({key: value}, expire_time)[key]
+
+    def getset_many(
+        self, mapping: Dict[str, Any], expire_time: int | None = None
+    ) -> Dict[str, Any]:
+        """
+        Atomically set each key to its value and return the values replaced,
+        in a single round trip.
+
+        :param mapping: Values to set by key
+        :param expire_time: Optional expiration time in seconds, defaults to the
+                            cache's own expiration time
+        :return: The previous value by key, None for keys that did not exist
+        :raises TypeError: If a value cannot be pickled
+        """
+        try:
+            pickled = {key: pickle.dumps(value) for key, value in mapping.items()}
+        except TypeError as exc:
+            raise TypeError(
+                "RedisCache only accepts values that can be pickled. "
+            ) from exc
+        pipe = self._client.pipeline()
+        for key, value in pickled.items():
+            pipe.getset(key, value)
+            pipe.expire(key, expire_time or self.expiration_time)
+        results = pipe.execute()
+        return {
+            key: pickle.loads(previous) if previous else None
+            for key, previous in zip(pickled, results[::2])
+        }
+
     def __repr__(self) -> str:
         """
         Return a string representation of the RedisCache instance.
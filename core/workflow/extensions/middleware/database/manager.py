@@ -5,11 +5,13 @@ This module provides the core database service implementation with connection
 pooling, session management, and context manager support.
 """
 
-from typing import Any, Generator, Optional
+from typing import Any, AsyncGenerator, Generator, Optional
 
 from loguru import logger
 from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session  # type: ignore
+from sqlmodel.ext.asyncio.session import AsyncSession  # type: ignore
 
 from workflow.configs.app_config import DatabaseConfig
 from workflow.extensions.middleware.base import Service
@@ -59,6 +61,7 @@ class DatabaseService(Service):
         # Initialize database and engine
         self._create_database_if_not_exists()
         self.engine = self._create_engine()
+        self.async_engine = self._create_async_engine()
 
     def _build_base_url(self) -> str:
         """
@@ -72,6 +75,12 @@ class DatabaseService(Service):
         """
         return f"mysql+pymysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
 
+    def _build_async_connection_url(self) -> str:
+        """
+        Build the complete database connection URL for the asyncio driver.
+        """
+        return f"mysql+aiomysql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+
     def _create_engine(self, database_url: Optional[str] = None) -> "Engine":
         """
         Create and configure the SQLAlchemy engine.
@@ -88,6 +97,23 @@ class DatabaseService(Service):
             pool_recycle=self.pool_recycle,
         )
 
+    def _create_async_engine(self) -> "AsyncEngine":
+        """
+        Create and configure the SQLAlchemy asyncio engine.
+
+        The async engine is used by request-path reads so that database I/O
+        does not block the event loop or occupy the default thread pool.
+
+        :return: Configured SQLAlchemy async engine instance
+        """
+        return create_async_engine(
+            self._build_async_connection_url(),
+            echo=False,
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_recycle=self.pool_recycle,
+        )
+
     def _create_database_if_not_exists(self) -> None:
         """
         Create the database if it doesn't exist.
@@ -150,3 +176,12 @@ class DatabaseService(Service):
         """
         with Session(self.engine) as session:
             yield session
+
+    async def get_async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        """
+        Get an asyncio database session as an async generator.
+
+        :return: Async generator yielding a database session
+        """
+        async with AsyncSession(self.async_engine, expire_on_commit=False) as session:
+            yield session
@@ -6,9 +6,11 @@ middleware services through the service manager. These functions provide
 type-safe access to services and handle the casting to appropriate types.
 """
 
-from typing import Iterator, cast
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterator, cast
 
 from sqlmodel import Session  # type: ignore
+from sqlmodel.ext.asyncio.session import AsyncSession  # type: ignore
 
 from workflow.extensions.middleware.cache.base import BaseCacheService
 from workflow.extensions.middleware.database.manager import DatabaseService
@@ -43,6 +45,22 @@ def get_session() -> Iterator["Session"]:
     yield from db_service.get_session()
 
 
+@asynccontextmanager
+async def get_async_session() -> AsyncIterator["AsyncSession"]:
+    """
+    Get an asyncio database session from the database service.
+
+    Usage: ``async with get_async_session() as session: ...``
+
+    :return: An async context manager yielding a database session
+    """
+    db_service = cast(
+        DatabaseService, service_manager.get(ServiceType.DATABASE_SERVICE)
+    )
+    async for session in db_service.get_async_session():
+        yield session
+
+
 def get_cache_service() -> "BaseCacheService":
     """
     Get the cache service instance.
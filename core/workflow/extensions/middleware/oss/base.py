@@ -6,7 +6,7 @@ providing a common interface for different object storage implementations.
 """
 
 import abc
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from workflow.extensions.middleware.utils import ServiceType
 
@@ -50,3 +50,28 @@ class BaseOSSService(abc.ABC):
         :raises NotImplementedError: This method must be implemented by subclasses
         """
         raise NotImplementedError
+
+    async def upload_stream_async(
+        self,
+        filename: str,
+        chunks: AsyncIterator[bytes],
+        size: Optional[int] = None,
+        bucket_name: Optional[str] = None,
+        max_concurrency: int = 1,
+    ) -> str:
+        """
+        Upload a file read chunk by chunk to the object storage service.
+
+        Implementations that can store a file in parts override this method to
+        keep only a few chunks in memory. The default collects all chunks and
+        uploads them at once.
+
+        :param filename: The name of the file to be uploaded
+        :param chunks: The binary content of the file, one chunk at a time
+        :param size: Total size of the file in bytes, if known
+        :param bucket_name: Optional bucket name, if not provided uses default bucket
+        :param max_concurrency: Maximum number of chunks stored concurrently
+        :return: The URL or path to the uploaded file
+        """
+        file_bytes = b"".join([chunk async for chunk in chunks])
+        return await self.upload_file_async(filename, file_bytes, bucket_name)
@@ -7,7 +7,7 @@ including S3-compatible storage and iFly Gateway Storage clients.
 
 import asyncio
 import json
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from urllib.parse import urlencode
 
 import boto3  # type: ignore
@@ -157,6 +157,149 @@ class S3Service(BaseOSSService, Service):
                 CodeEnum.FILE_STORAGE_ERROR, cause_error=str(e)
             ) from e
 
+    async def upload_stream_async(
+        self,
+        filename: str,
+        chunks: AsyncIterator[bytes],
+        size: Optional[int] = None,
+        bucket_name: Optional[str] = None,
+        max_concurrency: int = 1,
+    ) -> str:
+        """
+        Upload a file to S3-compatible storage as a multipart upload, one part
+        per chunk, with public read access.
+
+        At most ``max_concurrency`` parts are uploaded at a time and a chunk
+        is only read once a part upload slot is free, so the memory held is
+        bounded by the chunk size rather than the file size. A file of a single
+        chunk is stored with one ``put_object``. Every chunk but the last one
+        must meet the 5MB minimum part size of S3.
+
+        :param filename: The name of the file to be uploaded
+        :param chunks: The binary content of the file, one part at a time
+        :param size: Total size of the file in bytes, if known
+        :param bucket_name: Optional bucket name, uses default if not provided
+        :param max_concurrency: Maximum number of parts uploaded concurrently
+        :return: The public download URL for the uploaded file
+        :raises CustomException: If file upload fails
+        """
+        if not bucket_name:
+            bucket_name = self.bucket_name
+
+        first = await anext(chunks, b"")
+        second = await anext(chunks, None)
+        if second is None:
+            return await self.upload_file_async(filename, first, bucket_name)
+
+        async def read_parts() -> AsyncIterator[bytes]:
+            yield first
+            yield second
+            async for chunk in chunks:
+                yield chunk
+
+        upload_id = ""
+        try:
+            upload = await asyncio.to_thread(
+                self.client.create_multipart_upload,
+                Bucket=bucket_name,
+                Key=filename,
+                ACL="public-read",
+            )
+            upload_id = upload["UploadId"]
+            parts = await self._upload_parts(
+                bucket_name, filename, upload_id, read_parts(), max_concurrency
+            )
+            await asyncio.to_thread(
+                self.client.complete_multipart_upload,
+                Bucket=bucket_name,
+                Key=filename,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+            return f"{self.oss_download_host}/{bucket_name}/{filename}"
+        except BaseException as e:
+            if upload_id:
+                await self._abort_multipart_upload(bucket_name, filename, upload_id)
+            if isinstance(e, CustomException) or not isinstance(e, Exception):
+                raise
+            raise CustomException(
+                CodeEnum.FILE_STORAGE_ERROR, cause_error=str(e)
+            ) from e
+
+    async def _upload_parts(
+        self,
+        bucket_name: str,
+        filename: str,
+        upload_id: str,
+        chunks: AsyncIterator[bytes],
+        max_concurrency: int,
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload chunks as the parts of a multipart upload, in order.
+
+        Parts still in flight are cancelled when reading or uploading fails.
+
+        :param bucket_name: Bucket of the upload
+        :param filename: Key of the upload
+        :param upload_id: ID of the multipart upload
+        :param chunks: Part bodies, one chunk per part
+        :param max_concurrency: Maximum number of parts uploaded concurrently
+        :return: Part numbers and ETags to complete the upload with
+        """
+        slots = asyncio.Semaphore(max(max_concurrency, 1))
+        tasks: List[asyncio.Task[Dict[str, Any]]] = []
+
+        async def upload_part(part_number: int, body: bytes) -> Dict[str, Any]:
+            try:
+                resp = await asyncio.to_thread(
+                    self.client.upload_part,
+                    Bucket=bucket_name,
+                    Key=filename,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return {"PartNumber": part_number, "ETag": resp["ETag"]}
+            finally:
+                slots.release()
+
+        try:
+            part_number = 0
+            async for chunk in chunks:
+                await slots.acquire()
+                # Stop reading as soon as a part failed
+                for task in tasks:
+                    if task.done():
+                        task.result()
+                part_number += 1
+                tasks.append(asyncio.create_task(upload_part(part_number, chunk)))
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def _abort_multipart_upload(
+        self, bucket_name: str, filename: str, upload_id: str
+    ) -> None:
+        """
+        Discard the parts of an unfinished multipart upload.
+
+        :param bucket_name: Bucket of the upload
+        :param filename: Key of the upload
+        :param upload_id: ID of the multipart upload
+        """
+        try:
+            await asyncio.to_thread(
+                self.client.abort_multipart_upload,
+                Bucket=bucket_name,
+                Key=filename,
+                UploadId=upload_id,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to abort multipart upload {upload_id}: {e}")
+
 
 class IFlyGatewayStorageClient(BaseOSSService, Service):
     """
@@ -271,6 +414,58 @@ class IFlyGatewayStorageClient(BaseOSSService, Service):
         :return: Temporary download link for the uploaded file
         :raises CustomException: If file upload fails or response is invalid
         """
+        return await self._post_async(filename, file_bytes, len(file_bytes))
+
+    async def upload_stream_async(
+        self,
+        filename: str,
+        chunks: AsyncIterator[bytes],
+        size: Optional[int] = None,
+        bucket_name: Optional[str] = None,
+        max_concurrency: int = 1,
+    ) -> str:
+        """
+        Upload a file to iFly Gateway Storage, sending the request body chunk
+        by chunk as it is read.
+
+        The gateway needs the length of the body up front, files of unknown
+        size are collected and uploaded at once.
+
+        :param filename: The name of the file to be uploaded
+        :param chunks: The binary content of the file, one chunk at a time
+        :param size: Total size of the file in bytes, if known
+        :param bucket_name: Optional bucket name, uses default if not provided
+        :param max_concurrency: Unused, the body is sent as a single request
+        :return: Temporary download link for the uploaded file
+        :raises CustomException: If file upload fails or response is invalid
+        """
+        if size is None:
+            return await super().upload_stream_async(filename, chunks, size)
+        # Reading the first chunk validates the file before the request opens
+        first = await anext(chunks, b"")
+
+        async def read_chunks() -> AsyncIterator[bytes]:
+            yield first
+            async for chunk in chunks:
+                yield chunk
+
+        return await self._post_async(filename, read_chunks(), size)
+
+    async def _post_async(
+        self,
+        filename: str,
+        data: bytes | AsyncIterator[bytes],
+        content_length: int,
+    ) -> str:
+        """
+        Post a file body to iFly Gateway Storage and return its download link.
+
+        :param filename: The name of the file to be uploaded
+        :param data: The file body, as bytes or as chunks to send one by one
+        :param content_length: Size of the file body in bytes
+        :return: Temporary download link for the uploaded file
+        :raises CustomException: If file upload fails or response is invalid
+        """
         session = HttpClient.get_session()
         url = f"{self.endpoint}/api/v1/{self.bucket_name}"
         params = {
@@ -287,9 +482,9 @@ class IFlyGatewayStorageClient(BaseOSSService, Service):
             api_secret=self.access_key_secret,
         )
         headers["X-TTL"] = str(self.ttl)
-        headers["Content-Length"] = str(len(file_bytes))
+        headers["Content-Length"] = str(content_length)
         try:
-            async with session.post(url, headers=headers, data=file_bytes) as resp:
+            async with session.post(url, headers=headers, data=data) as resp:
                 response_text = await resp.text()
                 if resp.status != 200:
                     raise CustomException(
@@ -327,6 +522,8 @@ class IFlyGatewayStorageClient(BaseOSSService, Service):
 
                 return link
 
+        except CustomException:
+            raise
         except Exception as e:
             logger.error(e)
             raise CustomException(
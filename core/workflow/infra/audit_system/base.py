@@ -8,12 +8,13 @@ the audit system for content processing, validation, and result management.
 import asyncio
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from workflow.exception.e import CustomException
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.audit_system.audit_api.base import ContentType, ContextList, Stage
 from workflow.infra.audit_system.enums import Status
+from workflow.infra.audit_system.utils import Sentence
 
 
 class BaseFrameAudit(BaseModel):
@@ -113,8 +114,12 @@ class AuditContext(BaseModel):
     # Whether blocked by sensitive words in a frame
     frame_blocked: bool = False
 
-    # Content pending audit
-    remaining_content: str = ""
+    # Content pending audit, kept as chunks until it is needed as a whole.
+    # Its length and whether it holds an ending symbol are tracked as content
+    # arrives, so each frame only scans its own characters.
+    _remaining_chunks: list[str] = PrivateAttr(default_factory=list)
+    _remaining_len: int = PrivateAttr(default=0)
+    _remaining_has_end_symbol: bool = PrivateAttr(default=False)
 
     # All audit data
     all_content_frame_ids: list[str] = Field(default_factory=list)
@@ -134,6 +139,59 @@ class AuditContext(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    @property
+    def remaining_content(self) -> str:
+        """
+        Content pending audit.
+
+        :return: The pending content as one string
+        """
+        if len(self._remaining_chunks) > 1:
+            self._remaining_chunks = ["".join(self._remaining_chunks)]
+        return self._remaining_chunks[0] if self._remaining_chunks else ""
+
+    @remaining_content.setter
+    def remaining_content(self, content: str) -> None:
+        """
+        Replace the content pending audit.
+
+        :param content: New pending content
+        """
+        self._remaining_chunks = [content] if content else []
+        self._remaining_len = len(content)
+        self._remaining_has_end_symbol = Sentence.has_end_symbol(content)
+
+    @property
+    def remaining_content_len(self) -> int:
+        """
+        Length of the content pending audit.
+
+        :return: Number of pending characters
+        """
+        return self._remaining_len
+
+    @property
+    def remaining_has_end_symbol(self) -> bool:
+        """
+        Whether the content pending audit contains an ending punctuation mark.
+
+        :return: True if a sentence can be split off by ending punctuation
+        """
+        return self._remaining_has_end_symbol
+
+    def append_remaining_content(self, content: str) -> None:
+        """
+        Append frame content to the content pending audit.
+
+        :param content: Frame content to append
+        """
+        if not content:
+            return
+        self._remaining_chunks.append(content)
+        self._remaining_len += len(content)
+        if not self._remaining_has_end_symbol:
+            self._remaining_has_end_symbol = Sentence.has_end_symbol(content)
+
     def add_source_content(self, output_frame: OutputFrameAudit) -> None:
         """
         Add original frame content to the audit context.
@@ -159,25 +217,24 @@ class AuditContext(BaseModel):
         :param span: Span object for tracking request context information and logging
         """
         is_all_consumer = True
+        # Consume audited content by offset and trim it once at the end
+        offset = 0
         for idx, frame_id in enumerate(self.audited_content_frame_ids):
             output_frame_audit = self.all_source_frames[frame_id]
-            if (
-                output_frame_audit.content
-                == self.audited_content[: len(output_frame_audit.content)]
-            ):
+            if self.audited_content.startswith(output_frame_audit.content, offset):
                 if output_frame_audit.frame_id not in self.frame_ids_on_screen:
                     frame_audit_result = FrameAuditResult(
                         content=output_frame_audit.content,
                         source_frame=output_frame_audit.source_frame,
                     )
                     await self.output_queue_put(frame_audit_result, span)
-                self.audited_content = self.audited_content[
-                    len(output_frame_audit.content) :
-                ]
+                offset += len(output_frame_audit.content)
             else:
                 self.audited_content_frame_ids = self.audited_content_frame_ids[idx:]
                 is_all_consumer = False
                 break
+        if offset:
+            self.audited_content = self.audited_content[offset:]
         if is_all_consumer:
             self.audited_content_frame_ids = []
 
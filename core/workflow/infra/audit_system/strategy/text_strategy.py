@@ -1,11 +1,14 @@
 import asyncio
-from typing import Literal, cast
+from typing import List, Literal, Optional
 
+from pydantic import BaseModel
+
+from workflow.configs import workflow_config
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.trace.span import Span
 
-from ..audit_api.base import ContentType, Stage
+from ..audit_api.base import AuditAPI, ContentType, Stage
 from ..base import FrameAuditResult, InputFrameAudit, OutputFrameAudit
 from ..enums import Status
 from ..strategy.base_strategy import AuditStrategy
@@ -14,14 +17,55 @@ from ..utils import ALL_SENTENCE_LEN, Sentence
 WORKFLOW_MAX_SENTENCE_LEN = 1500
 
 
+class SentenceAudit(BaseModel):
+    """
+    A complete sentence waiting in the audit window.
+    """
+
+    stage: Stage  # Stage reported to the audit API
+    content: str
+    status: Status = Status.NONE
+    is_stage_end: Literal[0, 1] = 0
+    is_end: Literal[0, 1] = 0
+
+
 class TextAuditStrategy(AuditStrategy):
     """
     Text audit strategy implementation including frame audit and first sentence audit.
 
     This strategy handles text content review for both input and output frames,
     supporting different audit modes based on content characteristics.
+
+    Complete sentences are collected into a window that is submitted as one
+    audit call once it holds ``AUDIT_BATCH_MAX_SENTENCES`` sentences, once
+    ``AUDIT_BATCH_WINDOW`` seconds have passed, or when a stage ends. Windows
+    are audited concurrently while later frames keep arriving, and their
+    frames are released strictly in order as each window clears.
     """
 
+    def __init__(
+        self,
+        chat_sid: str,
+        audit_apis: List[AuditAPI],
+        template_id: str = "",
+        chat_app_id: str = "",
+        uid: str = "",
+    ) -> None:
+        super().__init__(
+            chat_sid=chat_sid,
+            audit_apis=audit_apis,
+            template_id=template_id,
+            chat_app_id=chat_app_id,
+            uid=uid,
+        )
+        self.batch_max_sentences = workflow_config.audit_batch_config.max_sentences
+        self.batch_window = workflow_config.audit_batch_config.window
+        self._window: List[SentenceAudit] = []
+        self._window_len = 0
+        self._window_timer: Optional[asyncio.TimerHandle] = None
+        # Release of the most recently submitted window, later windows wait on it
+        self._last_release: Optional[asyncio.Task] = None
+
     async def input_review(self, input_frame: InputFrameAudit, span: Span) -> None:
         """
         Input content review logic for text content.
@@ -59,7 +103,7 @@ class TextAuditStrategy(AuditStrategy):
             self.context.last_content_stage = output_frame.stage
 
         if self.context.last_content_stage == output_frame.stage:
-            self.context.remaining_content += output_frame.content
+            self.context.append_remaining_content(output_frame.content)
 
         self.context.add_source_content(output_frame)
 
@@ -99,8 +143,8 @@ class TextAuditStrategy(AuditStrategy):
         # First sentence judgment conditions: has ending punctuation, or content length exceeds threshold,
         # or current frame audit stage differs from last audit stage
         first_sentence_conditions = (
-            Sentence.has_end_symbol(self.context.remaining_content)
-            or len(self.context.remaining_content) > WORKFLOW_MAX_SENTENCE_LEN
+            self.context.remaining_has_end_symbol
+            or self.context.remaining_content_len > WORKFLOW_MAX_SENTENCE_LEN
             or self.context.last_content_stage != output_frame.stage
             or output_frame.status == Status.STOP
         )
@@ -214,8 +258,8 @@ class TextAuditStrategy(AuditStrategy):
 
         # Audit content
         if (
-            Sentence.has_end_symbol(self.context.remaining_content)
-            or len(self.context.remaining_content) > WORKFLOW_MAX_SENTENCE_LEN
+            self.context.remaining_has_end_symbol
+            or self.context.remaining_content_len > WORKFLOW_MAX_SENTENCE_LEN
             or self.context.last_content_stage != output_frame.stage
             or output_frame.status == Status.STOP
         ):
@@ -269,114 +313,186 @@ class TextAuditStrategy(AuditStrategy):
         self, sentences: list[str], output_frame: OutputFrameAudit, span: Span
     ) -> None:
         """
-        Asynchronous text output audit API call.
+        Submit complete sentences to the audit window.
+
+        The audit flags of each sentence are resolved now, because the stage
+        bookkeeping moves on before the window is audited.
 
         :param sentences: List of sentences to be audited
         :param output_frame: Current frame information
         :param span: Span object for tracking request context information
         :return: None
         """
-        current_status = output_frame.status
-        pindex = self.context.pindex
-        audit_tasks = []
+        if not sentences:
+            return
 
         for idx, sentence in enumerate(sentences):
             # If current frame is end frame, then the last sentence needs to be marked as end frame
-            if current_status == Status.STOP:
-                output_frame.status = (
-                    Status.STOP if idx == len(sentences) - 1 else Status.NONE
-                )
+            status = output_frame.status
+            if status == Status.STOP and idx != len(sentences) - 1:
+                status = Status.NONE
+            sentence_audit = self._build_sentence_audit(
+                output_frame.stage, sentence, status
+            )
+            if self._window and (
+                self._window[0].stage != sentence_audit.stage
+                or self._window_len + len(sentence) > WORKFLOW_MAX_SENTENCE_LEN
+            ):
+                self._flush_window(span)
+            self._window.append(sentence_audit)
+            self._window_len += len(sentence)
+            if len(self._window) >= self.batch_max_sentences:
+                self._flush_window(span)
 
-            audit_tasks.append(
-                asyncio.create_task(
-                    self._audit_api_output_text(
-                        output_frame.stage,
-                        sentence,
-                        span,
-                        pindex + idx + 1,
-                        current_status=output_frame.status,
-                    ),
-                )
+        if not self._window:
+            return
+        last = self._window[-1]
+        if last.is_stage_end or last.is_end or self.batch_window <= 0:
+            self._flush_window(span)
+        elif self._window_timer is None:
+            self._window_timer = asyncio.get_running_loop().call_later(
+                self.batch_window, self._flush_window, span
+            )
+
+    async def wait_audited(self, span: Span) -> None:
+        """
+        Submit the open window and wait until every submitted window is released.
+
+        :param span: Span object for tracking request context information
+        :return: None
+        """
+        self._flush_window(span)
+        if self._last_release is not None:
+            await self._last_release
+
+    def _build_sentence_audit(
+        self, current_stage: Stage, content: str, current_status: Status
+    ) -> SentenceAudit:
+        """
+        Resolve the audit flags of a complete sentence.
+
+        :param current_stage: Stage of the frame that completed the sentence
+        :param content: Sentence content
+        :param current_status: Status of the sentence
+        :return: Sentence with its audit stage and end flags
+        """
+        last_content_stage = self.context.last_content_stage or current_stage
+        if last_content_stage == current_stage:
+            is_end: Literal[0, 1] = 1 if current_status == Status.STOP else 0
+            is_stage_end: Literal[0, 1] = is_end
+        else:
+            is_end = 0
+            is_stage_end = 1
+        return SentenceAudit(
+            stage=last_content_stage,
+            content=content,
+            status=current_status,
+            is_stage_end=is_stage_end,
+            is_end=is_end,
+        )
+
+    def _flush_window(self, span: Span) -> None:
+        """
+        Submit the open window as one audit call.
+
+        :param span: Span object for tracking request context information
+        :return: None
+        """
+        if self._window_timer is not None:
+            self._window_timer.cancel()
+            self._window_timer = None
+        if not self._window:
+            return
+        window, self._window, self._window_len = self._window, [], 0
+        self.context.pindex += 1
+        self._last_release = asyncio.create_task(
+            self._audit_window(window, self.context.pindex, self._last_release, span)
+        )
+
+    async def _audit_window(
+        self,
+        window: List[SentenceAudit],
+        pindex: int,
+        previous: Optional[asyncio.Task],
+        span: Span,
+    ) -> None:
+        """
+        Audit a window and release its frames after every earlier window.
+
+        :param window: Sentences submitted together
+        :param pindex: Position index of the window
+        :param previous: Release of the previously submitted window
+        :param span: Span object for tracking request context information
+        :return: None
+        """
+        content = "".join(sentence_audit.content for sentence_audit in window)
+        last = window[-1]
+        with span.start("text_audit_strategy.audit_window") as window_span:
+            error = await self._audit_api_output_text(
+                last, content, window_span, pindex
             )
-        _ = await asyncio.gather(*audit_tasks)
-        self.context.pindex += len(sentences)
-        self.context.audited_content += "".join(sentences)
-        for _ in range(len(sentences)):
-            await self.context.add_audited_content(span)
+            if previous is not None:
+                await previous
+            if self.context.error:
+                return
+            if error:
+                self.context.error = error
+                await self.context.output_queue_put(
+                    FrameAuditResult(content=content, status=last.status, error=error),
+                    window_span,
+                )
+                return
+            # One pass releases every frame the window completes
+            self.context.audited_content += content
+            await self.context.add_audited_content(window_span)
 
     async def _audit_api_output_text(
         self,
-        current_stage: Stage,
+        sentence_audit: SentenceAudit,
         need_audit_content: str,
         span: Span,
         pindex: int,
-        current_status: Status = Status.NONE,
-    ) -> None:
+    ) -> Optional[CustomException]:
         """
         Text output audit API call.
 
-        :param current_stage: Current audit stage
+        :param sentence_audit: Last sentence of the window, carrying its flags
         :param need_audit_content: Content that needs to be audited
         :param span: Span object for tracking request context information
         :param pindex: Position index for the content
-        :param current_status: Current status of the frame
-        :return: None
+        :return: The audit error, or None if the content passed
         """
         if self.context.error:
             await span.add_info_event_async(
                 f"Audit context error: {self.context.error}, subsequent frames will not be audited"
             )
-            return
+            return None
 
         await span.add_info_event_async(f"Current audit content: {need_audit_content}")
-        frame_audit_result = FrameAuditResult(
-            content=need_audit_content, status=current_status
-        )
-
-        is_end: Literal[0, 1] = 0
-        is_stage_end: Literal[0, 1] = 0
-
-        if self.context.last_content_stage == current_stage:
-            is_end = 1 if current_status == Status.STOP else 0
-
-            if current_status == Status.STOP:
-                is_stage_end = 1
-
-        if self.context.last_content_stage != current_stage:
-            is_stage_end = 1
 
         try:
             for audit_api in self.audit_apis:
                 await span.add_info_event_async(
                     f"Current audit API: {audit_api.audit_name}"
                 )
-                last_content_stage = cast(Stage, self.context.last_content_stage)
                 await audit_api.output_text(
-                    stage=(
-                        current_stage
-                        if last_content_stage == current_stage
-                        else last_content_stage
-                    ),
+                    stage=sentence_audit.stage,
                     content=need_audit_content,
                     pindex=pindex,
                     span=span,
                     is_pending=0,  # First sentence audit does not need to be marked as incomplete
-                    is_stage_end=is_stage_end,
-                    is_end=is_end,
+                    is_stage_end=sentence_audit.is_stage_end,
+                    is_end=sentence_audit.is_end,
                     chat_sid=self.context.chat_sid,
                     chat_app_id=self.context.chat_app_id,
                     uid=self.context.uid,
                 )
         except CustomException as e:
-            frame_audit_result.error = e
             span.add_error_event(f"Audit API call exception: {str(e)}")
-            await self.context.output_queue_put(frame_audit_result, span)
+            return e
         except Exception as e:
             span.add_error_event(f"Audit API call exception: {str(e)}")
-            frame_audit_result.error = CustomException(
+            return CustomException(
                 CodeEnum.AUDIT_ERROR, cause_error=f"Audit result exception: {str(e)}"
             )
-            await self.context.output_queue_put(frame_audit_result, span)
-        finally:
-            if frame_audit_result.error:
-                self.context.error = frame_audit_result.error
+        return None
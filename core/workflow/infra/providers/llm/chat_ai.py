@@ -7,6 +7,7 @@ from pydantic import BaseModel, Field
 from workflow.engine.nodes.entities.llm_response import LLMResponse
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
+from workflow.infra.providers.llm.rate_scheduler import provider_key
 
 
 class ChatAI(abc.ABC, BaseModel):
@@ -33,6 +34,14 @@ class ChatAI(abc.ABC, BaseModel):
 
     model_config = {"arbitrary_types_allowed": True, "protected_namespaces": ()}
 
+    def rate_limit_key(self) -> str:
+        """
+        Identify the provider budget this model's calls are counted against.
+
+        :return: Key combining the endpoint, the model and the credentials
+        """
+        return provider_key(self.model_url, self.model_name, self.app_id, self.api_key)
+
     @abc.abstractmethod
     def token_calculation(self, text: str) -> int:
         """
@@ -18,6 +18,7 @@ from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.iflytek_spark.schemas import Function, SparkAiMessage
 from workflow.infra.providers.llm.iflytek_spark.spark_chat_auth import SparkChatHmacAuth
+from workflow.infra.providers.llm.rate_scheduler import llm_scheduler, provider_key
 
 
 class SparkFunctionCallAi(BaseModel):
@@ -44,6 +45,14 @@ class SparkFunctionCallAi(BaseModel):
 
     model_config = {"arbitrary_types_allowed": True, "protected_namespaces": ()}
 
+    def rate_limit_key(self) -> str:
+        """
+        Identify the provider budget this model's calls are counted against.
+
+        :return: Key combining the endpoint, the model and the credentials
+        """
+        return provider_key(self.model_url, self.model_name, self.app_id, self.api_key)
+
     async def assemble_url(self, span: Span) -> str:
         """
         Assemble the authenticated URL for Spark Function Call API.
@@ -222,6 +231,19 @@ class SparkFunctionCallAi(BaseModel):
         if event_log_node_trace:
             event_log_node_trace.append_config_data(json.loads(payload))
 
+        # Function calls share the provider budget with chat calls
+        async with llm_scheduler.slot(self.rate_limit_key(), span.app_id):
+            return await self._call(url, payload, span)
+
+    async def _call(self, url: str, payload: str, span: Span) -> tuple[str, dict, str]:
+        """
+        Send a function call request and receive its result.
+
+        :param url: Authenticated WebSocket URL
+        :param payload: Serialized request payload
+        :param span: Tracing span for logging
+        :return: Tuple containing (function_name, token_usage, arguments)
+        """
         try:
             async with websockets.connect(
                 url, ping_interval=None, ping_timeout=None
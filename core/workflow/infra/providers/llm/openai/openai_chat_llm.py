@@ -16,6 +16,7 @@ from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.log_trace.node_log import NodeLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.infra.providers.llm.chat_ai import ChatAI
+from workflow.infra.providers.llm.rate_scheduler import llm_scheduler
 
 
 class OpenAIChatAI(ChatAI):
@@ -108,7 +109,7 @@ class OpenAIChatAI(ChatAI):
         :raises CustomException: If request times out or fails
         """
         # Initialize OpenAI async client
-        from openai import AsyncOpenAI  # type: ignore
+        from openai import AsyncOpenAI, RateLimitError  # type: ignore
 
         aclient = AsyncOpenAI(
             api_key=self.api_key,
@@ -116,13 +117,23 @@ class OpenAIChatAI(ChatAI):
         )
         stream = None
         try:
-            # Create streaming chat completion
-            stream = await aclient.chat.completions.create(
-                model=self.model_name,
-                messages=user_message,
-                stream=True,
-                **extra_params,
-            )
+            # Create streaming chat completion, keeping the response headers
+            # so the provider's rate-limit budget can be tracked
+            try:
+                raw_response = await aclient.chat.completions.with_raw_response.create(
+                    model=self.model_name,
+                    messages=user_message,
+                    stream=True,
+                    **extra_params,
+                )
+            except RateLimitError as e:
+                llm_scheduler.update_limits(self.rate_limit_key(), e.response.headers)
+                raise CustomException(
+                    CodeEnum.LLM_RATE_LIMIT_ERROR,
+                    cause_error=f"{e}",
+                ) from e
+            llm_scheduler.update_limits(self.rate_limit_key(), raw_response.headers)
+            stream = raw_response.parse()
 
             async for response in self._process_stream(stream, span, timeout):
                 yield response
@@ -0,0 +1,306 @@
+"""
+Provider-aware scheduling of LLM calls.
+
+All LLM calls of a worker that draw from the same provider budget (model
+endpoint, model and credentials) go through one scheduler state. Its
+concurrency limit adapts to the provider: it is halved whenever the provider
+throttles a call and grows back slowly while calls succeed. Throttling
+responses and exhausted rate-limit headers also pause the provider until the
+advertised reset time. Calls that cannot start are queued and served
+round-robin across apps, so one busy app cannot starve the others and retries
+wait for capacity instead of being sent to fail again.
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Mapping, Optional
+
+from workflow.configs import workflow_config
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+
+# Error codes meaning the provider throttled the call
+THROTTLE_CODES = frozenset(
+    {
+        CodeEnum.SPARK_TRAFFIC_LIMIT_ERROR.code,
+        CodeEnum.SPARK_BUSY_ERROR.code,
+        CodeEnum.SPARK_SECOND_LIMIT_ERROR.code,
+        CodeEnum.SPARK_CONCURRENCY_LIMIT_ERROR.code,
+        CodeEnum.LLM_RATE_LIMIT_ERROR.code,
+    }
+)
+
+# Components of rate-limit reset durations such as "1s", "6m0s" or "20ms"
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a rate-limit header duration.
+
+    :param value: Plain seconds or a duration such as "6m0s"
+    :return: Duration in seconds, or None if it cannot be parsed
+    """
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def provider_key(model_url: str, model_name: str, app_id: str, api_key: str) -> str:
+    """
+    Identify the provider budget calls with these settings are counted against.
+
+    :param model_url: Model endpoint
+    :param model_name: Model name
+    :param app_id: App ID of the credentials
+    :param api_key: API key of the credentials
+    :return: Key combining the endpoint, the model and the credentials
+    """
+    credential = hashlib.sha256(f"{app_id}:{api_key}".encode("utf-8")).hexdigest()[:16]
+    return f"{model_url}|{model_name}|{credential}"
+
+
+class _ProviderState:
+    """
+    Scheduling state of one provider budget.
+    """
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.inflight = 0
+        # Monotonic time before which no call may start
+        self.resume_at = 0.0
+        # Waiting calls per app, in the order apps are served
+        self.waiters: "OrderedDict[str, Deque[asyncio.Future[None]]]" = OrderedDict()
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class ProviderRateScheduler:
+    """
+    Per-process scheduler for LLM calls.
+
+    Every successful ``acquire`` must be paired with a ``release`` of the same
+    provider key.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_wait: float = 30.0,
+        cooldown: float = 1.0,
+        token_reserve: int = 0,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        :param max_concurrency: Concurrent calls allowed per provider budget,
+                                0 disables scheduling
+        :param max_wait: Seconds a call waits for capacity before it fails
+        :param cooldown: Seconds a provider is paused after a throttled call
+                         that did not say when to retry
+        :param token_reserve: Remaining token budget below which a provider is
+                              paused until its token window resets
+        """
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self.cooldown = cooldown
+        self.token_reserve = token_reserve
+        self._providers: Dict[str, _ProviderState] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether LLM calls are scheduled.
+        """
+        return self.max_concurrency > 0
+
+    def _state(self, provider: str) -> _ProviderState:
+        state = self._providers.get(provider)
+        if state is None:
+            state = _ProviderState(float(self.max_concurrency))
+            self._providers[provider] = state
+        return state
+
+    @staticmethod
+    def _can_start(state: _ProviderState) -> bool:
+        return time.monotonic() >= state.resume_at and state.inflight < int(state.limit)
+
+    async def acquire(self, provider: str, app_id: str) -> None:
+        """
+        Wait until a call to the provider may start.
+
+        :param provider: Provider budget key
+        :param app_id: App the call is made for
+        :raises CustomException: If no capacity frees up within the wait limit
+        """
+        if not self.enabled:
+            return
+        state = self._state(provider)
+        if not state.waiters and self._can_start(state):
+            state.inflight += 1
+            return
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        state.waiters.setdefault(app_id, deque()).append(waiter)
+        self._dispatch(provider)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.max_wait)
+        except asyncio.TimeoutError:
+            self._withdraw(provider, app_id, waiter)
+            raise CustomException(
+                CodeEnum.LLM_RATE_LIMIT_ERROR,
+                cause_error=f"no capacity for {self.max_wait}s",
+            )
+        except asyncio.CancelledError:
+            self._withdraw(provider, app_id, waiter)
+            raise
+
+    @asynccontextmanager
+    async def slot(self, provider: str, app_id: str) -> AsyncIterator[None]:
+        """
+        Hold capacity of the provider for the duration of a call.
+
+        A call failing with a throttling error code halves the provider limit.
+
+        :param provider: Provider budget key
+        :param app_id: App the call is made for
+        :raises CustomException: If no capacity frees up within the wait limit
+        """
+        await self.acquire(provider, app_id)
+        throttled = False
+        try:
+            yield
+        except CustomException as e:
+            throttled = e.code in THROTTLE_CODES
+            raise
+        finally:
+            self.release(provider, throttled=throttled)
+
+    def release(
+        self, provider: str, throttled: bool = False, retry_after: float = 0
+    ) -> None:
+        """
+        Finish a call and adapt the provider limit to its outcome.
+
+        :param provider: Provider budget key
+        :param throttled: Whether the provider throttled the call
+        :param retry_after: Seconds the provider asked to wait before retrying
+        """
+        if not self.enabled:
+            return
+        state = self._state(provider)
+        state.inflight = max(0, state.inflight - 1)
+        if throttled:
+            state.limit = max(1.0, state.limit / 2)
+            self.pause(provider, retry_after or self.cooldown)
+        else:
+            state.limit = min(
+                float(self.max_concurrency), state.limit + 1 / max(1.0, state.limit)
+            )
+        self._dispatch(provider)
+
+    def pause(self, provider: str, seconds: float) -> None:
+        """
+        Keep new calls to the provider from starting for a while.
+
+        :param provider: Provider budget key
+        :param seconds: Pause duration in seconds
+        """
+        if not self.enabled or seconds <= 0:
+            return
+        state = self._state(provider)
+        state.resume_at = max(state.resume_at, time.monotonic() + seconds)
+
+    def update_limits(self, provider: str, headers: Mapping[str, str]) -> None:
+        """
+        Pause the provider when its rate-limit headers report an exhausted budget.
+
+        :param provider: Provider budget key
+        :param headers: Response headers of a provider call
+        """
+        if not self.enabled:
+            return
+        retry_after = parse_duration(headers.get("retry-after"))
+        if retry_after:
+            self.pause(provider, retry_after)
+        budgets = (
+            ("x-ratelimit-remaining-requests", "x-ratelimit-reset-requests", 1),
+            (
+                "x-ratelimit-remaining-tokens",
+                "x-ratelimit-reset-tokens",
+                max(1, self.token_reserve),
+            ),
+        )
+        for remaining_header, reset_header, reserve in budgets:
+            try:
+                remaining = int(headers.get(remaining_header, ""))
+            except ValueError:
+                continue
+            if remaining < reserve:
+                self.pause(
+                    provider, parse_duration(headers.get(reset_header)) or self.cooldown
+                )
+
+    def _dispatch(self, provider: str) -> None:
+        """
+        Start waiting calls round-robin across apps while capacity allows.
+        """
+        state = self._state(provider)
+        while state.waiters and self._can_start(state):
+            app_id, queue = next(iter(state.waiters.items()))
+            waiter = queue.popleft()
+            if queue:
+                state.waiters.move_to_end(app_id)
+            else:
+                del state.waiters[app_id]
+            if waiter.done():
+                continue
+            state.inflight += 1
+            waiter.set_result(None)
+
+        delay = state.resume_at - time.monotonic()
+        if state.waiters and delay > 0 and state.timer is None:
+            state.timer = asyncio.get_running_loop().call_later(
+                delay, self._resume, provider
+            )
+
+    def _resume(self, provider: str) -> None:
+        self._state(provider).timer = None
+        self._dispatch(provider)
+
+    def _withdraw(
+        self, provider: str, app_id: str, waiter: "asyncio.Future[None]"
+    ) -> None:
+        """
+        Drop a waiting call, giving back capacity it was granted meanwhile.
+        """
+        state = self._state(provider)
+        queue = state.waiters.get(app_id)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            if not queue:
+                del state.waiters[app_id]
+        elif waiter.done() and not waiter.cancelled():
+            state.inflight = max(0, state.inflight - 1)
+            self._dispatch(provider)
+
+
+# Scheduler shared by every LLM call of this worker
+llm_scheduler = ProviderRateScheduler(
+    max_concurrency=workflow_config.llm_rate_limit_config.max_concurrency,
+    max_wait=workflow_config.llm_rate_limit_config.max_wait,
+    cooldown=workflow_config.llm_rate_limit_config.cooldown,
+    token_reserve=workflow_config.llm_rate_limit_config.token_reserve,
+)
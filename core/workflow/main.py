@@ -30,6 +30,8 @@ from workflow.extensions.fastapi.middleware.auth import AuthMiddleware
 from workflow.extensions.fastapi.middleware.otlp import OtlpMiddleware
 from workflow.extensions.graceful_shutdown.graceful_shutdown import GracefulShutdown
 from workflow.extensions.middleware.initialize import initialize_services
+from workflow.service.history_service import HistoryWriter
+from workflow.service.warm_start_service import flush_requests, warm_start
 
 
 def create_app() -> FastAPI:
@@ -55,6 +57,12 @@ def create_app() -> FastAPI:
         # Initialize the http connection pool when the entire service starts
         await HttpClient.setup()
 
+        # Start the background writer that batches chat history inserts
+        await HistoryWriter.setup()
+
+        # Prepare the most requested flows before the worker accepts requests
+        await warm_start()
+
         await print_routes(app)
 
         print("🚀 FastAPI service started successfully!")
@@ -63,9 +71,14 @@ def create_app() -> FastAPI:
 
         # Destroy the http connection pool when the service stops
         await HttpClient.close()
+        await AuthMiddleware.close()
 
         # Exit gracefully
         async def do_final_shutdown_logic() -> None:
+            # Flush history produced by the chats that just finished
+            await HistoryWriter.close()
+            # Keep the traffic counted since the last flush for later warm starts
+            await flush_requests()
             print("🧹 Final shutdown hook executed.")
 
         await GracefulShutdown(
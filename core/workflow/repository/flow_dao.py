@@ -6,28 +6,24 @@ handling flow retrieval and data transformation operations.
 """
 
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-from sqlalchemy import text
+from sqlalchemy import Row, TextClause, text
 from sqlmodel import Session  # type: ignore
+from sqlmodel.ext.asyncio.session import AsyncSession  # type: ignore
 
 from workflow.domain.models.flow import Flow
 
 
-def get_latest_published_flow_by(
-    flow_group_id: int, session: Session, version: str = ""
-) -> Flow | None:
+def _latest_published_flow_stmt(
+    flow_group_id: int, version: str = ""
+) -> Tuple[TextClause, Dict[str, Any]]:
     """
-    Retrieve the latest published flow by group ID and optional version.
-
-    This function queries the database for the most recent published flow
-    based on the flow group ID. It supports filtering by specific version
-    and orders results by semantic versioning (major.minor format).
+    Build the latest published flow query and its parameters.
 
     :param flow_group_id: The unique identifier for the flow group
-    :param session: Database session for executing queries
     :param version: Optional version filter (e.g., "1.0", "2.1")
-    :return: Flow object if found, None otherwise
+    :return: Tuple of (SQL statement, query parameters)
     """
     # Build WHERE clause for published flows (release_status bitwise check)
     sql_where = "group_id = :group_id " "AND (release_status & :release_status) > 0 "
@@ -55,11 +51,16 @@ def get_latest_published_flow_by(
     params: Dict[str, Any] = {"group_id": flow_group_id, "release_status": 1 | 4}
     if version:
         params.update({"version": version})
+    return stmt, params
 
-    # Execute query and get first result
-    result = session.execute(stmt, params)
-    row = result.first()
 
+def _row_to_flow(row: Optional[Row]) -> Flow | None:
+    """
+    Convert a raw flow row into a Flow object.
+
+    :param row: Database row, or None
+    :return: Flow object if the row exists, None otherwise
+    """
     if row:
         # Convert database row to Flow object
         flow = Flow(**dict(row._mapping))
@@ -72,3 +73,41 @@ def get_latest_published_flow_by(
         return flow
 
     return None
+
+
+def get_latest_published_flow_by(
+    flow_group_id: int, session: Session, version: str = ""
+) -> Flow | None:
+    """
+    Retrieve the latest published flow by group ID and optional version.
+
+    This function queries the database for the most recent published flow
+    based on the flow group ID. It supports filtering by specific version
+    and orders results by semantic versioning (major.minor format).
+
+    :param flow_group_id: The unique identifier for the flow group
+    :param session: Database session for executing queries
+    :param version: Optional version filter (e.g., "1.0", "2.1")
+    :return: Flow object if found, None otherwise
+    """
+    stmt, params = _latest_published_flow_stmt(flow_group_id, version)
+
+    # Execute query and get first result
+    result = session.execute(stmt, params)
+    return _row_to_flow(result.first())
+
+
+async def get_latest_published_flow_by_async(
+    flow_group_id: int, session: AsyncSession, version: str = ""
+) -> Flow | None:
+    """
+    Retrieve the latest published flow by group ID through an async session.
+
+    :param flow_group_id: The unique identifier for the flow group
+    :param session: Async database session for executing queries
+    :param version: Optional version filter (e.g., "1.0", "2.1")
+    :return: Flow object if found, None otherwise
+    """
+    stmt, params = _latest_published_flow_stmt(flow_group_id, version)
+    result = await session.exec(stmt, params=params)  # type: ignore[call-overload]
+    return _row_to_flow(result.first())
@@ -7,9 +7,21 @@ handling license retrieval operations through app and flow group relationships.
 
 from sqlalchemy import text
 from sqlmodel import Session  # type: ignore
+from sqlmodel.ext.asyncio.session import AsyncSession  # type: ignore
 
 from workflow.domain.models.license import License
 
+# Find the license of an app (by alias) for a flow group
+_GET_BY_SQL = text(
+    """
+        SELECT license.*
+        FROM app
+        JOIN license ON app.id = license.app_id
+        WHERE app.alias_id = :alias_id AND license.group_id = :group_id
+        LIMIT 1;
+    """
+)
+
 
 def get_by(flow_group_id: int, app_alias_id: str, session: Session) -> License | None:
     """
@@ -25,15 +37,7 @@ def get_by(flow_group_id: int, app_alias_id: str, session: Session) -> License |
     """
     # Execute JOIN query to find license by app alias and flow group
     result = session.execute(
-        text(
-            """
-                SELECT license.*
-                FROM app
-                JOIN license ON app.id = license.app_id
-                WHERE app.alias_id = :alias_id AND license.group_id = :group_id
-                LIMIT 1;
-            """
-        ),
+        _GET_BY_SQL,
         {"alias_id": app_alias_id, "group_id": flow_group_id},
     )
 
@@ -43,3 +47,25 @@ def get_by(flow_group_id: int, app_alias_id: str, session: Session) -> License |
         # Convert database row to License object
         return License(**dict(row._mapping))
     return None
+
+
+async def get_by_async(
+    flow_group_id: int, app_alias_id: str, session: AsyncSession
+) -> License | None:
+    """
+    Retrieve license information by flow group ID and app alias ID through an
+    async session.
+
+    :param flow_group_id: The unique identifier for the flow group
+    :param app_alias_id: The alias identifier for the application
+    :param session: Async database session for executing queries
+    :return: License object if found, None otherwise
+    """
+    result = await session.exec(
+        _GET_BY_SQL,  # type: ignore[call-overload]
+        params={"alias_id": app_alias_id, "group_id": flow_group_id},
+    )
+    row = result.first()
+    if row:
+        return License(**dict(row._mapping))
+    return None
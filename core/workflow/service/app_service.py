@@ -1,15 +1,29 @@
 import json
 import os
+from typing import Optional
 
 from common.utils.hmac_auth import HMACAuth
-from sqlmodel import Session  # type: ignore
+from sqlmodel import Session, select  # type: ignore
+from sqlmodel.ext.asyncio.session import AsyncSession  # type: ignore
+from sqlmodel.sql.expression import SelectOfScalar  # type: ignore
 
 from workflow.cache.app import get_app_by_app_id, set_app_by_app_id
+from workflow.configs import workflow_config
 from workflow.domain.models.ai_app import App
 from workflow.domain.models.app_source import AppSource
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.trace.span import Span
+from workflow.utils.cache import SingleFlight, TTLCache
+
+# app_id -> in-flight database or management platform lookup
+_app_info_flight: SingleFlight[str, App] = SingleFlight()
+
+# app_id -> error of a recent lookup that found no tenant
+_app_info_misses: TTLCache[str, CustomException] = TTLCache(
+    ttl=workflow_config.lookup_cache_config.negative_ttl,
+    max_size=workflow_config.lookup_cache_config.negative_size,
+)
 
 
 def _gen_app_auth_header(url: str) -> dict[str, str]:
@@ -146,6 +160,79 @@ async def get_app_source_detail(app_id: str, span: Span) -> tuple[str, str, str,
     return name, desc, api_key, api_secret
 
 
+def _app_stmt(app_id: str) -> SelectOfScalar[App]:
+    """
+    Build the query of an application by its alias ID.
+
+    :param app_id: The application ID to retrieve
+    :return: The select statement
+    """
+    return select(App).where(App.alias_id == app_id)
+
+
+def _app_source_stmt(source_id: str) -> SelectOfScalar[AppSource]:
+    """
+    Build the query of an application source by its source ID.
+
+    :param source_id: The source ID of the application tenant
+    :return: The select statement
+    """
+    return select(AppSource).where(AppSource.source_id == source_id)
+
+
+async def _get_remote_source_id(app_id: str, span: Span) -> str:
+    """
+    Fetch the source ID of an application from the management platform.
+
+    :param app_id: The application ID to retrieve
+    :param span: Tracing span for logging and monitoring
+    :return: The source ID of the application tenant
+    :raises CustomException: If the platform returns no source ID
+    """
+    await span.add_info_event_async(
+        "Fetching application source information from management platform"
+    )
+    source_id = await get_app_source_id(app_id, span)
+    if not source_id:
+        raise CustomException(
+            CodeEnum.APP_TENANT_NOT_FOUND_ERROR,
+            err_msg="source_id not found",
+        )
+    return source_id
+
+
+async def _build_remote_app(
+    app_id: str, app_source: Optional[AppSource], span: Span
+) -> App:
+    """
+    Build a new App record from the management platform details.
+
+    :param app_id: The application ID to retrieve
+    :param app_source: The app source found for the application tenant
+    :param span: Tracing span for logging and monitoring
+    :return: The App object, not yet persisted
+    :raises CustomException: If the app source is missing
+    """
+    if not app_source:
+        raise CustomException(
+            CodeEnum.APP_TENANT_NOT_FOUND_ERROR,
+            err_msg="app_source not found",
+        )
+
+    # Get detailed application information from external API
+    name, desc, api_key, api_secret = await get_app_source_detail(app_id, span)
+
+    return App(
+        name=name,
+        description=desc,
+        alias_id=app_id,
+        api_key=api_key,
+        api_secret=api_secret,
+        source=app_source.source,
+        actual_source=app_source.source,
+    )
+
+
 async def get_info(app_id: str, session: Session, span: Span) -> App:
     """
     Retrieve application information from cache, database, or external API.
@@ -165,40 +252,12 @@ async def get_info(app_id: str, session: Session, span: Span) -> App:
     app_info = get_app_by_app_id(app_id)
     if not app_info:
         # If not in cache, query the database
-        app_info = session.query(App).filter_by(alias_id=app_id).first()
+        app_info = session.exec(_app_stmt(app_id)).first()
         if not app_info:
             # If not in database, fetch from external API
-            await span.add_info_event_async(
-                "Fetching application source information from management platform"
-            )
-            source_id = await get_app_source_id(app_id, span)
-            if not source_id:
-                raise CustomException(
-                    CodeEnum.APP_TENANT_NOT_FOUND_ERROR,
-                    err_msg="source_id not found",
-                )
-
-            # Find the corresponding app source in database
-            app_source = session.query(AppSource).filter_by(source_id=source_id).first()
-            if not app_source:
-                raise CustomException(
-                    CodeEnum.APP_TENANT_NOT_FOUND_ERROR,
-                    err_msg="app_source not found",
-                )
-
-            # Get detailed application information from external API
-            name, desc, api_key, api_secret = await get_app_source_detail(app_id, span)
-
-            # Create new App record with fetched information
-            app_info = App(
-                name=name,
-                description=desc,
-                alias_id=app_id,
-                api_key=api_key,
-                api_secret=api_secret,
-                source=app_source.source,
-                actual_source=app_source.source,
-            )
+            source_id = await _get_remote_source_id(app_id, span)
+            app_source = session.exec(_app_source_stmt(source_id)).first()
+            app_info = await _build_remote_app(app_id, app_source, span)
 
             # Persist the new application record
             session.add(app_info)
@@ -209,3 +268,70 @@ async def get_info(app_id: str, session: Session, span: Span) -> App:
         set_app_by_app_id(app_id, app_info)
 
     return app_info
+
+
+async def get_info_async(app_id: str, session: AsyncSession, span: Span) -> App:
+    """
+    Retrieve application information through an async database session.
+
+    Same three-tier lookup as ``get_info`` (cache, database, management
+    platform) for the async request path. Concurrent cache misses of the same
+    application share one lookup, and unknown tenants are remembered for a
+    few seconds.
+
+    :param app_id: The application ID to retrieve
+    :param session: Async database session for queries and transactions
+    :param span: Tracing span for logging and monitoring
+    :return: App object containing application information
+    :raises CustomException: If application cannot be found or created
+    """
+    # First, try to get from cache
+    app_info = get_app_by_app_id(app_id)
+    if app_info:
+        return app_info
+
+    miss = _app_info_misses.get(app_id)
+    if miss is not None:
+        raise miss.with_traceback(None)
+
+    return await _app_info_flight.do(
+        app_id, lambda: _load_info_async(app_id, session, span)
+    )
+
+
+async def _load_info_async(app_id: str, session: AsyncSession, span: Span) -> App:
+    """
+    Load application information from the database or external API and cache it.
+
+    :param app_id: The application ID to retrieve
+    :param session: Async database session for queries and transactions
+    :param span: Tracing span for logging and monitoring
+    :return: App object containing application information
+    :raises CustomException: If application cannot be found or created
+    """
+    # A flight that just finished may already have filled the cache
+    app_info = get_app_by_app_id(app_id)
+    if app_info:
+        return app_info
+
+    # If not in cache, query the database
+    app_info = (await session.exec(_app_stmt(app_id))).first()
+    if not app_info:
+        try:
+            # If not in database, fetch from external API
+            source_id = await _get_remote_source_id(app_id, span)
+            result = await session.exec(_app_source_stmt(source_id))
+            app_info = await _build_remote_app(app_id, result.first(), span)
+        except CustomException as e:
+            if e.code == CodeEnum.APP_TENANT_NOT_FOUND_ERROR.code:
+                _app_info_misses.set(app_id, e)
+            raise
+
+        # Persist the new application record
+        session.add(app_info)
+        await session.commit()
+        await session.refresh(app_info)
+
+    # Cache the retrieved application information
+    set_app_by_app_id(app_id, app_info)
+    return app_info
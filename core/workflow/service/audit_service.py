@@ -320,6 +320,7 @@ async def output_audit(
                 ),
                 context_span,
             )
+            await audit_strategy.wait_audited(context_span)
             # Check for audit errors and raise if found
             if audit_strategy.context.error:
                 raise audit_strategy.context.error
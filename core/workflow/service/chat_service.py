@@ -1,6 +1,7 @@
 import asyncio
-import copy
+import contextlib
 import json
+import os
 import time
 from asyncio import Queue
 from datetime import datetime
@@ -19,9 +20,9 @@ from typing import (
 from loguru import logger
 
 from workflow.cache.event_registry import Event, EventRegistry
+from workflow.configs import workflow_config
 from workflow.consts.app_audit import AppAuditPolicy
 from workflow.consts.engine.chat_status import ChatStatus
-from workflow.consts.engine.model_provider import ModelProviderEnum
 from workflow.consts.engine.timeout import QueueTimeout
 from workflow.domain.entities.chat import ChatVo
 from workflow.domain.entities.response import Streaming
@@ -31,6 +32,7 @@ from workflow.engine.callbacks.callback_handler import (
     StructuredConsumer,
 )
 from workflow.engine.callbacks.openai_types_sse import (
+    ITEM_PROGRESS_EXT,
     LLMGenerate,
     NodeInfo,
     WorkflowStep,
@@ -38,6 +40,7 @@ from workflow.engine.callbacks.openai_types_sse import (
 from workflow.engine.dsl_engine import WorkflowEngine, WorkflowEngineFactory
 from workflow.engine.entities.msg_or_end_dep_info import MsgOrEndDepInfo
 from workflow.engine.entities.node_entities import NodeType
+from workflow.engine.entities.provider_credentials import ProviderCredentials
 from workflow.engine.entities.variable_pool import ParamKey, VariablePool
 from workflow.engine.entities.workflow_dsl import WorkflowDSL
 from workflow.engine.nodes.entities.node_run_result import NodeRunResult
@@ -51,10 +54,22 @@ from workflow.infra.audit_system.audit_api.iflytek.ifly_audit_api import IFlyAud
 from workflow.infra.audit_system.base import FrameAuditResult
 from workflow.infra.audit_system.strategy.base_strategy import AuditStrategy
 from workflow.infra.audit_system.strategy.text_strategy import TextAuditStrategy
-from workflow.service import audit_service
+from workflow.service import audit_service, engine_plan_service
 from workflow.service.flow_service import set_flow_node_output_mode
 from workflow.service.history_service import get_history
 from workflow.service.ops_service import kafka_report
+from workflow.utils.admission import AdmissionController
+from workflow.utils.replay import RunRecorder, RunReplayer, RunTape, activate
+
+# Admission control of workflow runs started by chat requests on this worker
+chat_admission = AdmissionController(
+    max_inflight=workflow_config.chat_admission_config.max_inflight,
+    app_share=workflow_config.chat_admission_config.app_share,
+    max_queue=workflow_config.chat_admission_config.max_queue,
+    queue_timeout=workflow_config.chat_admission_config.queue_timeout,
+    max_loop_lag=workflow_config.chat_admission_config.max_loop_lag,
+    max_executor_queue=workflow_config.chat_admission_config.max_executor_queue,
+)
 
 
 async def event_stream(
@@ -66,6 +81,7 @@ async def event_stream(
     is_release: bool,
     app_audit_policy: AppAuditPolicy,
     span: Span,
+    credentials: Optional[ProviderCredentials] = None,
 ) -> AsyncIterator[str]:
     """
     Event stream processing function for handling chat requests and generating
@@ -82,8 +98,15 @@ async def event_stream(
     :param is_release: Whether running in production release environment
     :param app_audit_policy: Application audit policy for content moderation
     :param span: Distributed tracing span for monitoring and debugging
+    :param credentials: Model provider credentials overlaid on the DSL for this run
     :return: AsyncIterator yielding streaming response strings
+    :raises CustomException: If the worker is too busy to start the run
     """
+    try:
+        await chat_admission.acquire(app_alias_id)
+    except CustomException:
+        await asyncio.to_thread(EventRegistry().on_finished, event_id=event_id)
+        raise
     response_queue: Queue = Queue()
 
     task = asyncio.create_task(
@@ -97,8 +120,10 @@ async def event_stream(
             app_audit_policy,
             response_queue,
             span,
+            credentials,
         )
     )
+    task.add_done_callback(lambda _: chat_admission.release(app_alias_id))
 
     return _chat_response_stream(
         response_queue,
@@ -150,22 +175,32 @@ async def _get_or_build_workflow_engine(
     This function attempts to retrieve a cached workflow engine first. If no valid
     cached engine exists or the cache is outdated, it builds a new engine from the DSL.
 
-    :param is_release: Whether running in production release environment
-    :param chat_vo: Chat value object containing flow configuration
-    :param app_alias_id: Application alias ID for cache key generation
+    :param is_release: Whether running in production release environment,
+                       only published flows are served from the engine plan cache
     :param workflow_dsl: Workflow DSL definition
-    :param workflow_dsl_update_time: Timestamp of workflow DSL last update
     :param span_context: Distributed tracing span context
     :return: WorkflowEngine instance ready for execution
     """
-    sparkflow_engine: WorkflowEngine
+    sparkflow_engine: WorkflowEngine | None = None
     start_time = time.time() * 1000
-    sparkflow_engine = WorkflowEngineFactory.create_engine(
-        WorkflowDSL.model_validate(workflow_dsl.get("data", {})), span_context
-    )
-    await span_context.add_info_event_async(
-        "Engine not found in cache, rebuilding from DSL"
-    )
+    plan_key = engine_plan_service.get_plan_key(workflow_dsl) if is_release else ""
+    if plan_key:
+        sparkflow_engine = await engine_plan_service.load_plan(plan_key, span_context)
+    if sparkflow_engine is not None:
+        await span_context.add_info_events_async(
+            {"load_sparkflow_engine_plan": f"{time.time() * 1000 - start_time}"}
+        )
+    else:
+        sparkflow_engine = WorkflowEngineFactory.create_engine(
+            WorkflowDSL.model_validate(workflow_dsl.get("data", {})), span_context
+        )
+        await span_context.add_info_event_async(
+            "Engine not found in cache, rebuilding from DSL"
+        )
+        if plan_key:
+            # The engine above is about to run, so the plan is built from the
+            # DSL again in the background rather than serialized here
+            engine_plan_service.compile_plan_later(workflow_dsl, plan_key)
 
     for key in sparkflow_engine.engine_ctx.built_nodes:
         if key.startswith(NodeType.FLOW.value):
@@ -272,6 +307,9 @@ async def _validate_file_inputs(
     if not has_file:
         return
 
+    # Collect every (url, allowed type) pair first so that the remote checks
+    # can run concurrently instead of one network round trip after another
+    file_checks: List[Tuple[str, str]] = []
     for file_info in file_info_list:
         file_var_name = file_info.file_var_name
         file_var_type = file_info.file_var_type
@@ -294,20 +332,56 @@ async def _validate_file_inputs(
 
         # Validate files based on type
         if file_var_type == "string":
-            await File.check_file_var_isvalid(
-                param_value, file_info.allowed_file_type, span_context
-            )
+            file_checks.append((param_value, file_info.allowed_file_type))
         elif file_var_type == "array":
             for input_file in param_value:
-                await File.check_file_var_isvalid(
-                    input_file, file_info.allowed_file_type, span_context
-                )
+                file_checks.append((input_file, file_info.allowed_file_type))
         else:
             span_context.add_error_event(
                 f"File variable protocol error, invalid type: {file_var_type}"
             )
             raise CustomException(err_code=CodeEnum.FILE_VARIABLE_PROTOCOL_ERROR)
 
+    if file_checks:
+        await _run_file_checks(file_checks, span_context)
+
+
+async def _run_file_checks(
+    file_checks: List[Tuple[str, str]], span_context: Span
+) -> None:
+    """
+    Check file URLs concurrently within the configured deadline.
+
+    :param file_checks: (file URL, allowed file type) pairs to check
+    :param span_context: Distributed tracing span context
+    :raises CustomException: When a file is invalid or the checks time out
+    """
+    from workflow.engine.entities.file import File
+
+    tasks = [
+        asyncio.create_task(
+            File.check_file_var_isvalid(file_url, allowed_file_type, span_context)
+        )
+        for file_url, allowed_file_type in file_checks
+    ]
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*tasks),
+            timeout=workflow_config.file_config.check_timeout,
+        )
+    except asyncio.TimeoutError as e:
+        span_context.add_error_event("File validation timed out")
+        raise CustomException(
+            err_code=CodeEnum.FILE_INVALID_TYPE_ERROR,
+            err_msg="Error: file validation timed out",
+            cause_error=e,
+        ) from e
+    finally:
+        # Stop the remaining checks once one of them has failed
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+
 
 async def _get_chat_history(
     sparkflow_engine: WorkflowEngine, chat_vo: ChatVo, span_context: Span
@@ -336,9 +410,10 @@ async def _get_chat_history(
 
     if nodes_need_history:
         start_time = time.time() * 1000
-        history = get_history(
+        history = await get_history(
             flow_id=chat_vo.flow_id,
             uid=uid,
+            node_ids=[node.id for node in nodes_need_history],
             node_max_token=sparkflow_engine.node_max_token,
         )
         await span_context.add_info_events_async(
@@ -439,6 +514,7 @@ async def _run(
     app_audit_policy: AppAuditPolicy,
     response_queue: Queue,
     span: Span,
+    credentials: Optional[ProviderCredentials] = None,
 ) -> None:
     """
     Process chat request and execute workflow.
@@ -455,6 +531,7 @@ async def _run(
     :param response_queue: Response queue for streaming output results
     :param app_audit_policy: Application audit policy for content moderation
     :param span: Distributed tracing span for monitoring
+    :param credentials: Model provider credentials overlaid on the DSL for this run
     :return: None
     """
     func_name = "sse_chat_open" if is_release else "sse_chat_debug"
@@ -491,6 +568,8 @@ async def _run(
                 ParamKey.AppId, app_alias_id
             ).set(
                 ParamKey.Ext, {"phone_number": chat_vo.ext.get("phone_number", "")}
+            ).set(
+                ParamKey.Credentials, credentials
             )
             # Initialize model content output queues
             await _init_stream_q(
@@ -522,14 +601,20 @@ async def _run(
             # Execute workflow
             await callbacks.on_sparkflow_start()
 
-            result = await sparkflow_engine.async_run(
-                inputs=chat_vo.parameters,
-                callback=callbacks,
-                span=span_context,
-                history=history,
-                history_v2=chat_vo.history,
-                event_log_trace=workflow_trace,
-            )
+            recorder = _new_run_recorder(app_alias_id, workflow_dsl, chat_vo, history)
+            try:
+                with activate(recorder) if recorder else contextlib.nullcontext():
+                    result = await sparkflow_engine.async_run(
+                        inputs=chat_vo.parameters,
+                        callback=callbacks,
+                        span=span_context,
+                        history=history,
+                        history_v2=chat_vo.history,
+                        event_log_trace=workflow_trace,
+                    )
+            finally:
+                if recorder:
+                    await _save_run_tape(recorder.tape, span_context)
 
             # Process results and upload trace information
             await _process_and_report_result(
@@ -573,6 +658,119 @@ async def _run(
             )
 
 
+def _new_run_recorder(
+    app_alias_id: str, workflow_dsl: Dict, chat_vo: ChatVo, history: Any
+) -> Optional[RunRecorder]:
+    """
+    Start recording the external calls of a run if its flow is configured.
+
+    :param app_alias_id: Application alias ID for identification
+    :param workflow_dsl: Workflow DSL definition
+    :param chat_vo: Chat value object containing user input and configuration
+    :param history: Chat history records the run starts with
+    :return: Recorder for the run, or None if the run is not recorded
+    """
+    config = workflow_config.run_record_config
+    if not config.record_dir:
+        return None
+    flows = {flow_id.strip() for flow_id in config.flows.split(",")}
+    if "*" not in flows and chat_vo.flow_id not in flows:
+        return None
+    return RunRecorder(
+        RunTape(
+            flow_id=chat_vo.flow_id,
+            app_id=app_alias_id,
+            uid=chat_vo.uid,
+            chat_id=chat_vo.chat_id,
+            workflow_dsl=workflow_dsl,
+            inputs=chat_vo.parameters,
+            history=history,
+            history_v2=chat_vo.history,
+        )
+    )
+
+
+async def _save_run_tape(tape: RunTape, span_context: Span) -> None:
+    """
+    Write the tape of a recorded run to the record directory.
+
+    Failures are recorded on the span and otherwise ignored.
+
+    :param tape: Tape of the recorded run
+    :param span_context: Distributed tracing span context
+    """
+    path = os.path.join(
+        workflow_config.run_record_config.record_dir,
+        f"{tape.flow_id}_{span_context.sid}.tape",
+    )
+    try:
+        await asyncio.to_thread(tape.save, path)
+        await span_context.add_info_events_async({"run_tape": path})
+    except Exception as e:
+        span_context.add_error_event(f"Failed to save run tape: {e}")
+
+
+async def replay_run(tape_path: str, speed: float = 1.0) -> NodeRunResult:
+    """
+    Run a recorded workflow run again against its tape, without network.
+
+    Model streams, tool and knowledge calls and Redis access are answered from
+    the tape at the recorded pace divided by ``speed``, so what remains is the
+    engine's own overhead on the recorded flow.
+
+    Usage: ``asyncio.run(chat_service.replay_run("flow_sid.tape", speed=10))``
+
+    :param tape_path: Tape written while the run was recorded
+    :param speed: Pace factor, 1 keeps the recorded timing and 0 skips waiting
+    :return: Result of the replayed run
+    """
+    tape = await asyncio.to_thread(RunTape.load, tape_path)
+    span = Span(app_id=tape.app_id, uid=tape.uid, chat_id=tape.chat_id)
+    with span.start(attributes={"flow_id": tape.flow_id}) as span_context:
+        sparkflow_engine = WorkflowEngineFactory.create_engine(
+            WorkflowDSL.model_validate(tape.workflow_dsl.get("data", {})),
+            span_context,
+        )
+        sparkflow_engine.engine_ctx.variable_pool.system_params.set(
+            ParamKey.FlowId, tape.flow_id
+        ).set(ParamKey.ChatId, tape.chat_id).set(ParamKey.Uid, tape.uid).set(
+            ParamKey.AppId, tape.app_id
+        )
+        await _init_stream_q(
+            sparkflow_engine.engine_ctx.msg_or_end_node_deps,
+            sparkflow_engine.engine_ctx.variable_pool,
+        )
+        callbacks, consumer_tasks = await _init_callbacks_and_consumers(
+            sparkflow_engine,
+            asyncio.Queue(),
+            asyncio.Queue(),
+            asyncio.Queue(),
+            {},
+            span_context,
+            "",
+            tape.flow_id,
+        )
+        try:
+            with activate(RunReplayer(tape, speed)):
+                return await sparkflow_engine.async_run(
+                    inputs=tape.inputs,
+                    callback=callbacks,
+                    span=span_context,
+                    history=tape.history,
+                    history_v2=tape.history_v2,
+                    event_log_trace=WorkflowLog(
+                        flow_id=tape.flow_id,
+                        sid=span_context.sid,
+                        app_id=tape.app_id,
+                        uid=tape.uid,
+                        chat_id=tape.chat_id,
+                        log_caller="chat_replay",
+                    ),
+                )
+        finally:
+            await _cleanup_resources(consumer_tasks)
+
+
 async def _init_stream_q(
     msg_or_end_node_deps: Dict[str, MsgOrEndDepInfo], variable_pool: VariablePool
 ) -> None:
@@ -607,47 +805,6 @@ async def _init_stream_q(
                 ] = asyncio.Queue()
 
 
-def change_dsl_triplets(
-    spark_dsl: dict, app_id: str, api_key: str, api_secret: str
-) -> dict:
-    """
-    Replace model provider triplets (app_id, api_key, api_secret) in workflow DSL.
-
-    This function replaces the model provider credentials in the workflow DSL
-    for open API usage scenarios.
-
-    :param spark_dsl: Original workflow DSL dictionary
-    :param app_id: Application ID for model provider
-    :param api_key: API key for model provider
-    :param api_secret: API secret for model provider
-    :return: Modified DSL dictionary with updated credentials
-    """
-    dsl = copy.deepcopy(spark_dsl)
-    nodes = dsl["data"]["nodes"]
-    for index, node in enumerate(nodes):
-        node_id = node["id"]
-        if node_id.split(":")[0] in [
-            NodeType.LLM.value,
-            NodeType.DECISION_MAKING.value,
-            NodeType.PARAMETER_EXTRACTOR.value,
-            NodeType.AGENT.value,
-            NodeType.DATABASE.value,
-        ]:
-            model_source = (
-                node["data"]
-                .get("nodeParam", {})
-                .get("source", ModelProviderEnum.XINGHUO.value)
-            )
-            if model_source != ModelProviderEnum.OPENAI.value:
-                dsl["data"]["nodes"][index]["data"]["nodeParam"]["appId"] = app_id
-                dsl["data"]["nodes"][index]["data"]["nodeParam"]["apiKey"] = api_key
-                dsl["data"]["nodes"][index]["data"]["nodeParam"][
-                    "apiSecret"
-                ] = api_secret
-
-    return dsl
-
-
 async def _get_response(
     app_audit_policy: AppAuditPolicy,
     audit_strategy: Optional[AuditStrategy],
@@ -723,6 +880,7 @@ def _filter_response_frame(
     message_cache: list,
     reasoning_content_cache: list,
     is_release: bool,
+    is_audited: bool = False,
 ) -> Optional[LLMGenerate]:
     """
     Filter or process a response frame based on node type, content, and streaming state.
@@ -737,6 +895,7 @@ def _filter_response_frame(
     :param message_cache: Cached content for non-streaming mode
     :param reasoning_content_cache: Cached reasoning content for non-streaming mode
     :param is_release: Whether running in production release mode
+    :param is_audited: Whether output content must pass the output audit
     :return: Tuple of (filtered response frame or None, whether to keep the response
              frame)
     """
@@ -756,6 +915,11 @@ def _filter_response_frame(
     is_content_empty = not delta.content and not delta.reasoning_content
     is_interrupted = choice.finish_reason == ChatStatus.INTERRUPT.value
     is_ping = choice.finish_reason == ChatStatus.PING.value
+    node = response_frame.workflow_step.node if response_frame.workflow_step else None
+    if node and node.ext and ITEM_PROGRESS_EXT in node.ext:
+        return _filter_item_progress_frame(
+            response_frame, node, is_stream, last_workflow_step, is_audited
+        )
 
     response_frame.workflow_step.node = None
 
@@ -799,6 +963,36 @@ def _filter_response_frame(
     return response_frame
 
 
+def _filter_item_progress_frame(
+    response_frame: LLMGenerate,
+    node: NodeInfo,
+    is_stream: bool,
+    last_workflow_step: WorkflowStep,
+    is_audited: bool,
+) -> Optional[LLMGenerate]:
+    """
+    Process an item progress frame of a node processing a batch.
+
+    Item progress frames are only streamed, the final answer aggregates the
+    items anyway. Item outputs do not go through the output audit, so audited
+    apps only see the index, total and status of each item.
+
+    :param response_frame: Item progress frame to process
+    :param node: Node info of the frame
+    :param is_stream: Whether this is a streaming response
+    :param last_workflow_step: Previous workflow step for tracking frame index
+                               and progress
+    :param is_audited: Whether output content must pass the output audit
+    :return: Processed frame, or None if it is dropped
+    """
+    if not is_stream:
+        return None
+    if is_audited:
+        node.outputs = {}
+    _deal_streaming_step(is_stream, response_frame, last_workflow_step)
+    return response_frame
+
+
 def _deal_streaming_step(
     is_stream: bool, response_frame: LLMGenerate, last_workflow_step: WorkflowStep
 ) -> None:
@@ -915,6 +1109,7 @@ async def _chat_response_stream(
                     message_cache=message_cache,
                     reasoning_content_cache=reasoning_content_cache,
                     is_release=is_release,
+                    is_audited=app_audit_policy == AppAuditPolicy.AGENT_PLATFORM,
                 )
                 if not response:
                     continue
@@ -1215,6 +1410,7 @@ async def chat_resume_response_stream(
                     message_cache=message_cache,
                     reasoning_content_cache=reasoning_content_cache,
                     is_release=is_release,
+                    is_audited=audit_policy == AppAuditPolicy.AGENT_PLATFORM.value,
                 )
                 if not response:
                     continue
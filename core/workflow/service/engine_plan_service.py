@@ -0,0 +1,187 @@
+"""
+Engine plan service module.
+
+Building an engine validates the DSL, instantiates every node and analyses
+chains and dependencies. Published flows never change, so the engine built
+from a published DSL is serialized once, in the background after publishing
+or after the first cold request, and kept in Redis and in each worker's
+memory. Later requests deserialize a fresh copy of it instead of building the
+DSL again.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+from pathlib import Path
+from typing import Dict, Optional
+
+from workflow.cache.engine import get_engine_plan, set_engine_plan
+from workflow.configs import workflow_config
+from workflow.engine.dsl_engine import WorkflowEngine, WorkflowEngineFactory
+from workflow.engine.entities.workflow_dsl import WorkflowDSL
+from workflow.extensions.otlp.trace.span import Span
+from workflow.utils.cache import TTLCache
+
+# Bump whenever classes outside the engine package that plans reference
+# change in a way that makes plans serialized by an earlier release unusable
+PLAN_FORMAT_VERSION = 1
+
+
+def _engine_code_digest() -> str:
+    """
+    Digest the sources of the engine package, engine and node classes included.
+
+    :return: Short digest changing with any change to the engine code
+    """
+    engine_dir = Path(inspect.getfile(WorkflowEngine)).parent
+    sha = hashlib.sha256()
+    for path in sorted(engine_dir.rglob("*.py")):
+        sha.update(path.relative_to(engine_dir).as_posix().encode("utf-8"))
+        sha.update(path.read_bytes())
+    return sha.hexdigest()[:16]
+
+
+# Plans serialized by a release with other engine code are never loaded
+PLAN_CODE_DIGEST = _engine_code_digest()
+
+_local_plans: TTLCache[str, bytes] = TTLCache(
+    ttl=workflow_config.engine_plan_cache_config.ttl,
+    max_size=workflow_config.engine_plan_cache_config.local_size,
+)
+
+# Background compilations by plan key, referenced until they finish
+_compiling: Dict[str, "asyncio.Task[None]"] = {}
+
+
+def get_plan_key(workflow_dsl: Dict) -> str:
+    """
+    Derive the plan key of a workflow DSL.
+
+    :param workflow_dsl: Workflow DSL definition
+    :return: Plan key covering the DSL content, the plan format version and
+             the engine code
+    """
+    content = json.dumps(
+        workflow_dsl.get("data", {}),
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    return f"v{PLAN_FORMAT_VERSION}:{PLAN_CODE_DIGEST}:{digest}"
+
+
+async def _store_plan(plan_key: str, plan: bytes, span: Span) -> None:
+    """
+    Store a serialized engine as a plan.
+
+    Failures are recorded on the span and otherwise ignored.
+
+    :param plan_key: Plan key of the DSL the engine was built from
+    :param plan: Serialized engine that has not run yet
+    :param span: Tracing span for observability
+    """
+    ttl = workflow_config.engine_plan_cache_config.ttl
+    if not plan:
+        return
+    _local_plans.set(plan_key, plan)
+    try:
+        await asyncio.to_thread(set_engine_plan, plan_key, plan, ttl)
+    except Exception as e:
+        span.add_error_event(f"Failed to cache engine plan: {e}")
+
+
+async def load_plan(plan_key: str, span: Span) -> Optional[WorkflowEngine]:
+    """
+    Load a fresh engine from a stored plan.
+
+    :param plan_key: Plan key of the workflow DSL
+    :param span: Tracing span for observability
+    :return: Engine ready to run, or None if no usable plan is stored
+    """
+    if workflow_config.engine_plan_cache_config.ttl <= 0:
+        return None
+    plan = _local_plans.get(plan_key)
+    if plan is None:
+        try:
+            plan = await asyncio.to_thread(get_engine_plan, plan_key)
+        except Exception as e:
+            span.add_error_event(f"Engine plan cache unavailable: {e}")
+            return None
+        if not plan:
+            return None
+        _local_plans.set(plan_key, plan)
+    engine, _ = WorkflowEngine.loads(plan, span)
+    if engine is None:
+        _local_plans.delete(plan_key)
+    return engine
+
+
+def _build_plan(workflow_dsl: Dict, span: Span) -> bytes:
+    """
+    Build the engine of a DSL and serialize it.
+
+    :param workflow_dsl: Workflow DSL definition
+    :param span: Tracing span for observability
+    :return: Serialized engine, empty if it cannot be serialized
+    """
+    engine = WorkflowEngineFactory.create_engine(
+        WorkflowDSL.model_validate(workflow_dsl.get("data", {})), span
+    )
+    return engine.dumps(span)
+
+
+async def compile_plan(
+    workflow_dsl: Dict, span: Span, plan_key: Optional[str] = None
+) -> None:
+    """
+    Build the engine of a published DSL and store it as a plan.
+
+    The engine is built and serialized in a worker thread. Failures are
+    recorded on the span so they never fail the caller; the plan is then
+    built on a later request instead.
+
+    :param workflow_dsl: Published workflow DSL definition
+    :param span: Tracing span for observability
+    :param plan_key: Plan key of the DSL, derived from it if not given
+    """
+    if workflow_config.engine_plan_cache_config.ttl <= 0:
+        return
+    try:
+        plan = await asyncio.to_thread(_build_plan, workflow_dsl, span)
+    except Exception as e:
+        span.add_error_event(f"Failed to compile engine plan: {e}")
+        return
+    await _store_plan(plan_key or get_plan_key(workflow_dsl), plan, span)
+
+
+def compile_plan_later(workflow_dsl: Dict, plan_key: Optional[str] = None) -> None:
+    """
+    Compile and store the plan of a published DSL in the background.
+
+    Nothing is scheduled while a compilation of the same DSL is in flight.
+
+    :param workflow_dsl: Published workflow DSL definition
+    :param plan_key: Plan key of the DSL, derived from it if not given
+    """
+    if workflow_config.engine_plan_cache_config.ttl <= 0:
+        return
+    plan_key = plan_key or get_plan_key(workflow_dsl)
+    if plan_key in _compiling:
+        return
+    task = asyncio.create_task(_compile_in_background(workflow_dsl, plan_key))
+    _compiling[plan_key] = task
+    task.add_done_callback(lambda _: _compiling.pop(plan_key, None))
+
+
+async def _compile_in_background(workflow_dsl: Dict, plan_key: str) -> None:
+    """
+    Compile a plan under its own span, outliving the request that asked for it.
+
+    :param workflow_dsl: Published workflow DSL definition
+    :param plan_key: Plan key of the DSL
+    """
+    span = Span()
+    with span.start("CompileEnginePlan") as span_context:
+        await compile_plan(workflow_dsl, span_context, plan_key)
@@ -2,14 +2,64 @@
 File service module for handling file upload validation and processing.
 
 This module provides functionality to validate uploaded files including
-file type checking and size limit enforcement.
+file type checking and size limit enforcement, and to store uploaded files
+part by part.
 """
 
+import uuid
+from typing import AsyncIterator, Dict, Tuple
+
 from fastapi import UploadFile
 
 from workflow.configs import workflow_config
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.middleware.getters import get_oss_service
 from workflow.extensions.otlp.trace.span import Span
 
+# Accepted (offset, leading bytes) of file types with a binary signature,
+# text based types are not checked
+_SIGNATURES: Dict[str, Tuple[Tuple[int, bytes], ...]] = {
+    "jpg": ((0, b"\xff\xd8\xff"),),
+    "jpeg": ((0, b"\xff\xd8\xff"),),
+    "png": ((0, b"\x89PNG\r\n\x1a\n"),),
+    "bmp": ((0, b"BM"),),
+    "pdf": ((0, b"%PDF"),),
+    "docx": ((0, b"PK\x03\x04"),),
+    "pptx": ((0, b"PK\x03\x04"),),
+    "xlsx": ((0, b"PK\x03\x04"),),
+    "doc": ((0, b"\xd0\xcf\x11\xe0"),),
+    "ppt": ((0, b"\xd0\xcf\x11\xe0"),),
+    "xls": ((0, b"\xd0\xcf\x11\xe0"),),
+    "wav": ((0, b"RIFF"),),
+    "avi": ((0, b"RIFF"),),
+    "mp3": ((0, b"ID3"),),
+    "aac": ((0, b"ADIF"), (0, b"\xff\xf1"), (0, b"\xff\xf9")),
+    "flac": ((0, b"fLaC"),),
+    "ogg": ((0, b"OggS"),),
+    "midi": ((0, b"MThd"),),
+    "m4a": ((4, b"ftyp"),),
+    "mp4": ((4, b"ftyp"),),
+    "mkv": ((0, b"\x1a\x45\xdf\xa3"),),
+    "wma": ((0, b"\x30\x26\xb2\x75"),),
+    "wmv": ((0, b"\x30\x26\xb2\x75"),),
+    "flv": ((0, b"FLV"),),
+}
+
+# Types whose files may also start right at an MPEG audio frame, whose 11 bit
+# sync is followed by version, layer and CRC bits of any value
+_FRAME_SYNC_TYPES = frozenset({"mp3"})
+
+
+def _is_frame_sync(head: bytes) -> bool:
+    """
+    Check whether the leading bytes are the sync word of an MPEG audio frame.
+
+    :param head: The first bytes of the file
+    :return: True if the file starts with a frame sync
+    """
+    return len(head) >= 2 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0
+
 
 def check(file: UploadFile, contents: bytes, span_context: Span) -> None:
     """
@@ -30,3 +80,79 @@ def check(file: UploadFile, contents: bytes, span_context: Span) -> None:
         extension=extension,
         file_size=file_size if file_size else 0,
     )
+
+
+def check_signature(extension: str, head: bytes) -> None:
+    """
+    Validate the leading bytes of a file match the type of its extension.
+
+    :param extension: The lower case extension of the file
+    :param head: The first bytes of the file
+    :raises CustomException: If the content does not match the extension
+    """
+    signatures = _SIGNATURES.get(extension)
+    if not signatures:
+        return
+    if extension in _FRAME_SYNC_TYPES and _is_frame_sync(head):
+        return
+    if not any(head[offset:].startswith(magic) for offset, magic in signatures):
+        raise CustomException(
+            err_code=CodeEnum.FILE_INVALID_ERROR,
+            err_msg="Error: File content does not match its extension",
+            cause_error=f"File content is not a valid {extension} file",
+        )
+
+
+async def read_parts(
+    file: UploadFile, extension: str, part_size: int
+) -> AsyncIterator[bytes]:
+    """
+    Read an uploaded file part by part, validating its content type on the
+    first part and its size as it is read.
+
+    :param file: The uploaded file object
+    :param extension: The lower case extension of the file
+    :param part_size: Bytes per part, only the last part may be smaller
+    :return: Async iterator over the parts of the file
+    :raises CustomException: If the content does not match the extension or
+                             the file size exceeds the limit
+    """
+    read_size = 0
+    while True:
+        part = await file.read(part_size)
+        if not part:
+            return
+        if not read_size:
+            check_signature(extension, part)
+        read_size += len(part)
+        # The declared size may be missing, enforce the limit on what is read
+        workflow_config.file_config.is_valid(extension=extension, file_size=read_size)
+        yield part
+
+
+async def upload(file: UploadFile, span_context: Span) -> str:
+    """
+    Validate an uploaded file and store it part by part.
+
+    At most ``FILE_UPLOAD_CONCURRENCY`` parts of ``FILE_UPLOAD_PART_SIZE``
+    bytes are held in memory at a time, whatever the size of the file.
+
+    :param file: The uploaded file object
+    :param span_context: Tracing span for logging validation events
+    :return: The URL of the stored file
+    :raises CustomException: If the file is invalid or cannot be stored
+    """
+    check(file, b"", span_context)
+    if not file.filename:
+        raise CustomException(
+            err_code=CodeEnum.FILE_INVALID_ERROR,
+            err_msg="File name cannot be empty",
+        )
+    extension = file.filename.split(".")[-1].lower()
+    config = workflow_config.file_config
+    return await get_oss_service().upload_stream_async(
+        f"{str(uuid.uuid4())}.{extension}",
+        read_parts(file, extension, config.upload_part_size),
+        size=file.size,
+        max_concurrency=config.upload_concurrency,
+    )
@@ -7,16 +7,20 @@ creation, updates, retrieval, debugging, and execution of workflow instances.
 
 import json
 import time
-from typing import Any, Optional, cast
+from typing import Any, Optional, Tuple, cast
 
 from common.utils.snowfake import get_id
-from sqlmodel import Session  # type: ignore
+from sqlmodel import Session, select  # type: ignore
+from sqlmodel.ext.asyncio.session import AsyncSession  # type: ignore
+from sqlmodel.sql.expression import SelectOfScalar  # type: ignore
 
 from workflow.cache import flow as flow_cache
+from workflow.configs import workflow_config
 from workflow.domain.entities.flow import FlowUpdate
 from workflow.domain.entities.node_debug_vo import NodeDebugRespVo
 from workflow.domain.models.ai_app import App
 from workflow.domain.models.flow import Flow
+from workflow.domain.models.license import License
 from workflow.engine.callbacks.openai_types_sse import GenerateUsage
 from workflow.engine.dsl_engine import WorkflowEngineFactory
 from workflow.engine.entities.node_entities import NodeType
@@ -32,12 +36,12 @@ from workflow.engine.nodes.flow.flow_node import FlowNode
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.middleware.cache.base import BaseCacheService
-from workflow.extensions.middleware.database.utils import session_getter
-from workflow.extensions.middleware.getters import get_db_service
+from workflow.extensions.middleware.getters import get_async_session
 from workflow.extensions.otlp.log_trace.workflow_log import WorkflowLog
 from workflow.extensions.otlp.trace.span import Span
 from workflow.repository import flow_dao, license_dao
 from workflow.service import audit_service, ops_service
+from workflow.utils.cache import SingleFlight, TTLCache
 
 
 def save(flow: Flow, app_info: App, session: Session, span: Span) -> Flow:
@@ -104,6 +108,40 @@ def update(
         raise  # Re-raise the exception to be handled by the main function
 
 
+def _flow_stmt(flow_id: str) -> SelectOfScalar[Flow]:
+    """
+    Build the query of a workflow by its ID.
+
+    :param flow_id: The unique identifier of the workflow
+    :return: The select statement
+    """
+    return select(Flow).where(Flow.id == int(flow_id))
+
+
+def _flow_version_stmt(group_id: int, version: str) -> SelectOfScalar[Flow]:
+    """
+    Build the query of a workflow version within its flow group.
+
+    :param group_id: The group ID shared by all versions of the workflow
+    :param version: Version number of the workflow
+    :return: The select statement
+    """
+    return select(Flow).where(Flow.group_id == group_id, Flow.version == version)
+
+
+def _require_flow(db_flow: Optional[Flow]) -> Flow:
+    """
+    Return the queried workflow, failing if the query found none.
+
+    :param db_flow: The queried flow object, or None
+    :return: The flow object
+    :raises CustomException: If no flow was found
+    """
+    if not db_flow:
+        raise CustomException(CodeEnum.FLOW_NOT_FOUND_ERROR)
+    return db_flow
+
+
 def get(flow_id: str, session: Session, span: Span) -> Flow:
     """
     Retrieve a workflow by its ID from the database.
@@ -117,13 +155,51 @@ def get(flow_id: str, session: Session, span: Span) -> Flow:
     db_flow = flow_cache.get_flow_by_id(flow_id)
     if db_flow:
         return db_flow
-    db_flow = session.query(Flow).filter_by(id=int(flow_id)).first()
-    if not db_flow:
-        raise CustomException(CodeEnum.FLOW_NOT_FOUND_ERROR)
+    db_flow = _require_flow(session.exec(_flow_stmt(flow_id)).first())
     flow_cache.set_flow_by_id(flow_id, db_flow)
     return db_flow
 
 
+async def get_async(flow_id: str, session: AsyncSession, span: Span) -> Flow:
+    """
+    Retrieve a workflow by its ID through an async database session.
+
+    :param flow_id: The unique identifier of the workflow
+    :param session: Async database session for querying
+    :param span: Tracing span for logging operations
+    :return: The flow object if found
+    :raises CustomException: If flow with the given ID is not found
+    """
+    db_flow = flow_cache.get_flow_by_id(flow_id)
+    if db_flow:
+        return db_flow
+    result = await session.exec(_flow_stmt(flow_id))
+    db_flow = _require_flow(result.first())
+    flow_cache.set_flow_by_id(flow_id, db_flow)
+    return db_flow
+
+
+async def get_flow_by_version_async(
+    flow_id: str, session: AsyncSession, span: Span, version: str = ""
+) -> Flow:
+    """
+    Retrieve a workflow by its flow ID and optional version through an async
+    database session.
+
+    :param flow_id: The unique identifier of the workflow
+    :param session: Async database session for querying
+    :param span: Tracing span for logging operations
+    :param version: Optional version number of the workflow (empty string for latest)
+    :return: The flow object if found
+    :raises CustomException: If flow with the given ID is not found
+    """
+    db_flow = await get_async(flow_id, session, span)
+    if not version:
+        return db_flow
+    result = await session.exec(_flow_version_stmt(db_flow.group_id, version))
+    return _require_flow(result.first())
+
+
 def get_flow_by_version(
     flow_id: str, session: Session, span: Span, version: str = ""
 ) -> Flow:
@@ -138,17 +214,66 @@ def get_flow_by_version(
     :raises CustomException: If flow with the given ID is not found
     """
     # Query database if not found in cache
-    db_flow: Optional[Flow] = get(flow_id, session, span)
-    if version and db_flow:
-        db_flow = (
-            session.query(Flow)
-            .filter_by(group_id=db_flow.group_id, version=version)
-            .first()
-        )
-
-    if db_flow:
+    db_flow = get(flow_id, session, span)
+    if not version:
         return db_flow
-    raise CustomException(CodeEnum.FLOW_NOT_FOUND_ERROR)
+    return _require_flow(
+        session.exec(_flow_version_stmt(db_flow.group_id, version)).first()
+    )
+
+
+def _get_cached_published_flow(flow_id: str, version: str) -> Optional[Flow]:
+    """
+    Retrieve a published workflow from cache.
+
+    :param flow_id: The unique identifier of the workflow
+    :param version: Optional version number of the workflow (empty string for latest)
+    :return: The cached flow object, None if not cached
+    """
+    if not version:
+        return flow_cache.get_flow_by_flow_id_latest(flow_id)
+    return flow_cache.get_flow_by_flow_id_version(flow_id, version)
+
+
+def _set_cached_published_flow(flow_id: str, version: str, flow: Flow) -> None:
+    """
+    Cache a published workflow.
+
+    :param flow_id: The unique identifier of the workflow
+    :param version: Optional version number of the workflow (empty string for latest)
+    :param flow: The published flow object
+    """
+    if not version:
+        flow_cache.set_flow_by_flow_id_latest(flow_id, flow)
+    else:
+        flow_cache.set_flow_by_flow_id_version(flow_id, version, flow)
+
+
+def _check_license(lic: Optional[License]) -> None:
+    """
+    Validate the license binding a workflow to an application.
+
+    :param lic: The queried license, or None
+    :raises CustomException: If the flow is not bound or the license is disabled
+    """
+    if not lic:
+        raise CustomException(CodeEnum.APP_FLOW_NOT_AUTH_BOND_ERROR)
+
+    if not lic.status:
+        raise CustomException(CodeEnum.APP_FLOW_NO_LICENSE_ERROR)
+
+
+def _require_published_flow(published_flow: Optional[Flow]) -> Flow:
+    """
+    Return the queried published workflow, failing if the query found none.
+
+    :param published_flow: The queried published flow object, or None
+    :return: The published flow object
+    :raises CustomException: If the flow has no published version
+    """
+    if not published_flow:
+        raise CustomException(CodeEnum.FLOW_NOT_PUBLISH_ERROR)
+    return published_flow
 
 
 def get_latest_published_flow_by(
@@ -169,10 +294,7 @@ def get_latest_published_flow_by(
     :raises CustomException: If flow not found, not authorized, or not published
     """
     # Check cache first for better performance
-    if not version:
-        flow = flow_cache.get_flow_by_flow_id_latest(flow_id)
-    else:
-        flow = flow_cache.get_flow_by_flow_id_version(flow_id, version)
+    flow = _get_cached_published_flow(flow_id, version)
     if flow:
         return flow
 
@@ -180,26 +302,124 @@ def get_latest_published_flow_by(
     db_flow = get(flow_id, session, span)
 
     # Validate license permissions
-    lic = license_dao.get_by(db_flow.group_id, app_alias_id, session)
-    if not lic:
-        raise CustomException(CodeEnum.APP_FLOW_NOT_AUTH_BOND_ERROR)
-
-    if not lic.status:
-        raise CustomException(CodeEnum.APP_FLOW_NO_LICENSE_ERROR)
+    _check_license(license_dao.get_by(db_flow.group_id, app_alias_id, session))
 
     # Get the latest published version of the flow
-    published_flow = flow_dao.get_latest_published_flow_by(
-        db_flow.group_id, session, version
+    published_flow = _require_published_flow(
+        flow_dao.get_latest_published_flow_by(db_flow.group_id, session, version)
     )
-    if not published_flow:
-        raise CustomException(CodeEnum.FLOW_NOT_PUBLISH_ERROR)
 
     # Cache the result for future requests
-    if not version:
-        flow_cache.set_flow_by_flow_id_latest(flow_id, published_flow)
-    else:
-        flow_cache.set_flow_by_flow_id_version(flow_id, version, published_flow)
+    _set_cached_published_flow(flow_id, version, published_flow)
+    return published_flow
+
+
+# Lookup outcomes that only change when the flow is published or bound again
+_PUBLISHED_FLOW_MISS_CODES = frozenset(
+    {
+        CodeEnum.FLOW_NOT_FOUND_ERROR.code,
+        CodeEnum.APP_FLOW_NOT_AUTH_BOND_ERROR.code,
+        CodeEnum.APP_FLOW_NO_LICENSE_ERROR.code,
+        CodeEnum.FLOW_NOT_PUBLISH_ERROR.code,
+    }
+)
+
+# (flow_id, app_alias_id, version) -> in-flight database lookup
+_published_flow_flight: SingleFlight[Tuple[str, str, str], Flow] = SingleFlight()
+
+# (flow_id, app_alias_id, version) -> error of a recent failed lookup
+_published_flow_misses: TTLCache[Tuple[str, str, str], CustomException] = TTLCache(
+    ttl=workflow_config.lookup_cache_config.negative_ttl,
+    max_size=workflow_config.lookup_cache_config.negative_size,
+)
+
+
+async def get_latest_published_flow_by_async(
+    flow_id: str,
+    app_alias_id: str,
+    session: AsyncSession,
+    span: Span,
+    version: str = "",
+) -> Flow:
+    """
+    Retrieve the latest published workflow through an async database session.
 
+    Same lookup as ``get_latest_published_flow_by`` for the async request path,
+    so database I/O does not block the event loop or a worker thread.
+    Concurrent cache misses of the same flow share one database lookup, and
+    lookups that found nothing are remembered for a few seconds.
+
+    :param flow_id: The unique identifier of the workflow
+    :param app_alias_id: The alias ID of the application
+    :param session: Async database session for querying
+    :param span: Tracing span for logging operations
+    :param version: Optional version number of the workflow (empty string for latest)
+    :return: The published flow object
+    :raises CustomException: If flow not found, not authorized, or not published
+    """
+    # Check cache first for better performance
+    flow = _get_cached_published_flow(flow_id, version)
+    if flow:
+        return flow
+
+    key = (flow_id, app_alias_id, version)
+    miss = _published_flow_misses.get(key)
+    if miss is not None:
+        raise miss.with_traceback(None)
+
+    return await _published_flow_flight.do(
+        key,
+        lambda: _load_published_flow_async(
+            flow_id, app_alias_id, session, span, version
+        ),
+    )
+
+
+async def _load_published_flow_async(
+    flow_id: str,
+    app_alias_id: str,
+    session: AsyncSession,
+    span: Span,
+    version: str,
+) -> Flow:
+    """
+    Load the latest published workflow from the database and cache it.
+
+    :param flow_id: The unique identifier of the workflow
+    :param app_alias_id: The alias ID of the application
+    :param session: Async database session for querying
+    :param span: Tracing span for logging operations
+    :param version: Optional version number of the workflow (empty string for latest)
+    :return: The published flow object
+    :raises CustomException: If flow not found, not authorized, or not published
+    """
+    # A flight that just finished may already have filled the cache
+    flow = _get_cached_published_flow(flow_id, version)
+    if flow:
+        return flow
+
+    try:
+        # Query database if not found in cache
+        db_flow = await get_async(flow_id, session, span)
+
+        # Validate license permissions
+        _check_license(
+            await license_dao.get_by_async(db_flow.group_id, app_alias_id, session)
+        )
+
+        # Get the latest published version of the flow
+        published_flow = _require_published_flow(
+            await flow_dao.get_latest_published_flow_by_async(
+                db_flow.group_id, session, version
+            )
+        )
+    except CustomException as e:
+        if e.code in _PUBLISHED_FLOW_MISS_CODES:
+            _published_flow_misses.set((flow_id, app_alias_id, version), e)
+        raise
+
+    # Cache the result for future requests
+    _set_cached_published_flow(flow_id, version, published_flow)
     return published_flow
 
 
@@ -414,8 +634,10 @@ async def set_flow_node_output_mode(
     db_flow = flow_cache.get_flow_by_id(flow_id)
     if not db_flow:
         # Query flow end node information
-        with session_getter(get_db_service()) as session:
-            db_flow = get_latest_published_flow_by(flow_id, app_id, session, span)
+        async with get_async_session() as session:
+            db_flow = await get_latest_published_flow_by_async(
+                flow_id, app_id, session, span
+            )
     # Find end node and extract output mode configuration
     for node in db_flow.data["data"]["nodes"]:
         if (
@@ -4,16 +4,25 @@ This module provides functionality to store and retrieve conversation history
 for workflow nodes, with support for token limits and database constraints.
 """
 
+import asyncio
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import desc
-from sqlmodel import Session, select  # type: ignore
+from loguru import logger
+from sqlalchemy import func, insert
+from sqlmodel import Session, col, select  # type: ignore
 
+from workflow.cache.history import (
+    bump_history_version,
+    get_history_version,
+    swap_history_versions,
+)
+from workflow.configs import workflow_config
 from workflow.domain.models.history import History
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
-from workflow.extensions.middleware.getters import get_session
+from workflow.extensions.middleware.getters import get_async_session, get_session
+from workflow.utils.cache import TTLCache
 
 # Maximum number of history records to keep per node
 MAX_HISTORY_SIZE = 10
@@ -22,6 +31,77 @@ TOKEN_LIMIT = 8192 * 0.95
 # Database row length limit (95% of mediumText max length 16MB for safety margin)
 DB_ROW_LENGTH_LIMIT = 16777215 * 0.95
 
+# Raw (question, answer) rows per node id, newest first
+HistoryRows = Dict[str, List[Tuple[str, str]]]
+
+
+class CachedHistory:
+    """
+    Chat history of one flow/user pair kept in worker memory.
+    """
+
+    def __init__(self, version: str, rows: HistoryRows, history_size: int):
+        """
+        Initialize a cached history entry.
+
+        :param version: Redis history version the rows were read at
+        :param rows: Raw history rows per node id, newest first
+        :param history_size: Maximum number of rows kept per node
+        """
+        self.version = version
+        self.rows = rows
+        self.history_size = history_size
+
+
+# (flow_id, uid) -> CachedHistory
+_history_cache: TTLCache[Tuple[str, str], CachedHistory] = TTLCache(
+    ttl=workflow_config.history_config.cache_ttl,
+    max_size=workflow_config.history_config.cache_size,
+)
+
+
+def _build_history_record(
+    flow_id: str,
+    node_id: str,
+    uid: str,
+    raw_question: dict,
+    raw_answer: dict,
+    chat_id: Optional[str] = None,
+) -> History:
+    """Build a history record, truncating content that exceeds the row limit.
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param node_id: Unique identifier for the workflow node
+    :param uid: User identifier
+    :param raw_question: Question data as dictionary
+    :param raw_answer: Answer data as dictionary
+    :param chat_id: Optional chat session identifier
+    :return: Unsaved history record
+    """
+    # Truncate content if it exceeds database row length limit
+    rq_content = raw_question.get("content")
+    if (
+        isinstance(rq_content, str)
+        and len(rq_content.encode("utf-8")) > DB_ROW_LENGTH_LIMIT
+    ):
+        raw_question["content"] = rq_content[: int(DB_ROW_LENGTH_LIMIT)]
+    ra_content = raw_answer.get("content")
+    if (
+        isinstance(ra_content, str)
+        and len(ra_content.encode("utf-8")) > DB_ROW_LENGTH_LIMIT
+    ):
+        raw_answer["content"] = ra_content[: int(DB_ROW_LENGTH_LIMIT)]
+
+    # Serialize question and answer data to JSON strings
+    return History(
+        flow_id=flow_id,
+        node_id=node_id,
+        uid=uid,
+        raw_question=json.dumps(raw_question, ensure_ascii=False),
+        raw_answer=json.dumps(raw_answer, ensure_ascii=False),
+        chat_id=chat_id,
+    )
+
 
 def add_history(
     flow_id: str,
@@ -45,32 +125,9 @@ def add_history(
     """
     try:
         session: Session = next(get_session())
-        # Truncate content if it exceeds database row length limit
-        rq_content = raw_question.get("content")
-        if (
-            isinstance(rq_content, str)
-            and len(rq_content.encode("utf-8")) > DB_ROW_LENGTH_LIMIT
-        ):
-            raw_question["content"] = rq_content[: int(DB_ROW_LENGTH_LIMIT)]
-        ra_content = raw_answer.get("content")
-        if (
-            isinstance(ra_content, str)
-            and len(ra_content.encode("utf-8")) > DB_ROW_LENGTH_LIMIT
-        ):
-            raw_answer["content"] = ra_content[: int(DB_ROW_LENGTH_LIMIT)]
-
-        # Serialize question and answer data to JSON strings
-        question_str = json.dumps(raw_question, ensure_ascii=False)
-        answer_str = json.dumps(raw_answer, ensure_ascii=False)
-
         # Create and persist history record
-        db_history = History(
-            flow_id=flow_id,
-            node_id=node_id,
-            uid=uid,
-            raw_question=question_str,
-            raw_answer=answer_str,
-            chat_id=chat_id,
+        db_history = _build_history_record(
+            flow_id, node_id, uid, raw_question, raw_answer, chat_id
         )
         session.add(db_history)
         session.commit()
@@ -83,98 +140,550 @@ def add_history(
             cause_error=f"err code : {CodeEnum.ENG_RUN_ERROR.code}. "
             f"message: add_history method failed to add LLM history; {e}",
         ) from e
+    # The record is saved, so failing to publish its version must not fail it
+    try:
+        _on_history_appended({(flow_id, uid): [db_history]})
+    except Exception as e:
+        _on_publish_failed([(flow_id, uid)], e)
 
 
-def get_history(
+async def add_history_async(
     flow_id: str,
+    node_id: str,
     uid: str,
+    raw_question: dict,
+    raw_answer: dict,
+    chat_id: Optional[str] = None,
+    **kwargs: Any,
+) -> None:
+    """Queue a conversation history record for batched persistence.
+
+    The record is visible to ``get_history`` of this worker immediately and
+    written to the database by ``HistoryWriter``. When the writer is not
+    running the record is written as in ``add_history``, in a worker thread.
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param node_id: Unique identifier for the workflow node
+    :param uid: User identifier
+    :param raw_question: Question data as dictionary
+    :param raw_answer: Answer data as dictionary
+    :param chat_id: Optional chat session identifier
+    :param kwargs: Additional keyword arguments
+    :raises CustomException: If database operation fails
+    """
+    if not HistoryWriter.is_running():
+        await asyncio.to_thread(
+            add_history, flow_id, node_id, uid, raw_question, raw_answer, chat_id
+        )
+        return
+    record = _build_history_record(
+        flow_id, node_id, uid, raw_question, raw_answer, chat_id
+    )
+    await HistoryWriter.put(record)
+
+
+def _on_history_appended(appended: Dict[Tuple[str, str], List[History]]) -> None:
+    """Publish new history versions and update this worker's cached copies.
+
+    :param appended: Persisted records by (flow_id, uid), oldest first
+    """
+    if workflow_config.history_config.cache_ttl <= 0:
+        return
+    _apply_history_appended(appended, swap_history_versions(list(appended)))
+
+
+def _on_publish_failed(keys: Iterable[Tuple[str, str]], error: Exception) -> None:
+    """Drop this worker's cached copies of pairs whose version was not published.
+
+    Other workers may serve their copies until ``HISTORY_CACHE_TTL`` passes.
+
+    :param keys: (flow_id, uid) pairs of the appended records
+    :param error: Error raised while publishing
+    """
+    logger.error(f"Failed to publish history versions: {error}")
+    for key in keys:
+        _history_cache.delete(key)
+
+
+async def _on_history_appended_async(
+    appended: Dict[Tuple[str, str], List[History]],
+) -> None:
+    """Publish new history versions off the event loop and update this
+    worker's cached copies.
+
+    :param appended: Persisted records by (flow_id, uid), oldest first
+    """
+    if workflow_config.history_config.cache_ttl <= 0:
+        return
+    versions = await asyncio.to_thread(swap_history_versions, list(appended))
+    _apply_history_appended(appended, versions)
+
+
+def _apply_history_appended(
+    appended: Dict[Tuple[str, str], List[History]],
+    versions: Dict[Tuple[str, str], Tuple[Optional[str], str]],
+) -> None:
+    """Patch cached copies with appended records, or drop them if stale.
+
+    :param appended: Persisted records by (flow_id, uid), oldest first
+    :param versions: (previous, new) version token by (flow_id, uid)
+    """
+    for cache_key, records in appended.items():
+        entry = _history_cache.get(cache_key)
+        if entry is None:
+            continue
+        previous_version, new_version = versions[cache_key]
+        # Another worker appended in between, so the local copy is incomplete
+        if previous_version is None or entry.version != previous_version:
+            _history_cache.delete(cache_key)
+            continue
+        for record in records:
+            node_rows = entry.rows.get(record.node_id)
+            if node_rows is not None:
+                node_rows.insert(
+                    0, (record.raw_question or "", record.raw_answer or "")
+                )
+                del node_rows[entry.history_size :]
+        entry.version = new_version
+
+
+async def _query_history_rows(
+    flow_id: str, uid: str, node_ids: List[str], history_size: int
+) -> HistoryRows:
+    """Fetch the most recent history rows of several nodes in a single query.
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param uid: User identifier
+    :param node_ids: Node IDs to fetch history for
+    :param history_size: Maximum number of rows per node
+    :return: Raw history rows per node id, newest first
+    """
+    ranked = (
+        select(
+            History.node_id,
+            History.raw_question,
+            History.raw_answer,
+            func.row_number()
+            .over(
+                partition_by=History.node_id,
+                order_by=(col(History.create_time).desc(), col(History.id).desc()),
+            )
+            .label("row_num"),
+        )
+        .where(
+            History.flow_id == flow_id,
+            History.uid == uid,
+            History.node_id.in_(node_ids),  # type: ignore[attr-defined]
+        )
+        .subquery()
+    )
+    query = (
+        select(ranked.c.node_id, ranked.c.raw_question, ranked.c.raw_answer)
+        .where(ranked.c.row_num <= history_size)
+        .order_by(ranked.c.node_id, ranked.c.row_num)
+    )
+    rows: HistoryRows = {node_id: [] for node_id in node_ids}
+    async with get_async_session() as session:
+        result = await session.exec(query)
+        for node_id, raw_question, raw_answer in result.all():
+            rows[node_id].append((raw_question, raw_answer))
+    return rows
+
+
+async def _load_history_rows(
+    flow_id: str, uid: str, node_ids: List[str], history_size: int
+) -> HistoryRows:
+    """Load history rows from the worker cache, falling back to the database.
+
+    :param flow_id: Unique identifier for the workflow flow
+    :param uid: User identifier
+    :param node_ids: Node IDs to fetch history for
+    :param history_size: Maximum number of rows per node
+    :return: Raw history rows per node id, newest first
+    """
+    if workflow_config.history_config.cache_ttl <= 0:
+        return await _query_history_rows(flow_id, uid, node_ids, history_size)
+
+    cache_key = (flow_id, uid)
+    version = await asyncio.to_thread(get_history_version, flow_id, uid)
+    entry = _history_cache.get(cache_key)
+    if (
+        entry is not None
+        and version is not None
+        and entry.version == version
+        and entry.history_size >= history_size
+        and all(node_id in entry.rows for node_id in node_ids)
+    ):
+        return {node_id: entry.rows[node_id][:history_size] for node_id in node_ids}
+
+    # Publish a version before reading so that appends racing with this
+    # query invalidate the copy cached below
+    if version is None:
+        version = await asyncio.to_thread(bump_history_version, flow_id, uid)
+    rows = await _query_history_rows(flow_id, uid, node_ids, history_size)
+    _history_cache.set(
+        cache_key,
+        CachedHistory(
+            version=version,
+            rows={node_id: list(node_rows) for node_id, node_rows in rows.items()},
+            history_size=history_size,
+        ),
+    )
+    return rows
+
+
+class _PendingHistory:
+    """
+    Writer bookkeeping for one flow/user pair.
+    """
+
+    def __init__(self) -> None:
+        # Records queued but not yet committed, oldest first
+        self.records: List[History] = []
+        # Incremented whenever a flush including this pair starts
+        self.flush_generation = 0
+        # Set while a flush including this pair is in flight
+        self.flushing: Optional[asyncio.Event] = None
+        # Number of get_history calls currently reading this pair
+        self.readers = 0
+
+    def is_idle(self) -> bool:
+        return not self.records and self.flushing is None and self.readers == 0
+
+
+class HistoryWriter:
+    """
+    Background writer that persists history records in batches.
+
+    Records are buffered in a bounded queue and flushed with one multi-row
+    INSERT when ``HISTORY_WRITE_BATCH_SIZE`` records are queued or
+    ``HISTORY_WRITE_FLUSH_INTERVAL`` seconds have passed. A full queue makes
+    ``put`` wait, which applies backpressure to the chat turns producing
+    history. Queued records are overlaid onto ``get_history`` results so the
+    next turn of the same chat sees them before they are committed.
+    """
+
+    _queue: Optional["asyncio.Queue[Optional[History]]"] = None
+    _task: Optional["asyncio.Task[None]"] = None
+    _wakeup: Optional[asyncio.Event] = None
+    _pending: Dict[Tuple[str, str], _PendingHistory] = {}
+
+    @classmethod
+    async def setup(cls) -> None:
+        """
+        Start the background writer.
+        This method is called when the application starts.
+        """
+        config = workflow_config.history_config
+        if not config.write_async_enable or cls.is_running():
+            return
+        cls._queue = asyncio.Queue(maxsize=config.write_queue_size)
+        cls._wakeup = asyncio.Event()
+        cls._task = asyncio.create_task(cls._run())
+        logger.info("✅ History writer setup successfully")
+
+    @classmethod
+    async def close(cls) -> None:
+        """
+        Flush all queued records and stop the background writer.
+        This method is called when the application closes.
+        """
+        if cls._queue is None or cls._task is None:
+            return
+        await cls._queue.put(None)
+        cls._notify()
+        await cls._task
+        cls._queue = None
+        cls._task = None
+        cls._wakeup = None
+        logger.info("✅ History writer closed successfully")
+
+    @classmethod
+    def is_running(cls) -> bool:
+        """
+        Check whether the background writer accepts records.
+
+        :return: True if records are persisted in the background
+        """
+        return cls._task is not None and not cls._task.done()
+
+    @classmethod
+    async def put(cls, record: History) -> None:
+        """
+        Queue a record for persistence, waiting while the queue is full.
+
+        :param record: History record to persist
+        """
+        assert cls._queue is not None
+        key = (record.flow_id or "", record.uid)
+        cls._pending.setdefault(key, _PendingHistory()).records.append(record)
+        await cls._queue.put(record)
+        if cls._queue.qsize() >= workflow_config.history_config.write_batch_size:
+            cls._notify()
+
+    @classmethod
+    def _notify(cls) -> None:
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    @classmethod
+    async def _run(cls) -> None:
+        """
+        Collect queued records into batches and flush them until closed.
+        """
+        assert cls._queue is not None and cls._wakeup is not None
+        loop = asyncio.get_running_loop()
+        config = workflow_config.history_config
+        stopping = False
+        while not stopping:
+            first = await cls._queue.get()
+            if first is None:
+                break
+            batch = [first]
+            deadline = loop.time() + config.write_flush_interval
+            while len(batch) < config.write_batch_size:
+                while not cls._queue.empty() and len(batch) < config.write_batch_size:
+                    record = cls._queue.get_nowait()
+                    if record is None:
+                        stopping = True
+                        break
+                    batch.append(record)
+                remaining = deadline - loop.time()
+                if stopping or len(batch) >= config.write_batch_size or remaining <= 0:
+                    break
+                cls._wakeup.clear()
+                try:
+                    await asyncio.wait_for(cls._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+            await cls._flush(batch)
+
+    @classmethod
+    async def _flush(cls, batch: List[History]) -> None:
+        """
+        Persist a batch with one multi-row INSERT, retrying with backoff.
+
+        When every attempt failed, the records are written one at a time so
+        that a single bad record does not lose the rest of the batch.
+
+        :param batch: Records to persist, oldest first
+        """
+        config = workflow_config.history_config
+        for attempt in range(config.write_max_retries + 1):
+            if attempt:
+                await asyncio.sleep(config.write_retry_backoff * 2 ** (attempt - 1))
+            if await cls._flush_once(batch, last_attempt=False):
+                return
+        for record in batch:
+            await cls._flush_once([record], last_attempt=True)
+
+    @classmethod
+    async def _flush_once(cls, batch: List[History], last_attempt: bool) -> bool:
+        """
+        Make one attempt at persisting records.
+
+        Records stay in the overlay until they are committed, or until the
+        last attempt for them failed.
+
+        :param batch: Records to persist, oldest first
+        :param last_attempt: Whether records are given up on if this fails
+        :return: True if the records were committed
+        """
+        batch_by_key: Dict[Tuple[str, str], List[History]] = {}
+        for record in batch:
+            batch_by_key.setdefault((record.flow_id or "", record.uid), []).append(
+                record
+            )
+        for key in batch_by_key:
+            pending = cls._pending[key]
+            pending.flush_generation += 1
+            pending.flushing = asyncio.Event()
+        committed = False
+        try:
+            committed = await cls._insert(batch, last_attempt)
+            if committed:
+                # Readers wait for this flush, so they never see the committed
+                # records with a cached copy that lacks them
+                await cls._publish_appended(batch_by_key)
+        finally:
+            for key, records in batch_by_key.items():
+                pending = cls._pending[key]
+                if committed or last_attempt:
+                    done = {id(record) for record in records}
+                    pending.records = [r for r in pending.records if id(r) not in done]
+                assert pending.flushing is not None
+                pending.flushing.set()
+                pending.flushing = None
+                if pending.is_idle():
+                    del cls._pending[key]
+        return committed
+
+    @staticmethod
+    async def _insert(batch: List[History], last_attempt: bool) -> bool:
+        """
+        Insert records with one multi-row INSERT and commit them.
+
+        :param batch: Records to persist, oldest first
+        :param last_attempt: Whether records are given up on if this fails
+        :return: True if the records were committed
+        """
+        try:
+            rows = [record.model_dump(exclude={"id"}) for record in batch]
+            async with get_async_session() as session:
+                await session.exec(insert(History).values(rows))  # type: ignore[call-overload]
+                await session.commit()
+            return True
+        except Exception as e:
+            if last_attempt:
+                logger.error(f"Dropped {len(batch)} history records: {e}")
+            else:
+                logger.warning(f"Failed to persist {len(batch)} history records: {e}")
+            return False
+
+    @staticmethod
+    async def _publish_appended(
+        batch_by_key: Dict[Tuple[str, str], List[History]],
+    ) -> None:
+        """
+        Publish the history versions of committed records.
+
+        :param batch_by_key: Committed records by (flow_id, uid)
+        """
+        try:
+            await _on_history_appended_async(batch_by_key)
+        except Exception as e:
+            _on_publish_failed(batch_by_key, e)
+
+    @classmethod
+    async def read(
+        cls,
+        flow_id: str,
+        uid: str,
+        node_ids: List[str],
+        history_size: int,
+    ) -> HistoryRows:
+        """
+        Load history rows merged with records still waiting to be flushed.
+
+        :param flow_id: Unique identifier for the workflow flow
+        :param uid: User identifier
+        :param node_ids: Node IDs to fetch history for
+        :param history_size: Maximum number of rows per node
+        :return: Raw history rows per node id, newest first
+        """
+        key = (flow_id, uid)
+        pending = cls._pending.setdefault(key, _PendingHistory())
+        pending.readers += 1
+        try:
+            while True:
+                if pending.flushing is not None:
+                    await pending.flushing.wait()
+                    continue
+                generation = pending.flush_generation
+                rows = await _load_history_rows(flow_id, uid, node_ids, history_size)
+                # Retry if a flush of this pair overlapped the read
+                if pending.flushing is None and pending.flush_generation == generation:
+                    break
+            merged: HistoryRows = {}
+            for node_id, node_rows in rows.items():
+                overlay = [
+                    (record.raw_question or "", record.raw_answer or "")
+                    for record in reversed(pending.records)
+                    if record.node_id == node_id
+                ]
+                merged[node_id] = (overlay + node_rows)[:history_size]
+            return merged
+        finally:
+            pending.readers -= 1
+            if pending.is_idle():
+                cls._pending.pop(key, None)
+
+
+def _format_history(
+    rows: HistoryRows, node_max_token: Optional[Dict[str, int]] = None
+) -> List[Dict]:
+    """Format raw history rows into chronological chat history per node.
+
+    :param rows: Raw history rows per node id, newest first
+    :param node_max_token: Optional dictionary mapping node IDs to token limits
+    :return: List of dictionaries containing node history with chat records
+    """
+    history: List[Dict[str, Any]] = []
+    node_history_dict: Dict[str, List[Dict[str, Any]]] = {}
+    current_utf8_length = 0
+
+    for node_id, results_content in rows.items():
+        if not results_content:
+            continue
+        if node_id not in node_history_dict:
+            node_history_dict[node_id] = []
+
+        # Process each history record for the current node
+        for raw_question, raw_answer in results_content:
+            # Check token limits and break if exceeded
+            current_utf8_length += len(raw_question.encode("utf-8")) + len(
+                raw_answer.encode("utf-8")
+            )
+            max_token: Optional[float] = None
+            if node_max_token is not None:
+                # Use 80% of the specified token limit for safety margin
+                max_token = float(node_max_token.get(node_id, int(TOKEN_LIMIT))) * 0.8
+
+            if max_token is not None and current_utf8_length > max_token:
+                break
+
+            # Parse JSON strings back to dictionaries
+            question_dict = json.loads(raw_question)
+            answer_dict = json.loads(raw_answer)
+
+            # Add answer and question to history in chronological order
+            node_history_dict[node_id].append(
+                {
+                    "role": answer_dict.get("role"),
+                    "content": answer_dict.get("content"),
+                }
+            )
+            node_history_dict[node_id].append(
+                {
+                    "role": question_dict.get("role"),
+                    "content": question_dict.get("content"),
+                }
+            )
+    # Format final history structure
+    for node_id, chat_history in node_history_dict.items():
+        # Reverse to get chronological order (oldest first)
+        chat_history.reverse()
+        history.append({"nodeID": node_id, "chat_history": chat_history})
+    return history
+
+
+async def get_history(
+    flow_id: str,
+    uid: str,
+    node_ids: Iterable[str],
     node_max_token: Optional[Dict[str, int]] = None,
     history_size: int = MAX_HISTORY_SIZE,
 ) -> List[Dict]:
-    """Retrieve conversation history for a specific flow and user.
+    """Retrieve conversation history for the given nodes of a flow and user.
+
+    All nodes are fetched with one query through the async database session,
+    and the rows are cached in worker memory until another append publishes a
+    new history version.
 
     :param flow_id: Unique identifier for the workflow flow
     :param uid: User identifier
+    :param node_ids: IDs of the nodes that need chat history
     :param node_max_token: Optional dictionary mapping node IDs to token limits
     :param history_size: Maximum number of history records to retrieve per node
     :return: List of dictionaries containing node history with chat records
     :raises CustomException: If database operation fails
     """
     try:
-        session: Session = next(get_session())
-        # Get all unique node IDs for the specified flow
-        node_id_query = (
-            select(History.node_id)
-            .where(History.flow_id == flow_id, History.uid == uid)
-            .distinct()
-        )
-        node_ids = session.exec(node_id_query).all()
-        results: Dict[str, List[Any]] = {}
-
-        # Retrieve recent history records for each node
-        for node_id in node_ids:
-            # Get only the most recent MAX_HISTORY_SIZE records for each node_id
-            query = (
-                select(History.raw_question, History.raw_answer)
-                .where(
-                    History.flow_id == flow_id,
-                    History.node_id == node_id,
-                    History.uid == uid,
-                )
-                .order_by(desc("create_time"))
-                .limit(history_size)
-            )
-            query_results = session.exec(query).all()
-            results[node_id] = list(query_results)
-
-        # Process and format history data with token limits
-        history: List[Dict[str, Any]] = []
-        node_history_dict: Dict[str, List[Dict[str, Any]]] = {}
-        current_utf8_length = 0
-
-        for node_id, results_content in results.items():
-            if node_id not in node_history_dict:
-                node_history_dict[node_id] = []
-
-            # Process each history record for the current node
-            for raw_question, raw_answer in results_content:
-                # Check token limits and break if exceeded
-                current_utf8_length += len(raw_question.encode("utf-8")) + len(
-                    raw_answer.encode("utf-8")
-                )
-                max_token: Optional[float] = None
-                if node_max_token is not None:
-                    # Use 80% of the specified token limit for safety margin
-                    max_token = (
-                        float(node_max_token.get(node_id, int(TOKEN_LIMIT))) * 0.8
-                    )
-
-                if max_token is not None and current_utf8_length > max_token:
-                    break
-
-                # Parse JSON strings back to dictionaries
-                question_dict = json.loads(raw_question)
-                answer_dict = json.loads(raw_answer)
-
-                # Add answer and question to history in chronological order
-                node_history_dict[node_id].append(
-                    {
-                        "role": answer_dict.get("role"),
-                        "content": answer_dict.get("content"),
-                    }
-                )
-                node_history_dict[node_id].append(
-                    {
-                        "role": question_dict.get("role"),
-                        "content": question_dict.get("content"),
-                    }
-                )
-        # Format final history structure
-        for node_id, chat_history in node_history_dict.items():
-            # Reverse to get chronological order (oldest first)
-            chat_history.reverse()
-            history.append({"nodeID": node_id, "chat_history": chat_history})
-        return history
+        node_ids = list(dict.fromkeys(node_ids))
+        if not node_ids:
+            return []
+        rows = await HistoryWriter.read(flow_id, uid, node_ids, history_size)
+        return _format_history(rows, node_max_token)
     except Exception as e:
         raise CustomException(
             CodeEnum.ENG_RUN_ERROR,
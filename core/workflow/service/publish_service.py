@@ -15,7 +15,7 @@ from workflow.domain.models.flow import Flow
 from workflow.exception.e import CustomException
 from workflow.exception.errors.err_code import CodeEnum
 from workflow.extensions.otlp.trace.span import Span
-from workflow.service import app_service
+from workflow.service import app_service, engine_plan_service
 
 
 async def handle(
@@ -61,6 +61,13 @@ async def handle(
 
     # Handle version management for published workflows
     _handle_version(session, db_flow, publish_input)
+
+    # Precompile the execution plan so workers skip building the published DSL
+    if publish_input.release_status in [
+        ReleaseStatus.PUBLISH.value,
+        ReleaseStatus.PUBLISH_API.value,
+    ]:
+        engine_plan_service.compile_plan_later(db_flow.release_data)
     return
 
 
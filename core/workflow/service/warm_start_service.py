@@ -0,0 +1,177 @@
+"""
+Warm start service module.
+
+A freshly started worker has nothing in its local caches, has not imported the
+modules of any node type and has never built an engine. Before the worker
+serves requests, the warm start imports the configured node types and prepares
+the published flows that received the most open API traffic recently: their
+flow, license and app lookups are cached and their engine plans are loaded or
+compiled.
+"""
+
+import asyncio
+import importlib
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from workflow.cache import flow_traffic
+from workflow.configs import workflow_config
+from workflow.engine.nodes.cache_node import tool_classes
+from workflow.extensions.middleware.getters import get_async_session
+from workflow.extensions.otlp.trace.span import Span
+from workflow.service import app_service, engine_plan_service, flow_service
+
+# Modules imported on first use by model nodes
+_PRELOAD_MODULES = ("openai",)
+
+# Seconds requests are counted in memory before they are written in one batch
+_FLUSH_INTERVAL = 1.0
+
+# Requests counted since the last flush, by (flow_id, app_id, version)
+_pending_requests: Dict[Tuple[str, str, str], int] = {}
+_flush_task: Optional["asyncio.Task[None]"] = None
+
+
+def record_request(flow_id: str, app_id: str, version: str) -> None:
+    """
+    Count an open API request so later warm starts can prepare its flow.
+
+    Requests are counted in memory and written to the cache in batches by a
+    background task, off the request path.
+
+    :param flow_id: Flow ID that was requested
+    :param app_id: Application ID the request was made with
+    :param version: Requested flow version, empty for the latest one
+    """
+    global _flush_task
+    if workflow_config.warm_start_config.top_flows <= 0:
+        return
+    flow = (flow_id, app_id, version)
+    _pending_requests[flow] = _pending_requests.get(flow, 0) + 1
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(_flush_later())
+
+
+async def _flush_later() -> None:
+    """
+    Write the requests counted during the flush interval to the cache.
+    """
+    await asyncio.sleep(_FLUSH_INTERVAL)
+    await _write_requests()
+
+
+async def flush_requests() -> None:
+    """
+    Write the requests counted so far to the cache without waiting for the
+    flush interval, so a stopping worker does not drop them.
+    """
+    if _flush_task is not None and not _flush_task.done():
+        _flush_task.cancel()
+    await _write_requests()
+
+
+async def _write_requests() -> None:
+    """
+    Write the requests counted since the last flush to the cache.
+
+    Failures are logged and the counts are dropped.
+    """
+    counts = dict(_pending_requests)
+    _pending_requests.clear()
+    if not counts:
+        return
+    try:
+        await asyncio.to_thread(
+            flow_traffic.record_flow_requests,
+            counts,
+            workflow_config.warm_start_config.window,
+        )
+    except Exception as e:
+        logger.warning(f"Failed to record flow traffic: {e}")
+
+
+async def warm_start() -> None:
+    """
+    Prepare node modules and the most requested flows before the worker
+    serves requests.
+
+    The warm start is bounded by the configured timeout and never fails
+    startup: errors only leave the remaining flows cold.
+    """
+    config = workflow_config.warm_start_config
+    if config.node_types:
+        try:
+            _preload_node_types(config.node_types)
+        except Exception as e:
+            logger.warning(f"Failed to preload node types: {e}")
+    if config.top_flows <= 0:
+        return
+    span = Span()
+    with span.start("WarmStart") as span_context:
+        try:
+            warmed = await asyncio.wait_for(
+                _warm_hot_flows(config.top_flows, config.window, span_context),
+                config.timeout,
+            )
+            logger.info(f"🔥 Warm start prepared {warmed} flows")
+        except asyncio.TimeoutError:
+            span_context.add_error_event("Warm start timed out")
+            logger.warning(f"Warm start did not finish within {config.timeout}s")
+        except Exception as e:
+            span_context.record_exception(e)
+            logger.warning(f"Warm start failed: {e}")
+
+
+def _preload_node_types(node_types: str) -> None:
+    """
+    Import the modules of the configured node types.
+
+    :param node_types: Comma separated node types, "*" for all of them
+    """
+    if node_types.strip() == "*":
+        tool_classes.preload()
+    else:
+        tool_classes.preload(node_type.strip() for node_type in node_types.split(","))
+
+
+async def _warm_hot_flows(limit: int, window: int, span: Span) -> int:
+    """
+    Import lazily loaded modules and prepare the most requested flows.
+
+    :param limit: Maximum number of flows to prepare
+    :param window: Seconds of recent traffic flows are ranked by
+    :param span: Tracing span for observability
+    :return: Number of flows prepared
+    """
+    for module in _PRELOAD_MODULES:
+        await asyncio.to_thread(importlib.import_module, module)
+
+    hot_flows = await asyncio.to_thread(flow_traffic.get_hot_flows, limit, window)
+    results = await asyncio.gather(
+        *(_warm_flow(hot_flow, span) for hot_flow in hot_flows),
+        return_exceptions=True,
+    )
+    for hot_flow, result in zip(hot_flows, results):
+        if isinstance(result, BaseException):
+            span.add_error_event(f"Failed to warm flow {hot_flow[0]}: {result}")
+    return sum(1 for result in results if not isinstance(result, BaseException))
+
+
+async def _warm_flow(hot_flow: Tuple[str, str, str], span: Span) -> None:
+    """
+    Cache the lookups of one published flow and load or compile its plan.
+
+    :param hot_flow: (flow_id, app_id, version) of the flow
+    :param span: Tracing span for observability
+    """
+    flow_id, app_id, version = hot_flow
+    async with get_async_session() as session:
+        db_flow = await flow_service.get_latest_published_flow_by_async(
+            flow_id, app_id, session, span, version
+        )
+        await app_service.get_info_async(app_id, session, span)
+
+    plan_key = engine_plan_service.get_plan_key(db_flow.release_data)
+    if await engine_plan_service.load_plan(plan_key, span) is None:
+        await engine_plan_service.compile_plan(db_flow.release_data, span)
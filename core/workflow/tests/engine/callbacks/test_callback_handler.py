@@ -442,6 +442,28 @@ class TestChatCallBacks:
 
                     mock_put.assert_called_once_with("test_node", mock_resp)
 
+    @pytest.mark.asyncio
+    async def test_on_node_item_progress(self, callback_handler: ChatCallBacks) -> None:
+        """Test item progress event carries the item index, status and outputs."""
+        callback_handler.node_execute_start_time["iteration::1"] = 1000.0
+
+        with patch.object(
+            callback_handler, "_put_frame_into_queue", new_callable=AsyncMock
+        ) as mock_put:
+            with patch("time.time", return_value=1002.0):
+                await callback_handler.on_node_item_progress(
+                    "iteration::1", "Iteration", 2, 10, "succeeded", {"output": "x"}
+                )
+
+        node_id, resp = mock_put.call_args.args
+        assert node_id == "iteration::1"
+        assert resp.workflow_step.node.outputs == {"output": "x"}
+        assert resp.workflow_step.node.executed_time == 2.0
+        assert resp.workflow_step.node.ext == {
+            "item_progress": {"index": 2, "total": 10, "status": "succeeded"}
+        }
+        assert resp.choices[0].finish_reason is None
+
     @pytest.mark.asyncio
     async def test_on_node_end_success(self, callback_handler: ChatCallBacks) -> None:
         """Test node end event handling with successful result."""
@@ -14,7 +14,8 @@ from workflow.engine.dsl_engine import (
 )
 from workflow.engine.entities.node_entities import NodeType
 from workflow.engine.entities.output_mode import EndNodeOutputModeEnum
-from workflow.engine.entities.variable_pool import VariablePool
+from workflow.engine.entities.provider_credentials import ProviderCredentials
+from workflow.engine.entities.variable_pool import ParamKey, VariablePool
 from workflow.engine.entities.workflow_dsl import WorkflowDSL
 from workflow.engine.node import SparkFlowEngineNode
 from workflow.engine.nodes.base_node import BaseNode
@@ -196,6 +197,61 @@ class TestWorkflowEngine:
             assert timestamp == 0
             mock_span.record_exception.assert_called_once()
 
+    def test_snapshot_round_trip(self) -> None:
+        """Test run state restored from a snapshot onto a freshly built engine."""
+        dsl = json.loads(BASE_DSL_SCHEMA).get("data", {})
+        engine = WorkflowEngineFactory.create_engine(
+            WorkflowDSL.model_validate(dsl), Span()
+        )
+        start_id = engine.sparkflow_engine_node.node_id
+        engine.engine_ctx.node_run_status[start_id].complete.set()
+        variable_pool = engine.engine_ctx.variable_pool
+        output_key = next(
+            key
+            for key in variable_pool.output_variable_mapping
+            if key.startswith(f"{start_id}-")
+        )
+        variable_pool.output_variable_mapping[output_key]["value"] = "hello"
+        credentials = ProviderCredentials(app_id="app", api_key="k", api_secret="s")
+        variable_pool.system_params.set(ParamKey.Uid, "uid").set(
+            ParamKey.Credentials, credentials
+        )
+
+        snapshot = engine.dump_snapshot(Span(), interrupt_node="node-qa::1")
+        assert snapshot and len(snapshot) < len(engine.dumps(Span()))
+
+        plan = WorkflowEngineFactory.create_engine(
+            WorkflowDSL.model_validate(dsl), Span()
+        )
+        restored, interrupt_node = WorkflowEngine.load_snapshot(snapshot, plan, Span())
+
+        assert restored is plan
+        assert interrupt_node == "node-qa::1"
+        assert plan.engine_ctx.node_run_status[start_id].complete.is_set()
+        assert (
+            plan.engine_ctx.variable_pool.output_variable_mapping[output_key]["value"]
+            == "hello"
+        )
+        system_params = plan.engine_ctx.variable_pool.system_params
+        assert system_params.get(ParamKey.Uid) == "uid"
+        assert system_params.get(ParamKey.Credentials) == credentials
+
+    def test_snapshot_plan_mismatch(self) -> None:
+        """Test a snapshot is rejected by an engine built from another plan."""
+        dsl = json.loads(BASE_DSL_SCHEMA).get("data", {})
+        engine = WorkflowEngineFactory.create_engine(
+            WorkflowDSL.model_validate(dsl), Span()
+        )
+        snapshot = engine.dump_snapshot(Span())
+
+        plan = WorkflowEngineFactory.create_engine(
+            WorkflowDSL.model_validate(dsl), Span()
+        )
+        plan.workflow_dsl.nodes[0].data.nodeMeta.aliasName = "changed"
+        restored, _ = WorkflowEngine.load_snapshot(snapshot, plan, Span())
+
+        assert restored is None
+
 
 class TestWorkflowEngineAdvanced:
     """Test cases for advanced WorkflowEngine functionality."""
@@ -0,0 +1,121 @@
+"""
+Test module for early exit of decision nodes.
+
+This module contains unit tests for watching the decision field in streamed
+JSON output, parsing output cut short after the decision, and aborting the
+LLM stream once the decision is known.
+"""
+
+import json
+from typing import AsyncGenerator, List
+
+import pytest
+
+from workflow.engine.nodes.base_node import BaseLLMNode
+from workflow.engine.nodes.decision.decision_node import (
+    _FieldWatcher,
+    _find_string_field,
+    _parse_decision,
+)
+from workflow.extensions.otlp.trace.span import Span
+
+
+def feed(watcher: _FieldWatcher, chunks: List[str]) -> List[bool]:
+    """Feed chunks to the watcher and collect its answer to each one."""
+    return [watcher(chunk) for chunk in chunks]
+
+
+def test_field_name_split_across_chunks() -> None:
+    """Test the field is found when its name arrives in several chunks."""
+    watcher = _FieldWatcher("destination")
+    chunks = ['{"reason": "x", "desti', "nat", 'ion": "bra', 'nch-1"', "}"]
+
+    assert feed(watcher, chunks) == [False, False, False, True, True]
+
+
+def test_value_is_not_complete_before_its_closing_quote() -> None:
+    """Test an unterminated value does not stop the stream."""
+    watcher = _FieldWatcher("destination")
+
+    assert feed(watcher, ['{"destination": "bran']) == [False]
+    assert _find_string_field('{"destination": "bran', "destination") is None
+
+
+def test_escaped_quotes_stay_in_the_value() -> None:
+    """Test an escaped quote neither ends the value nor survives undecoded."""
+    watcher = _FieldWatcher("category_name")
+    chunks = ['{"category_name": "say \\"', 'hi\\" now', '"}']
+
+    assert feed(watcher, chunks) == [False, False, True]
+    assert _find_string_field("".join(chunks), "category_name") == 'say "hi" now'
+
+
+def test_cut_short_output_falls_back_to_the_field() -> None:
+    """Test output aborted after the decision parses as that single field."""
+    res = '{"destination": "branch-1", "reason": "the user as'
+
+    assert _parse_decision(res, res, "destination") == {"destination": "branch-1"}
+
+
+def test_complete_output_is_parsed_whole() -> None:
+    """Test complete JSON output keeps all of its fields."""
+    res = '{"destination": "branch-1", "reason": "why"}'
+
+    assert _parse_decision(res, res, "destination") == {
+        "destination": "branch-1",
+        "reason": "why",
+    }
+
+
+def test_output_without_the_field_still_fails() -> None:
+    """Test invalid output without a complete decision raises the parse error."""
+    res = '{"reason": "the user as'
+
+    with pytest.raises(json.JSONDecodeError):
+        _parse_decision(res, res, "destination")
+
+
+class Stream:
+    """
+    LLM stream recording whether it was closed.
+    """
+
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def responses(self) -> AsyncGenerator[str, None]:
+        try:
+            for chunk in ['{"destination": ', '"branch-1"', ', "reason": "x"}']:
+                yield chunk
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_stream_is_closed_once_the_predicate_fires() -> None:
+    """Test the stream is aclosed on the chunk completing the decision."""
+    stream = Stream()
+    llm_stream = stream.responses()
+    watcher = _FieldWatcher("destination")
+    received = []
+
+    async for chunk in llm_stream:
+        received.append(chunk)
+        if await BaseLLMNode._stop_early(watcher, chunk, llm_stream, Span()):
+            break
+
+    assert received == ['{"destination": ', '"branch-1"']
+    assert stream.closed
+
+
+@pytest.mark.asyncio
+async def test_stream_is_kept_without_a_predicate() -> None:
+    """Test the stream is not touched when early exit is disabled."""
+    stream = Stream()
+    llm_stream = stream.responses()
+
+    chunk = await llm_stream.__anext__()
+
+    assert not await BaseLLMNode._stop_early(None, chunk, llm_stream, Span())
+    assert not stream.closed
+    await llm_stream.aclose()
@@ -0,0 +1,125 @@
+"""
+Test module for the run-scoped cache of the global variables node.
+
+This module contains unit tests for serving repeated reads of a run from one
+Redis read and for writing set variables back to Redis.
+"""
+
+from typing import Any, Dict, List, Literal
+from unittest.mock import Mock
+
+import pytest
+
+from workflow.engine.entities.variable_pool import ParamKey, SystemParams
+from workflow.engine.nodes.entities.node_run_result import WorkflowNodeExecutionStatus
+from workflow.engine.nodes.global_variables import global_variables_node
+from workflow.engine.nodes.global_variables.global_variables_node import (
+    GlobalVariablesNode,
+)
+from workflow.extensions.otlp.trace.span import Span
+
+
+class FakeCacheService:
+    """
+    Stand-in for the Redis hash operations of the cache service.
+    """
+
+    def __init__(self) -> None:
+        self.hashes: Dict[str, Dict[str, Any]] = {}
+        self.reads: List[List[str]] = []
+        self.writes: List[Dict[str, Any]] = []
+
+    def hash_get_many(self, name: str, keys: List[str]) -> Dict[str, Any]:
+        self.reads.append(keys)
+        stored = self.hashes.get(name, {})
+        return {key: stored[key] for key in keys if key in stored}
+
+    def hash_set_many(
+        self, name: str, mapping: Dict[str, Any], expire: Any = None
+    ) -> None:
+        self.writes.append(dict(mapping))
+        self.hashes.setdefault(name, {}).update(mapping)
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> FakeCacheService:
+    """Cache service patched into the node module, with run caching enabled."""
+    fake = FakeCacheService()
+    monkeypatch.setattr(global_variables_node, "get_cache_service", lambda: fake)
+    monkeypatch.setattr(
+        global_variables_node.workflow_config.global_variable_config,
+        "run_cache",
+        True,
+    )
+    return fake
+
+
+def variable_pool(values: Dict[str, Any]) -> Mock:
+    """Variable pool stub of one run resolving inputs from a dictionary."""
+    pool = Mock()
+    pool.system_params = SystemParams()
+    pool.system_params.set(ParamKey.FlowId, "flow")
+    pool.system_params.set(ParamKey.Uid, "uid")
+    pool.system_params.set(ParamKey.AppId, "app")
+    pool.system_params.set(ParamKey.ChatId, "chat")
+    pool.get_variable.side_effect = lambda node_id, key_name, span: values.get(key_name)
+    return pool
+
+
+def node(
+    method: Literal["set", "get"], identifiers: List[str], index: int = 1
+) -> GlobalVariablesNode:
+    """Global variables node setting or getting the given variables."""
+    return GlobalVariablesNode(
+        node_id=f"node-variable::{index}",
+        method=method,
+        input_identifier=identifiers if method == "set" else [],
+        output_identifier=identifiers if method == "get" else [],
+    )
+
+
+@pytest.mark.asyncio
+async def test_repeated_gets_in_a_run_read_redis_once(
+    cache: FakeCacheService,
+) -> None:
+    """Test later get nodes of the run are served from the run cache."""
+    cache.hashes["sparkflowV2:variable_pool:flow:uid:app:chat"] = {"a": "1"}
+    pool = variable_pool({})
+
+    for index in range(3):
+        result = await node("get", ["a"], index).async_execute(pool, span=Span())
+        assert result.status == WorkflowNodeExecutionStatus.SUCCEEDED
+        assert result.outputs == {"a": "1"}
+
+    assert cache.reads == [["a"]]
+
+
+@pytest.mark.asyncio
+async def test_sets_are_written_back_and_read_from_the_run_cache(
+    cache: FakeCacheService,
+) -> None:
+    """Test a set writes Redis once and a later get in the run needs no read."""
+    pool = variable_pool({"a": "x", "b": "y"})
+
+    await node("set", ["a", "b"]).async_execute(pool, span=Span())
+    result = await node("get", ["a", "b", "c"], 2).async_execute(pool, span=Span())
+
+    assert cache.writes == [{"a": "x", "b": "y"}]
+    assert cache.hashes["sparkflowV2:variable_pool:flow:uid:app:chat"] == {
+        "a": "x",
+        "b": "y",
+    }
+    # Only the variable the run has not seen yet is read
+    assert cache.reads == [["c"]]
+    assert result.outputs == {"a": "x", "b": "y", "c": None}
+
+
+@pytest.mark.asyncio
+async def test_runs_do_not_share_their_cache(cache: FakeCacheService) -> None:
+    """Test a new run reads Redis again instead of another run's cache."""
+    cache.hashes["sparkflowV2:variable_pool:flow:uid:app:chat"] = {"a": "1"}
+
+    await node("get", ["a"]).async_execute(variable_pool({}), span=Span())
+    await node("get", ["a"]).async_execute(variable_pool({}), span=Span())
+
+    assert cache.reads == [["a"], ["a"]]
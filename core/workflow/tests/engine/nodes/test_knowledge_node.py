@@ -0,0 +1,260 @@
+"""
+Test module for knowledge node retrieval.
+
+This module contains unit tests for speculative retrieval in adaptive search
+mode and for the result cache of repeated searches.
+"""
+
+import asyncio
+from typing import Any, Dict, Iterator, List, Optional
+from unittest.mock import Mock
+
+import pytest
+
+from workflow.cache import knowledge as knowledge_cache
+from workflow.engine.nodes.knowledge import knowledge_node
+from workflow.engine.nodes.knowledge.knowledge_client import KnowledgeConfig
+from workflow.engine.nodes.knowledge.knowledge_node import KnowledgeNode
+from workflow.extensions.otlp.trace.span import Span
+
+
+class FakeRetrieval:
+    """
+    Stand-in for the knowledge search and the adaptive decision of the LLM.
+    """
+
+    def __init__(self, should_use: bool, delay: float = 0.0) -> None:
+        self.should_use = should_use
+        self.delay = delay
+        self.started = asyncio.Event()
+        self.searches = 0
+        self.cancelled = False
+
+    async def retrieve(self, *args: Any) -> str:
+        self.searches += 1
+        self.started.set()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return '{"results": []}'
+
+    async def decide(self, *args: Any) -> tuple[bool, dict]:
+        # The search is already running while the LLM decides
+        await asyncio.wait_for(self.started.wait(), timeout=1)
+        return self.should_use, {"total_tokens": 3}
+
+
+@pytest.fixture
+def speculative(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Enable speculative retrieval for the test."""
+    monkeypatch.setattr(
+        knowledge_node.workflow_config.knowledge_node_llm_config,
+        "speculative_retrieval",
+        True,
+    )
+    yield
+
+
+def node(monkeypatch: pytest.MonkeyPatch, fake: FakeRetrieval) -> KnowledgeNode:
+    """Adaptive knowledge node searching and deciding through the fake."""
+    monkeypatch.setattr(KnowledgeNode, "_retrieve", lambda self, *a: fake.retrieve())
+    monkeypatch.setattr(
+        KnowledgeNode, "_should_use_knowledge", lambda self, *a: fake.decide()
+    )
+    return KnowledgeNode(
+        node_id="knowledge-base::1",
+        input_identifier=["query"],
+        output_identifier=["results"],
+        search_mode="adaptive",
+    )
+
+
+@pytest.mark.asyncio
+async def test_positive_decision_awaits_the_speculative_search(
+    monkeypatch: pytest.MonkeyPatch, speculative: None
+) -> None:
+    """Test a positive decision uses the search started before it."""
+    fake = FakeRetrieval(should_use=True, delay=0.01)
+    span = Mock()
+
+    result, usage = await node(monkeypatch, fake)._adaptive_retrieve(
+        "query", [], Mock(), span, None
+    )
+
+    assert result == '{"results": []}'
+    assert usage == {"total_tokens": 3}
+    assert fake.searches == 1
+    span.set_attribute.assert_called_once_with("speculative_retrieval", "used")
+
+
+@pytest.mark.asyncio
+async def test_negative_decision_cancels_the_speculative_search(
+    monkeypatch: pytest.MonkeyPatch, speculative: None
+) -> None:
+    """Test a negative decision cancels the search and records it as wasted."""
+    fake = FakeRetrieval(should_use=False, delay=10)
+    span = Mock()
+    trace = Mock()
+
+    result, _ = await node(monkeypatch, fake)._adaptive_retrieve(
+        "query", [], Mock(), span, trace
+    )
+    await asyncio.sleep(0)
+
+    assert result is None
+    assert fake.cancelled
+    span.set_attribute.assert_called_once_with("speculative_retrieval", "wasted")
+    assert trace.add_info_log.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_search_waits_for_the_decision_without_speculation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the search only starts after a positive decision by default."""
+    monkeypatch.setattr(
+        knowledge_node.workflow_config.knowledge_node_llm_config,
+        "speculative_retrieval",
+        False,
+    )
+    fake = FakeRetrieval(should_use=True)
+    order: List[str] = []
+
+    async def decide(*args: Any) -> tuple[bool, dict]:
+        order.append("decide")
+        return True, {}
+
+    async def retrieve(*args: Any) -> str:
+        order.append("retrieve")
+        return await fake.retrieve()
+
+    monkeypatch.setattr(KnowledgeNode, "_retrieve", lambda self, *a: retrieve())
+    monkeypatch.setattr(
+        KnowledgeNode, "_should_use_knowledge", lambda self, *a: decide()
+    )
+    span = Mock()
+    knowledge = KnowledgeNode(
+        node_id="knowledge-base::1",
+        input_identifier=["query"],
+        output_identifier=["results"],
+        search_mode="adaptive",
+    )
+
+    await knowledge._adaptive_retrieve("query", [], Mock(), span, None)
+
+    assert order == ["decide", "retrieve"]
+    span.set_attribute.assert_not_called()
+
+
+class FakeCacheService:
+    """
+    Stand-in for the Redis operations of the knowledge result cache.
+    """
+
+    def __init__(self) -> None:
+        self.values: Dict[str, Any] = {}
+        self.hashes: Dict[str, Dict[str, Any]] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self.values.get(key)
+
+    def set(self, key: str, value: Any, expire_time: Optional[int] = None) -> None:
+        self.values[key] = value
+
+    def hash_get_many(self, name: str, keys: List[str]) -> Dict[str, Any]:
+        stored = self.hashes.get(name, {})
+        return {key: stored[key] for key in keys if key in stored}
+
+    def hash_set_many(
+        self, name: str, mapping: Dict[str, Any], expire: Any = None
+    ) -> None:
+        self.hashes.setdefault(name, {}).update(mapping)
+
+
+class FakeKnowledgeClient:
+    """
+    Knowledge client counting the searches it sends.
+    """
+
+    def __init__(self, query: str, delay: float = 0.0) -> None:
+        self.config = KnowledgeConfig(
+            top_n="5", rag_type="AIUI-RAG2", repo_id=["r1"], url="", query=query
+        )
+        self.delay = delay
+        self.searches = 0
+
+    async def top_k(self, **kwargs: Any) -> str:
+        self.searches += 1
+        await asyncio.sleep(self.delay)
+        return f'{{"results": [{self.searches}]}}'
+
+
+@pytest.fixture
+def cache(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeCacheService]:
+    """Redis patched into the knowledge cache, with an empty local tier."""
+    fake = FakeCacheService()
+    monkeypatch.setattr(knowledge_cache, "get_cache_service", lambda: fake)
+    knowledge_node._knowledge_results.clear()
+    yield fake
+    knowledge_node._knowledge_results.clear()
+
+
+def cached_node() -> KnowledgeNode:
+    """Knowledge node with the result cache enabled."""
+    return KnowledgeNode(
+        node_id="knowledge-base::1",
+        input_identifier=["query"],
+        output_identifier=["results"],
+        enableResultCache=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_same_normalized_query_is_served_from_cache(
+    cache: FakeCacheService,
+) -> None:
+    """Test a query differing only in whitespace reuses the cached result."""
+    first = FakeKnowledgeClient("what is  rag")
+    second = FakeKnowledgeClient(" what is rag ")
+
+    result = await cached_node()._cached_top_k(first, Span(), None)  # type: ignore[arg-type]
+    # Served by Redis once the local tier is gone
+    knowledge_node._knowledge_results.clear()
+    again = await cached_node()._cached_top_k(second, Span(), None)  # type: ignore[arg-type]
+
+    assert result == again == '{"results": [1]}'
+    assert first.searches == 1
+    assert second.searches == 0
+
+
+@pytest.mark.asyncio
+async def test_bumped_repo_version_misses_the_cache(cache: FakeCacheService) -> None:
+    """Test changing a referenced repository makes its cached results stale."""
+    client = FakeKnowledgeClient("what is rag")
+
+    await cached_node()._cached_top_k(client, Span(), None)  # type: ignore[arg-type]
+    knowledge_cache.bump_knowledge_repo_versions(["r1"])
+    result = await cached_node()._cached_top_k(client, Span(), None)  # type: ignore[arg-type]
+
+    assert client.searches == 2
+    assert result == '{"results": [2]}'
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_are_coalesced(
+    cache: FakeCacheService,
+) -> None:
+    """Test identical searches in flight together send one request."""
+    client = FakeKnowledgeClient("what is rag", delay=0.02)
+
+    results = await asyncio.gather(
+        *(
+            cached_node()._cached_top_k(client, Span(), None)  # type: ignore[arg-type]
+            for _ in range(4)
+        )
+    )
+
+    assert results == ['{"results": [1]}'] * 4
+    assert client.searches == 1
@@ -0,0 +1,118 @@
+"""
+Test module for pure node memoization keys.
+
+This module contains unit tests for deciding which nodes may be memoized and
+for deriving memoization keys from node configuration and resolved inputs.
+"""
+
+from typing import Any, Dict
+from unittest.mock import Mock
+
+from workflow.engine.nodes.code.code_node import CodeNode
+from workflow.engine.nodes.if_else.if_else_node import IFElseNode
+from workflow.engine.nodes.text_joiner.text_joiner_node import TextJoinerNode
+from workflow.extensions.otlp.trace.span import Span
+
+
+def variable_pool(values: Dict[str, Any]) -> Mock:
+    """Variable pool stub resolving input names from a dictionary."""
+    pool = Mock()
+    pool.get_variable.side_effect = lambda node_id, key_name, span: values[key_name]
+    return pool
+
+
+def text_joiner(**kwargs: Any) -> TextJoinerNode:
+    """Text joiner node joining inputs a and b."""
+    return TextJoinerNode(
+        node_id="text-joiner::1",
+        input_identifier=["a", "b"],
+        output_identifier=["output"],
+        prompt="{{a}}-{{b}}",
+        **kwargs,
+    )
+
+
+def code_node(deterministic: bool = False) -> CodeNode:
+    """Code node without inputs."""
+    return CodeNode.model_validate(
+        {
+            "node_id": "ifly-code::1",
+            "input_identifier": [],
+            "output_identifier": [],
+            "code": "def main():\n    return {}",
+            "appId": "app",
+            "uid": "uid",
+            "deterministic": deterministic,
+        }
+    )
+
+
+def if_else() -> IFElseNode:
+    """If-else node comparing inputs x and y."""
+    return IFElseNode.model_validate(
+        {
+            "node_id": "if-else::1",
+            "input_identifier": [{"left": "x", "right": "y"}],
+            "output_identifier": [],
+            "cases": [
+                {
+                    "id": "branch_one_of::1",
+                    "level": 1,
+                    "logicalOperator": "and",
+                    "conditions": [
+                        {
+                            "leftVarIndex": "left",
+                            "rightVarIndex": "right",
+                            "compareOperator": "eq",
+                        }
+                    ],
+                },
+                {
+                    "id": "branch_one_of::2",
+                    "level": 999,
+                    "logicalOperator": "and",
+                    "conditions": [],
+                },
+            ],
+        }
+    )
+
+
+def test_memo_key_follows_inputs_and_config() -> None:
+    """Test keys match for identical inputs and differ when inputs or config change."""
+    node = text_joiner()
+    key = node.memo_key(variable_pool({"a": "x", "b": "y"}), Span())
+
+    assert key is not None
+    assert key == text_joiner().memo_key(variable_pool({"a": "x", "b": "y"}), Span())
+    assert key != node.memo_key(variable_pool({"a": "x", "b": "z"}), Span())
+    assert key != text_joiner(separator=",").memo_key(
+        variable_pool({"a": "x", "b": "y"}), Span()
+    )
+
+
+def test_unserializable_inputs_are_not_memoized() -> None:
+    """Test inputs that cannot be serialized yield no key."""
+    node = text_joiner()
+
+    assert node.memo_key(variable_pool({"a": object(), "b": "y"}), Span()) is None
+
+
+def test_memoizable_nodes() -> None:
+    """Test purity declarations and the per-node opt-out."""
+    assert text_joiner().is_memoizable()
+    assert not text_joiner(enableMemoization=False).is_memoizable()
+
+    assert not code_node().is_memoizable()
+    assert code_node(deterministic=True).is_memoizable()
+
+
+def test_if_else_memo_key_resolves_condition_variables() -> None:
+    """Test if-else keys are derived from the variables its conditions compare."""
+    node = if_else()
+    key = node.memo_key(variable_pool({"x": 1, "y": 2}), Span())
+
+    assert node.is_memoizable()
+    assert key is not None
+    assert key == if_else().memo_key(variable_pool({"x": 1, "y": 2}), Span())
+    assert key != node.memo_key(variable_pool({"x": 1, "y": 3}), Span())
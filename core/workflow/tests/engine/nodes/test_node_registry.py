@@ -0,0 +1,46 @@
+"""
+Test module for the lazy node registry.
+
+This module contains unit tests checking node modules are imported on first
+lookup only and that every registered node type resolves to a node class.
+"""
+
+import sys
+
+import pytest
+
+from workflow.engine.nodes.base_node import BaseNode
+from workflow.engine.nodes.cache_node import LazyNodeRegistry, node_modules
+
+
+def test_module_is_imported_on_first_lookup() -> None:
+    """Test a node module is only imported once its type is looked up."""
+    module_path = "workflow.engine.nodes.text_joiner.text_joiner_node"
+    original = sys.modules.pop(module_path, None)
+    try:
+        registry = LazyNodeRegistry({"text-joiner": (module_path, "TextJoinerNode")})
+
+        assert "text-joiner" in registry
+        assert module_path not in sys.modules
+
+        node_class = registry["text-joiner"]
+
+        assert module_path in sys.modules
+        assert node_class is sys.modules[module_path].TextJoinerNode
+        assert registry.get("unknown") is None
+    finally:
+        if original is not None:
+            sys.modules[module_path] = original
+
+
+def test_preload_resolves_every_registered_type() -> None:
+    """Test all registered node types import and resolve to node classes."""
+    registry = LazyNodeRegistry(node_modules)
+
+    registry.preload()
+
+    assert len(registry) == len(node_modules)
+    for node_type in registry:
+        assert issubclass(registry[node_type], BaseNode)
+    with pytest.raises(KeyError):
+        registry["unknown"]
@@ -0,0 +1,91 @@
+"""
+Test module for resolving the model provider credentials of a node.
+
+This module contains unit tests for choosing between the run's credential
+overlay and the credentials written in the node DSL.
+"""
+
+from typing import Optional
+from unittest.mock import Mock
+
+from workflow.consts.engine.model_provider import ModelProviderEnum
+from workflow.engine.entities.provider_credentials import ProviderCredentials
+from workflow.engine.entities.variable_pool import ParamKey, SystemParams
+from workflow.engine.nodes.code.code_node import CodeNode
+from workflow.engine.nodes.llm.spark_llm_node import SparkLLMNode
+
+OVERLAY = ProviderCredentials(
+    app_id="caller-app", api_key="caller-key", api_secret="caller-secret"
+)
+
+
+def variable_pool(credentials: Optional[ProviderCredentials]) -> Mock:
+    """Variable pool stub whose system parameters hold the given overlay."""
+    pool = Mock()
+    pool.system_params = SystemParams()
+    if credentials is not None:
+        pool.system_params.set(ParamKey.Credentials, credentials)
+    return pool
+
+
+def llm_node(source: str = ModelProviderEnum.XINGHUO.value) -> SparkLLMNode:
+    """LLM node with its own credentials in the DSL."""
+    return SparkLLMNode.model_validate(
+        {
+            "node_id": "spark-llm::1",
+            "input_identifier": [],
+            "output_identifier": ["output"],
+            "domain": "generalv3.5",
+            "appId": "dsl-app",
+            "apiKey": "dsl-key",
+            "apiSecret": "dsl-secret",
+            "source": source,
+        }
+    )
+
+
+def test_overlay_wins_for_spark_backed_nodes() -> None:
+    """Test a Spark-backed LLM node uses the run's credential overlay."""
+    node = llm_node()
+
+    assert node.get_provider_credentials(variable_pool(OVERLAY)) == OVERLAY
+
+
+def test_openai_source_nodes_keep_their_dsl_keys() -> None:
+    """Test a node backed by an OpenAI-compatible provider ignores the overlay."""
+    node = llm_node(source=ModelProviderEnum.OPENAI.value)
+
+    credentials = node.get_provider_credentials(variable_pool(OVERLAY))
+
+    assert credentials == ProviderCredentials(
+        app_id="dsl-app", api_key="dsl-key", api_secret="dsl-secret"
+    )
+
+
+def test_dsl_keys_are_used_without_an_overlay() -> None:
+    """Test the node DSL credentials apply when the run has no overlay."""
+    node = llm_node()
+
+    credentials = node.get_provider_credentials(variable_pool(None))
+
+    assert credentials == ProviderCredentials(
+        app_id="dsl-app", api_key="dsl-key", api_secret="dsl-secret"
+    )
+
+
+def test_overlay_is_ignored_by_other_node_types() -> None:
+    """Test node types outside the overlay set keep their own credentials."""
+    node = CodeNode.model_validate(
+        {
+            "node_id": "ifly-code::1",
+            "input_identifier": [],
+            "output_identifier": [],
+            "code": "def main():\n    return {}",
+            "appId": "dsl-app",
+            "uid": "uid",
+        }
+    )
+
+    credentials = node.get_provider_credentials(variable_pool(OVERLAY))
+
+    assert credentials.app_id == "dsl-app"
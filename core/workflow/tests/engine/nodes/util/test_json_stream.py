@@ -0,0 +1,37 @@
+import pytest
+
+from workflow.engine.nodes.util.json_stream import JsonObjectStream
+
+OUTPUT = (
+    '```json\n{"city": "合肥", "days": 3, "tags": ["a", "}"], "note": "x\\"y"}\n```'
+)
+
+
+@pytest.mark.parametrize("step", [1, 3, 7, len(OUTPUT)])
+def test_members_complete_in_order(step: int) -> None:
+    """
+    Test every member is reported exactly once whatever the chunk size.
+    """
+    stream = JsonObjectStream()
+    reported: list[str] = []
+    for i in range(0, len(OUTPUT), step):
+        reported.extend(stream.feed(OUTPUT[i : i + step]))
+    assert reported == ["city", "days", "tags", "note"]
+    assert stream.members == {
+        "city": "合肥",
+        "days": 3,
+        "tags": ["a", "}"],
+        "note": 'x"y',
+    }
+    assert stream.closed
+
+
+def test_members_wait_for_their_end() -> None:
+    """
+    Test strings and scalars are not reported before they can no longer change.
+    """
+    stream = JsonObjectStream()
+    assert stream.feed('{"city": "合') == {}
+    assert stream.feed('肥", "days": 1') == {"city": "合肥"}
+    assert stream.feed("2") == {}
+    assert stream.feed("}") == {"days": 12}
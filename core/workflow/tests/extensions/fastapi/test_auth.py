@@ -6,8 +6,10 @@ covering all core functionality including authentication flow, header validation
 API key verification, cache operations, and error handling scenarios.
 """
 
+import asyncio
 import os
-from typing import List
+import time
+from typing import Any, List, MutableMapping
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -766,3 +768,125 @@ class TestAuthMiddleware:
                             "https://api.example.com/v2/app/key/api_key/test_key",
                             headers={"Authorization": "test_header"},
                         )
+
+    async def test_get_app_source_detail_coalesces_concurrent_lookups(
+        self, auth_middleware: AuthMiddleware
+    ) -> None:
+        """Test concurrent lookups of one api key share a single remote request."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"code": 0, "data": {"appid": "test_app_id"}}
+        mock_response.text = "success"
+
+        async def slow_get(*args: Any, **kwargs: Any) -> Mock:
+            await asyncio.sleep(0.05)
+            return mock_response
+
+        with patch.object(auth_middleware, "_get_app_id_with_cache") as mock_get_cache:
+            mock_get_cache.return_value = None
+
+            with patch("httpx.AsyncClient.get", side_effect=slow_get) as mock_get:
+                with patch.object(auth_middleware, "_set_app_id_with_cache"):
+                    results = await asyncio.gather(
+                        *[
+                            auth_middleware._get_app_source_detail_with_api_key(
+                                "Bearer test_key:test_secret", AsyncMock()
+                            )
+                            for _ in range(5)
+                        ]
+                    )
+
+                    assert results == ["test_app_id"] * 5
+                    mock_get.assert_called_once()
+                    mock_get_cache.assert_called_once_with("test_key")
+
+    async def test_get_app_source_detail_serves_memory_cache(
+        self, auth_middleware: AuthMiddleware
+    ) -> None:
+        """Test a resolved api key is served from memory without cache lookups."""
+        with patch.object(auth_middleware, "_get_app_id_with_cache") as mock_get_cache:
+            mock_get_cache.return_value = "cached_app_id"
+
+            for _ in range(3):
+                result = await auth_middleware._get_app_source_detail_with_api_key(
+                    "Bearer test_key:test_secret", AsyncMock()
+                )
+                assert result == "cached_app_id"
+
+            mock_get_cache.assert_called_once_with("test_key")
+
+    async def test_get_app_source_detail_refreshes_before_expiry(
+        self, auth_middleware: AuthMiddleware
+    ) -> None:
+        """Test an entry near expiry is served while refreshed in the background."""
+        resolved_at = time.monotonic() - auth_middleware.cache_ttl
+        auth_middleware._app_ids.set("test_key", ("old_app_id", resolved_at))
+
+        with patch.object(auth_middleware, "_get_app_id_with_cache") as mock_get_cache:
+            mock_get_cache.return_value = "new_app_id"
+
+            result = await auth_middleware._get_app_source_detail_with_api_key(
+                "Bearer test_key:test_secret", AsyncMock()
+            )
+            assert result == "old_app_id"
+
+            await asyncio.gather(*auth_middleware._refresh_tasks)
+            result = await auth_middleware._get_app_source_detail_with_api_key(
+                "Bearer test_key:test_secret", AsyncMock()
+            )
+            assert result == "new_app_id"
+            mock_get_cache.assert_called_once_with("test_key")
+
+    async def test_call_passes_stream_through_with_consumer_header(
+        self, mock_app: ASGIApp
+    ) -> None:
+        """Test the ASGI entry point forwards messages and injects the consumer."""
+        received_scopes: List[Scope] = []
+
+        async def app(scope: Scope, receive: Receive, send: Send) -> None:
+            received_scopes.append(scope)
+            await MockASGIApp()(scope, receive, send)
+
+        auth_middleware = AuthMiddleware(app)
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": AUTH_OPEN_API_PATHS[0],
+            "headers": [(b"authorization", b"Bearer test_key:test_secret")],
+        }
+        sent: List[MutableMapping[str, Any]] = []
+
+        async def send(message: MutableMapping[str, Any]) -> None:
+            sent.append(message)
+
+        with patch.object(
+            auth_middleware, "_get_app_source_detail_with_api_key"
+        ) as mock_get_app:
+            mock_get_app.return_value = "test_app_id"
+            await auth_middleware(scope, AsyncMock(), send)
+
+        assert [message["type"] for message in sent] == [
+            "http.response.start",
+            "http.response.body",
+        ]
+        assert (b"x-consumer-username", b"test_app_id") in received_scopes[0]["headers"]
+
+    async def test_call_sends_error_response_without_calling_app(self) -> None:
+        """Test the ASGI entry point answers auth failures itself."""
+        app = AsyncMock()
+        auth_middleware = AuthMiddleware(app)
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": AUTH_OPEN_API_PATHS[0],
+            "headers": [],
+        }
+        sent: List[MutableMapping[str, Any]] = []
+
+        async def send(message: MutableMapping[str, Any]) -> None:
+            sent.append(message)
+
+        await auth_middleware(scope, AsyncMock(), send)
+
+        app.assert_not_called()
+        assert sent[0]["type"] == "http.response.start"
@@ -0,0 +1,164 @@
+"""
+Test module for streamed uploads to object storage.
+
+This module contains unit tests checking files are stored as multipart
+uploads with a bounded number of parts in flight, that failed uploads
+are aborted, and that invalid files never open a gateway request.
+"""
+
+import json
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import pytest
+
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.fastapi.lifespan.http_client import HttpClient
+from workflow.extensions.middleware.oss.manager import (
+    IFlyGatewayStorageClient,
+    S3Service,
+)
+
+
+class FakeS3Client:
+    """
+    In-memory stand-in for the boto3 S3 client.
+    """
+
+    def __init__(self, fail_part: int = 0) -> None:
+        self.fail_part = fail_part
+        self.objects: Dict[str, bytes] = {}
+        self.parts: Dict[int, bytes] = {}
+        self.aborted = False
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, ACL: str) -> None:
+        self.objects[Key] = Body
+
+    def create_multipart_upload(self, Bucket: str, Key: str, ACL: str) -> dict:
+        return {"UploadId": "upload"}
+
+    def upload_part(self, PartNumber: int, Body: bytes, **kwargs: Any) -> dict:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+        if PartNumber == self.fail_part:
+            raise RuntimeError("part failed")
+        self.parts[PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(
+        self, Key: str, MultipartUpload: Dict[str, List[dict]], **kwargs: Any
+    ) -> None:
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        self.objects[Key] = b"".join(self.parts[n] for n in numbers)
+
+    def abort_multipart_upload(self, **kwargs: Any) -> None:
+        self.aborted = True
+
+
+class FakeGatewaySession:
+    """
+    Stand-in for the shared aiohttp session, reading posted bodies in full.
+    """
+
+    def __init__(self) -> None:
+        self.posts = 0
+        self.bodies: List[bytes] = []
+
+    def post(self, url: str, headers: dict, data: Any) -> "FakeGatewaySession":
+        self.posts += 1
+        self._data = data
+        return self
+
+    async def __aenter__(self) -> "FakeGatewaySession":
+        self.bodies.append(b"".join([chunk async for chunk in self._data]))
+        self.status = 200
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    async def text(self) -> str:
+        return json.dumps({"code": 0, "data": {"link": "http://link"}})
+
+
+def _service(client: FakeS3Client) -> S3Service:
+    service = S3Service.__new__(S3Service)
+    service.client = client
+    service.bucket_name = "bucket"
+    service.oss_download_host = "http://oss"
+    return service
+
+
+async def _chunks(count: int) -> AsyncIterator[bytes]:
+    for i in range(count):
+        yield bytes([i]) * 4
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_stores_parts_in_order_with_bounded_concurrency() -> None:
+    """Test chunks become ordered parts with at most max_concurrency in flight."""
+    client = FakeS3Client()
+
+    url = await _service(client).upload_stream_async(
+        "a.bin", _chunks(8), max_concurrency=3
+    )
+
+    assert url == "http://oss/bucket/a.bin"
+    assert client.objects["a.bin"] == b"".join(bytes([i]) * 4 for i in range(8))
+    assert 1 < client.max_in_flight <= 3
+
+
+@pytest.mark.asyncio
+async def test_stream_upload_single_chunk_and_failures() -> None:
+    """Test one chunk is put directly and a failed part aborts the upload."""
+    client = FakeS3Client()
+    await _service(client).upload_stream_async("small.bin", _chunks(1))
+    assert client.objects["small.bin"] == b"\x00" * 4
+    assert not client.parts
+
+    client = FakeS3Client(fail_part=2)
+    with pytest.raises(CustomException) as exc_info:
+        await _service(client).upload_stream_async(
+            "b.bin", _chunks(6), max_concurrency=2
+        )
+    assert exc_info.value.code == CodeEnum.FILE_STORAGE_ERROR.code
+    assert client.aborted
+    assert "b.bin" not in client.objects
+
+
+async def _gateway_chunks(invalid_at: Optional[int]) -> AsyncIterator[bytes]:
+    for i in range(3):
+        if i == invalid_at:
+            raise CustomException(CodeEnum.FILE_INVALID_ERROR)
+        yield bytes([i]) * 4
+
+
+@pytest.mark.asyncio
+async def test_gateway_upload_validates_before_posting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test an invalid first chunk never opens the request and errors keep their code."""
+    session = FakeGatewaySession()
+    monkeypatch.setattr(HttpClient, "get_session", lambda: session)
+    client = IFlyGatewayStorageClient("http://gateway", "key", "secret", "bucket", 60)
+
+    url = await client.upload_stream_async("a.bin", _gateway_chunks(None), size=12)
+    assert url == "http://link"
+    assert session.bodies == [b"".join(bytes([i]) * 4 for i in range(3))]
+
+    for invalid_at, posts in ((0, 1), (2, 2)):
+        with pytest.raises(CustomException) as exc_info:
+            await client.upload_stream_async(
+                "b.bin", _gateway_chunks(invalid_at), size=12
+            )
+        assert exc_info.value.code == CodeEnum.FILE_INVALID_ERROR.code
+        assert session.posts == posts
@@ -0,0 +1,38 @@
+"""
+Test module for the audit context pending content buffer.
+
+This module contains unit tests for the incremental tracking of content that
+is waiting for sentence-by-sentence audit.
+"""
+
+from workflow.infra.audit_system.base import AuditContext
+
+
+def test_append_remaining_content_tracks_length_and_end_symbol() -> None:
+    """Test appended frames update length and end symbol state incrementally."""
+    context = AuditContext(chat_sid="test_sid")
+
+    context.append_remaining_content("你好")
+    context.append_remaining_content("，世界")
+    assert context.remaining_content_len == 5
+    assert not context.remaining_has_end_symbol
+
+    context.append_remaining_content("。再见")
+    assert context.remaining_content_len == 8
+    assert context.remaining_has_end_symbol
+    assert context.remaining_content == "你好，世界。再见"
+
+
+def test_set_remaining_content_resets_state() -> None:
+    """Test replacing pending content recomputes its tracked state."""
+    context = AuditContext(chat_sid="test_sid")
+    context.append_remaining_content("first sentence. second")
+
+    context.remaining_content = "second"
+    assert context.remaining_content == "second"
+    assert context.remaining_content_len == 6
+    assert not context.remaining_has_end_symbol
+
+    context.remaining_content = ""
+    assert context.remaining_content == ""
+    assert context.remaining_content_len == 0
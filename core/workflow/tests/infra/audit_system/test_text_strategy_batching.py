@@ -0,0 +1,119 @@
+"""
+Test module for windowed output audit submission in the text strategy.
+
+This module contains unit tests for batching complete sentences into audit
+windows, submitting every window in pindex order, and releasing frames in
+order.
+"""
+
+import uuid
+from typing import Any, List
+
+import pytest
+
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.otlp.trace.span import Span
+from workflow.infra.audit_system.audit_api.base import AuditAPI, Stage
+from workflow.infra.audit_system.base import FrameAuditResult, OutputFrameAudit
+from workflow.infra.audit_system.enums import Status
+from workflow.infra.audit_system.strategy.text_strategy import TextAuditStrategy
+
+
+class RecordingAuditAPI(AuditAPI):
+    """Audit API that records output calls and rejects content containing a marker."""
+
+    audit_name = "RecordingAuditAPI"
+
+    def __init__(self, reject: str = "") -> None:
+        self.reject = reject
+        self.calls: List[dict] = []
+
+    async def input_text(self, *args: Any, **kwargs: Any) -> None:
+        return None
+
+    async def output_text(self, *args: Any, **kwargs: Any) -> None:
+        self.calls.append(kwargs)
+        if self.reject and self.reject in kwargs["content"]:
+            raise CustomException(CodeEnum.AUDIT_OUTPUT_ERROR)
+
+    async def input_media(self, text: str, **kwargs: Any) -> None:
+        return None
+
+    async def output_media(self, text: str, **kwargs: Any) -> None:
+        return None
+
+    async def know_ref(self, text: str, **kwargs: Any) -> None:
+        return None
+
+
+async def review(
+    strategy: TextAuditStrategy, contents: List[str]
+) -> List[FrameAuditResult]:
+    """Feed answer frames through the strategy and collect the released results."""
+    span = Span()
+    for i, content in enumerate(contents):
+        await strategy.output_review(
+            OutputFrameAudit(
+                frame_id=str(uuid.uuid4()),
+                content=content,
+                stage=Stage.ANSWER,
+                source_frame=content,
+                status=Status.STOP if i == len(contents) - 1 else Status.NONE,
+            ),
+            span,
+        )
+    await strategy.wait_audited(span)
+    results = []
+    while not strategy.context.output_queue.empty():
+        results.append(strategy.context.output_queue.get_nowait())
+    return results
+
+
+@pytest.mark.asyncio
+async def test_sentences_share_one_window() -> None:
+    """Test sentences arriving within the window are audited in one call."""
+    audit_api = RecordingAuditAPI()
+    strategy = TextAuditStrategy(chat_sid="test_sid", audit_apis=[audit_api])
+    strategy.batch_window = 10
+
+    results = await review(strategy, ["第一句。", "第二句。", "第三句。"])
+
+    assert [result.content for result in results] == [
+        "第一句。",
+        "第二句。",
+        "第三句。",
+    ]
+    assert len(audit_api.calls) == 1
+    assert audit_api.calls[0]["content"] == "第一句。第二句。第三句。"
+    assert audit_api.calls[0]["is_end"] == 1
+
+
+@pytest.mark.asyncio
+async def test_audit_api_receives_every_window() -> None:
+    """Test repeated content is still submitted in an unbroken pindex order."""
+    contents = ["常见的客套话。", "结束。"]
+    for _ in range(2):
+        audit_api = RecordingAuditAPI()
+        strategy = TextAuditStrategy(chat_sid="test_sid", audit_apis=[audit_api])
+        strategy.batch_window = 0
+        await review(strategy, contents)
+
+    assert [call["content"] for call in audit_api.calls] == contents
+    first, second = (call["pindex"] for call in audit_api.calls)
+    assert second == first + 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_window_stops_release() -> None:
+    """Test frames after a rejected window are never released."""
+    audit_api = RecordingAuditAPI(reject="违规")
+    strategy = TextAuditStrategy(chat_sid="test_sid", audit_apis=[audit_api])
+    strategy.batch_window = 0
+
+    results = await review(strategy, ["正常。", "违规。", "之后。"])
+
+    assert results[0].content == "正常。" and results[0].error is None
+    assert results[1].error is not None
+    assert len(results) == 2
+    assert strategy.context.error is not None
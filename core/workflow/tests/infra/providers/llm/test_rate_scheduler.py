@@ -0,0 +1,93 @@
+"""
+Test module for the LLM rate-limit scheduler.
+
+This module contains unit tests for rate-limit header parsing, round-robin
+queueing across apps and the adaptive limit after throttling.
+"""
+
+import asyncio
+
+import pytest
+
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.infra.providers.llm.rate_scheduler import (
+    ProviderRateScheduler,
+    parse_duration,
+)
+
+
+def test_parse_duration() -> None:
+    """Test plain seconds and compound reset durations are parsed."""
+    assert parse_duration("2") == 2.0
+    assert parse_duration("6m0s") == 360.0
+    assert parse_duration("20ms") == pytest.approx(0.02)
+    assert parse_duration("soon") is None
+    assert parse_duration(None) is None
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_round_robin_across_apps() -> None:
+    """Test a busy app cannot starve another app queued after it."""
+    scheduler = ProviderRateScheduler(max_concurrency=1)
+    await scheduler.acquire("p", "a")
+
+    order = []
+
+    async def call(app_id: str) -> None:
+        await scheduler.acquire("p", app_id)
+        order.append(app_id)
+        scheduler.release("p")
+
+    tasks = [asyncio.create_task(call(app_id)) for app_id in ("a", "a", "b")]
+    await asyncio.sleep(0)
+    scheduler.release("p")
+    await asyncio.gather(*tasks)
+
+    assert order == ["a", "b", "a"]
+
+
+@pytest.mark.asyncio
+async def test_throttling_halves_limit_and_pauses_provider() -> None:
+    """Test a throttled call shrinks the limit and holds back new calls."""
+    scheduler = ProviderRateScheduler(max_concurrency=4, max_wait=0.05)
+    await scheduler.acquire("p", "a")
+    scheduler.release("p", throttled=True, retry_after=10)
+
+    with pytest.raises(CustomException) as exc_info:
+        await scheduler.acquire("p", "a")
+
+    assert exc_info.value.code == CodeEnum.LLM_RATE_LIMIT_ERROR.code
+    assert scheduler._providers["p"].limit == 2
+    assert scheduler._providers["p"].inflight == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_releases_and_detects_throttling() -> None:
+    """Test a slot is given back after the call and throttling errors shrink it."""
+    scheduler = ProviderRateScheduler(max_concurrency=4)
+    async with scheduler.slot("p", "a"):
+        assert scheduler._providers["p"].inflight == 1
+
+    with pytest.raises(CustomException):
+        async with scheduler.slot("p", "a"):
+            raise CustomException(CodeEnum.SPARK_TRAFFIC_LIMIT_ERROR)
+
+    assert scheduler._providers["p"].inflight == 0
+    assert scheduler._providers["p"].limit == 2
+
+
+@pytest.mark.asyncio
+async def test_exhausted_headers_pause_provider() -> None:
+    """Test calls wait once the reported token budget drops below the reserve."""
+    scheduler = ProviderRateScheduler(max_concurrency=4, token_reserve=100)
+    scheduler.update_limits(
+        "p",
+        {"x-ratelimit-remaining-tokens": "10", "x-ratelimit-reset-tokens": "50ms"},
+    )
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await scheduler.acquire("p", "a")
+
+    assert loop.time() - start >= 0.04
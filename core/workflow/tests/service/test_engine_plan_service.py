@@ -0,0 +1,170 @@
+"""
+Test module for the engine plan service.
+
+This module contains unit tests for plan keys, loading plans through the
+local and Redis tiers, deduplicating background compilations, and falling
+back to building the engine on a cold plan cache miss.
+"""
+
+import asyncio
+import json
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from workflow.engine.dsl_engine import WorkflowEngine
+from workflow.extensions.otlp.trace.span import Span
+from workflow.service import chat_service, engine_plan_service
+from workflow.tests.engine.dsl.base import BASE_DSL_SCHEMA
+
+WORKFLOW_DSL: Dict = json.loads(BASE_DSL_SCHEMA)
+
+
+class FakePlanStore:
+    """
+    Stand-in for the Redis tier of the engine plan cache.
+    """
+
+    def __init__(self) -> None:
+        self.plans: Dict[str, bytes] = {}
+        self.reads = 0
+        self.error: Optional[Exception] = None
+
+    def get(self, plan_key: str) -> Optional[bytes]:
+        self.reads += 1
+        if self.error is not None:
+            raise self.error
+        return self.plans.get(plan_key)
+
+    def set(self, plan_key: str, plan: bytes, expire_time: int) -> None:
+        self.plans[plan_key] = plan
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakePlanStore]:
+    """Plan store patched into the plan service, with an empty local tier."""
+    fake = FakePlanStore()
+    monkeypatch.setattr(engine_plan_service, "get_engine_plan", fake.get)
+    monkeypatch.setattr(engine_plan_service, "set_engine_plan", fake.set)
+    engine_plan_service._local_plans.clear()
+    yield fake
+    engine_plan_service._local_plans.clear()
+
+
+def test_plan_key_changes_with_the_engine_code(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test plans of a release with other engine code are not looked up."""
+    key = engine_plan_service.get_plan_key(WORKFLOW_DSL)
+    monkeypatch.setattr(engine_plan_service, "PLAN_CODE_DIGEST", "other")
+
+    assert engine_plan_service.get_plan_key(WORKFLOW_DSL) != key
+    assert engine_plan_service.PLAN_CODE_DIGEST in (
+        engine_plan_service.get_plan_key(WORKFLOW_DSL)
+    )
+
+
+@pytest.mark.asyncio
+async def test_compiled_plan_loads_from_either_tier(store: FakePlanStore) -> None:
+    """Test a stored plan loads from Redis once, then from worker memory."""
+    plan_key = engine_plan_service.get_plan_key(WORKFLOW_DSL)
+    await engine_plan_service.compile_plan(WORKFLOW_DSL, Span(), plan_key)
+    engine_plan_service._local_plans.clear()
+
+    first = await engine_plan_service.load_plan(plan_key, Span())
+    second = await engine_plan_service.load_plan(plan_key, Span())
+
+    assert isinstance(first, WorkflowEngine)
+    assert isinstance(second, WorkflowEngine)
+    assert first is not second
+    assert store.reads == 1
+
+
+@pytest.mark.asyncio
+async def test_missing_or_unusable_plan_loads_nothing(store: FakePlanStore) -> None:
+    """Test absent, corrupt or unreachable plans make the caller build instead."""
+    assert await engine_plan_service.load_plan("missing", Span()) is None
+
+    store.plans["corrupt"] = b"not a plan"
+    assert await engine_plan_service.load_plan("corrupt", Span()) is None
+    assert engine_plan_service._local_plans.get("corrupt") is None
+
+    store.error = ConnectionError("redis down")
+    assert await engine_plan_service.load_plan("missing", Span()) is None
+
+
+@pytest.mark.asyncio
+async def test_background_compilations_are_deduplicated(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a DSL is compiled once while its compilation is in flight."""
+    release = asyncio.Event()
+    compiled: List[str] = []
+
+    async def compile_in_background(workflow_dsl: Dict, plan_key: str) -> None:
+        compiled.append(plan_key)
+        await release.wait()
+
+    monkeypatch.setattr(
+        engine_plan_service, "_compile_in_background", compile_in_background
+    )
+
+    engine_plan_service.compile_plan_later(WORKFLOW_DSL, "key")
+    task = engine_plan_service._compiling["key"]
+    engine_plan_service.compile_plan_later(WORKFLOW_DSL, "key")
+    await asyncio.sleep(0)
+    assert compiled == ["key"]
+
+    release.set()
+    await task
+    await asyncio.sleep(0)
+    assert "key" not in engine_plan_service._compiling
+
+    # A finished compilation does not block the next one
+    engine_plan_service.compile_plan_later(WORKFLOW_DSL, "key")
+    await engine_plan_service._compiling["key"]
+    assert compiled == ["key", "key"]
+
+
+@pytest.fixture
+def plans(monkeypatch: pytest.MonkeyPatch) -> List[Tuple[str, str]]:
+    """Plan service calls of the chat service, with no plan stored."""
+    calls: List[Tuple[str, str]] = []
+
+    async def load_plan(plan_key: str, span: Span) -> Optional[WorkflowEngine]:
+        calls.append(("load", plan_key))
+        return None
+
+    def compile_plan_later(workflow_dsl: Dict, plan_key: Optional[str] = None) -> None:
+        calls.append(("compile", plan_key or ""))
+
+    monkeypatch.setattr(engine_plan_service, "load_plan", load_plan)
+    monkeypatch.setattr(engine_plan_service, "compile_plan_later", compile_plan_later)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_cold_miss_builds_the_engine_and_compiles_later(
+    plans: List[Tuple[str, str]],
+) -> None:
+    """Test a published flow without a plan runs a fresh engine and queues one."""
+    engine = await chat_service._get_or_build_workflow_engine(
+        True, WORKFLOW_DSL, Span()
+    )
+
+    plan_key = engine_plan_service.get_plan_key(WORKFLOW_DSL)
+    assert isinstance(engine, WorkflowEngine)
+    assert plans == [("load", plan_key), ("compile", plan_key)]
+
+
+@pytest.mark.asyncio
+async def test_draft_flows_bypass_the_plan_cache(
+    plans: List[Tuple[str, str]],
+) -> None:
+    """Test unpublished flows are built without touching the plan cache."""
+    engine = await chat_service._get_or_build_workflow_engine(
+        False, WORKFLOW_DSL, Span()
+    )
+
+    assert isinstance(engine, WorkflowEngine)
+    assert plans == []
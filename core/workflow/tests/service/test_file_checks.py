@@ -0,0 +1,94 @@
+"""
+Test module for file input checks of chat requests.
+
+This module contains unit tests checking file inputs are checked concurrently
+within a deadline and that file sizes are cached per URL.
+"""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from workflow.configs import workflow_config
+from workflow.engine.entities import file as file_module
+from workflow.engine.entities.file import File
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.extensions.fastapi.lifespan.http_client import HttpClient
+from workflow.extensions.otlp.trace.span import Span
+from workflow.service.chat_service import _run_file_checks
+
+
+class FakeHeadSession:
+    """
+    Stand-in for the shared aiohttp session answering HEAD requests.
+    """
+
+    def __init__(self) -> None:
+        self.heads: List[str] = []
+        self.headers = {"Content-Length": "42"}
+
+    def head(self, url: str) -> "FakeHeadSession":
+        self.heads.append(url)
+        return self
+
+    async def __aenter__(self) -> "FakeHeadSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+
+def _slow_checks(monkeypatch: pytest.MonkeyPatch, delay: float) -> List[str]:
+    checked: List[str] = []
+
+    async def check(url: str, allowed_file_type: str, span_context: Span) -> None:
+        await asyncio.sleep(delay)
+        checked.append(url)
+
+    monkeypatch.setattr(File, "check_file_var_isvalid", check)
+    return checked
+
+
+@pytest.mark.asyncio
+async def test_file_checks_run_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the checks of several files overlap instead of running in turn."""
+    checked = _slow_checks(monkeypatch, 0.05)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    await _run_file_checks(
+        [(f"http://f/{i}.pdf", "document") for i in range(4)], Span()
+    )
+
+    assert len(checked) == 4
+    assert loop.time() - start < 0.15
+
+
+@pytest.mark.asyncio
+async def test_file_checks_time_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test checks exceeding the deadline are cancelled and rejected."""
+    checked = _slow_checks(monkeypatch, 1)
+    monkeypatch.setattr(workflow_config.file_config, "check_timeout", 0.01)
+
+    with pytest.raises(CustomException) as exc_info:
+        await _run_file_checks([("http://f/a.pdf", "document")], Span())
+    await asyncio.sleep(0)
+
+    assert exc_info.value.code == CodeEnum.FILE_INVALID_TYPE_ERROR.code
+    assert not checked
+
+
+@pytest.mark.asyncio
+async def test_file_size_is_cached_per_url(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a cached size skips the HEAD request."""
+    session = FakeHeadSession()
+    monkeypatch.setattr(HttpClient, "get_session", lambda: session)
+    file_module._file_size_cache.clear()
+
+    assert await File.get_file_size("http://f/a.pdf") == "42"
+    assert await File.get_file_size("http://f/a.pdf") == "42"
+    assert await File.get_file_size("http://f/b.pdf") == "42"
+
+    assert session.heads == ["http://f/a.pdf", "http://f/b.pdf"]
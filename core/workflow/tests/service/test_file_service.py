@@ -0,0 +1,45 @@
+"""
+Test module for the file upload service.
+
+This module contains unit tests for matching the leading bytes of uploaded
+files against their extension and for the part size of stored uploads.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from workflow.configs.app_config import FileConfig
+from workflow.exception.e import CustomException
+from workflow.service.file_service import check_signature
+
+
+@pytest.mark.parametrize(
+    "head",
+    [
+        b"ID3\x04\x00",
+        b"\xff\xfb\x90\x00",
+        b"\xff\xfa\x90\x00",
+        b"\xff\xe3\x18\x00",
+        b"\xff\xf5\x80\x00",
+    ],
+    ids=bytes.hex,
+)
+def test_mp3_accepts_tags_and_any_frame_sync(head: bytes) -> None:
+    """Test MP3 files starting with a tag or any MPEG frame header pass."""
+    check_signature("mp3", head)
+
+
+@pytest.mark.parametrize("head", [b"\xff\xd8\xff\xe0", b"RIFF", b"\xff"], ids=bytes.hex)
+def test_mp3_rejects_other_content(head: bytes) -> None:
+    """Test content without a tag or frame sync is not accepted as MP3."""
+    with pytest.raises(CustomException):
+        check_signature("mp3", head)
+
+
+def test_upload_part_size_has_the_s3_minimum() -> None:
+    """Test a part size below the 5 MiB S3 minimum is rejected."""
+    assert FileConfig(FILE_UPLOAD_PART_SIZE=5 * 1024 * 1024).upload_part_size == (
+        5 * 1024 * 1024
+    )
+    with pytest.raises(ValidationError):
+        FileConfig(FILE_UPLOAD_PART_SIZE=1024 * 1024)
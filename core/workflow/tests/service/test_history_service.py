@@ -0,0 +1,253 @@
+"""
+Test module for the chat history service.
+
+This module contains unit tests for the worker cache of history rows, the
+Redis version tokens keeping cached copies coherent across workers, and the
+background writer persisting history in batches.
+"""
+
+import asyncio
+import uuid
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+from workflow.domain.models.history import History
+from workflow.service import history_service
+from workflow.service.history_service import HistoryRows
+
+
+class FakeHistoryStore:
+    """
+    In-memory stand-in for the history table and the Redis version tokens.
+    """
+
+    def __init__(self) -> None:
+        self.versions: Dict[Tuple[str, str], str] = {}
+        self.rows: List[Tuple[str, str, str]] = []
+        self.queries = 0
+
+    def get_version(self, flow_id: str, uid: str) -> Optional[str]:
+        return self.versions.get((flow_id, uid))
+
+    def bump_version(self, flow_id: str, uid: str) -> str:
+        return self.swap_versions([(flow_id, uid)])[(flow_id, uid)][1]
+
+    def swap_versions(
+        self, pairs: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], Tuple[Optional[str], str]]:
+        swapped = {}
+        for pair in pairs:
+            version = uuid.uuid4().hex
+            swapped[pair] = (self.versions.get(pair), version)
+            self.versions[pair] = version
+        return swapped
+
+    async def query(
+        self, flow_id: str, uid: str, node_ids: List[str], history_size: int
+    ) -> HistoryRows:
+        self.queries += 1
+        result: HistoryRows = {node_id: [] for node_id in node_ids}
+        for node_id, question, answer in reversed(self.rows):
+            if node_id in result and len(result[node_id]) < history_size:
+                result[node_id].append((question, answer))
+        return result
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeHistoryStore]:
+    """History store patched into the history service, with an empty cache."""
+    fake = FakeHistoryStore()
+    monkeypatch.setattr(history_service, "get_history_version", fake.get_version)
+    monkeypatch.setattr(history_service, "bump_history_version", fake.bump_version)
+    monkeypatch.setattr(history_service, "swap_history_versions", fake.swap_versions)
+    monkeypatch.setattr(history_service, "_query_history_rows", fake.query)
+    history_service._history_cache.clear()
+    yield fake
+    history_service._history_cache.clear()
+
+
+async def _load(node_ids: List[str], history_size: int = 3) -> HistoryRows:
+    return await history_service._load_history_rows(
+        "flow", "uid", node_ids, history_size
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_rows_are_served_until_the_version_changes(
+    store: FakeHistoryStore,
+) -> None:
+    """Test a copy is reused under the same version and missed once it is stale."""
+    store.rows = [("n", "q1", "a1")]
+
+    assert await _load(["n"]) == {"n": [("q1", "a1")]}
+    assert await _load(["n"]) == {"n": [("q1", "a1")]}
+    assert store.queries == 1
+
+    # Another worker appended and published a new version
+    store.rows.append(("n", "q2", "a2"))
+    store.bump_version("flow", "uid")
+
+    assert await _load(["n"]) == {"n": [("q2", "a2"), ("q1", "a1")]}
+    assert store.queries == 2
+
+
+@pytest.mark.asyncio
+async def test_appends_patch_or_invalidate_the_cached_copy(
+    store: FakeHistoryStore,
+) -> None:
+    """Test a local append patches the copy and an interleaved one drops it."""
+    await _load(["n"])
+    record = History(
+        flow_id="flow", node_id="n", uid="uid", raw_question="q1", raw_answer="a1"
+    )
+    store.rows.append(("n", "q1", "a1"))
+    history_service._on_history_appended({("flow", "uid"): [record]})
+
+    assert await _load(["n"]) == {"n": [("q1", "a1")]}
+    assert store.queries == 1
+
+    # A version published by another worker in between makes the copy stale
+    store.bump_version("flow", "uid")
+    store.rows.append(("n", "q2", "a2"))
+    history_service._on_history_appended({("flow", "uid"): [record]})
+
+    assert history_service._history_cache.get(("flow", "uid")) is None
+    assert await _load(["n"]) == {"n": [("q2", "a2"), ("q1", "a1")]}
+    assert store.queries == 2
+
+
+@pytest.mark.asyncio
+async def test_smaller_history_size_is_served_from_cache(
+    store: FakeHistoryStore,
+) -> None:
+    """Test fewer rows come from the copy while more rows or nodes query again."""
+    store.rows = [("n", f"q{i}", f"a{i}") for i in range(5)]
+
+    await _load(["n"], history_size=4)
+    assert await _load(["n"], history_size=2) == {"n": [("q4", "a4"), ("q3", "a3")]}
+    assert store.queries == 1
+
+    await _load(["n"], history_size=5)
+    await _load(["n", "m"], history_size=2)
+    assert store.queries == 3
+
+
+class FakeInserts:
+    """
+    Stand-in for the multi-row INSERT of the history writer.
+    """
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.attempts: List[List[str]] = []
+        self.batches: List[List[str]] = []
+
+    async def insert(self, batch: List[History], last_attempt: bool) -> bool:
+        questions = [record.raw_question or "" for record in batch]
+        self.attempts.append(questions)
+        if self.failures:
+            self.failures -= 1
+            return False
+        self.batches.append(questions)
+        return True
+
+
+@pytest.fixture
+def writer_config(monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Writer settings for tests, with publishing and database reads stubbed."""
+    config = history_service.workflow_config.history_config
+    monkeypatch.setattr(config, "write_async_enable", True)
+    monkeypatch.setattr(config, "write_batch_size", 10)
+    monkeypatch.setattr(config, "write_flush_interval", 0.05)
+    monkeypatch.setattr(config, "write_max_retries", 2)
+    monkeypatch.setattr(config, "write_retry_backoff", 0)
+
+    async def publish(appended: Dict) -> None:
+        return None
+
+    async def load(
+        flow_id: str, uid: str, node_ids: List[str], history_size: int
+    ) -> HistoryRows:
+        return {node_id: [("db-q", "db-a")] for node_id in node_ids}
+
+    monkeypatch.setattr(history_service, "_on_history_appended_async", publish)
+    monkeypatch.setattr(history_service, "_load_history_rows", load)
+    monkeypatch.setattr(history_service.HistoryWriter, "_pending", {})
+    yield
+    assert not history_service.HistoryWriter.is_running()
+
+
+def _use_inserts(monkeypatch: pytest.MonkeyPatch, inserts: FakeInserts) -> None:
+    monkeypatch.setattr(
+        history_service.HistoryWriter, "_insert", staticmethod(inserts.insert)
+    )
+
+
+def _record(question: str) -> History:
+    return History(
+        flow_id="flow", node_id="n", uid="uid", raw_question=question, raw_answer="a"
+    )
+
+
+@pytest.mark.asyncio
+async def test_writer_flushes_one_batch_after_the_window(
+    monkeypatch: pytest.MonkeyPatch, writer_config: None
+) -> None:
+    """Test records queued within the flush window are written together."""
+    inserts = FakeInserts()
+    _use_inserts(monkeypatch, inserts)
+    writer = history_service.HistoryWriter
+    await writer.setup()
+
+    await writer.put(_record("q1"))
+    await writer.put(_record("q2"))
+    await asyncio.sleep(0.01)
+    assert not inserts.batches
+
+    await asyncio.sleep(0.1)
+    assert inserts.batches == [["q1", "q2"]]
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_writer_retries_a_failed_insert(
+    monkeypatch: pytest.MonkeyPatch, writer_config: None
+) -> None:
+    """Test a failed batch is attempted again before it is written."""
+    inserts = FakeInserts(failures=1)
+    _use_inserts(monkeypatch, inserts)
+    writer = history_service.HistoryWriter
+    await writer.setup()
+
+    await writer.put(_record("q1"))
+    await writer.close()
+
+    assert inserts.attempts == [["q1"], ["q1"]]
+    assert inserts.batches == [["q1"]]
+    assert not writer._pending
+
+
+@pytest.mark.asyncio
+async def test_writer_overlays_queued_rows_and_drains_on_close(
+    monkeypatch: pytest.MonkeyPatch, writer_config: None
+) -> None:
+    """Test reads see queued rows before they are written and close writes them."""
+    monkeypatch.setattr(
+        history_service.workflow_config.history_config, "write_flush_interval", 10
+    )
+    inserts = FakeInserts()
+    _use_inserts(monkeypatch, inserts)
+    writer = history_service.HistoryWriter
+    await writer.setup()
+
+    await writer.put(_record("q1"))
+    await writer.put(_record("q2"))
+    rows = await writer.read("flow", "uid", ["n"], 2)
+
+    assert rows == {"n": [("q2", "a"), ("q1", "a")]}
+    assert not inserts.batches
+
+    await writer.close()
+    assert inserts.batches == [["q1", "q2"]]
+    assert await writer.read("flow", "uid", ["n"], 2) == {"n": [("db-q", "db-a")]}
@@ -0,0 +1,168 @@
+"""
+Test module for the warm start service.
+
+This module contains unit tests for counting open API traffic in batches,
+ranking hot flows over the current and previous traffic buckets, and keeping
+the warm start from delaying or failing worker startup.
+"""
+
+import asyncio
+from typing import Any, Iterator, List, Tuple
+
+import pytest
+
+from workflow.cache import flow_traffic
+from workflow.service import warm_start_service
+
+
+class FakePipeline:
+    """
+    Redis pipeline recording its commands and returning canned results.
+    """
+
+    def __init__(self, results: List[Any]) -> None:
+        self.results = results
+        self.commands: List[Tuple[Any, ...]] = []
+
+    def __enter__(self) -> "FakePipeline":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: self.commands.append((name, *args))
+
+    def execute(self) -> List[Any]:
+        return self.results
+
+
+class FakeCacheService:
+    """
+    Cache service handing out fake pipelines.
+    """
+
+    def __init__(self, results: List[Any]) -> None:
+        self.results = results
+        self.pipelines: List[FakePipeline] = []
+
+    def pipeline(self) -> FakePipeline:
+        pipe = FakePipeline(self.results)
+        self.pipelines.append(pipe)
+        return pipe
+
+
+@pytest.fixture
+def traffic(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeCacheService]:
+    """Redis patched into the traffic cache, with request counting enabled."""
+    fake = FakeCacheService([])
+    monkeypatch.setattr(flow_traffic, "get_cache_service", lambda: fake)
+    config = warm_start_service.workflow_config.warm_start_config
+    monkeypatch.setattr(config, "top_flows", 5)
+    monkeypatch.setattr(config, "window", 60)
+    monkeypatch.setattr(warm_start_service, "_FLUSH_INTERVAL", 0.02)
+    warm_start_service._pending_requests.clear()
+    yield fake
+    warm_start_service._pending_requests.clear()
+
+
+def _increments(pipe: FakePipeline) -> List[Tuple[Any, ...]]:
+    return [command[2:] for command in pipe.commands if command[0] == "zincrby"]
+
+
+@pytest.mark.asyncio
+async def test_requests_are_written_in_one_pipeline_per_interval(
+    traffic: FakeCacheService,
+) -> None:
+    """Test requests within a flush interval are counted into one pipeline."""
+    warm_start_service.record_request("f1", "app", "")
+    warm_start_service.record_request("f1", "app", "")
+    warm_start_service.record_request("f2", "app", "v1")
+    await asyncio.sleep(0)
+    assert not traffic.pipelines
+
+    await asyncio.sleep(0.05)
+
+    assert len(traffic.pipelines) == 1
+    assert _increments(traffic.pipelines[0]) == [
+        (2, '["f1", "app", ""]'),
+        (1, '["f2", "app", "v1"]'),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_requests_right_away(
+    traffic: FakeCacheService,
+) -> None:
+    """Test a shutdown flush writes the counts without waiting for the timer."""
+    warm_start_service.record_request("f1", "app", "")
+
+    await warm_start_service.flush_requests()
+    await asyncio.sleep(0.05)
+
+    assert len(traffic.pipelines) == 1
+    assert _increments(traffic.pipelines[0]) == [(1, '["f1", "app", ""]')]
+
+
+def test_hot_flows_merge_the_current_and_previous_bucket(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test scores of both buckets are summed before flows are ranked."""
+    current = [('["f1", "app", ""]', 3.0), ('["f2", "app", ""]', 1.0)]
+    previous = [(b'["f2", "app", ""]', 5.0), (b'["f3", "app", ""]', 1.0)]
+    fake = FakeCacheService([current, previous])
+    monkeypatch.setattr(flow_traffic, "get_cache_service", lambda: fake)
+
+    hot = flow_traffic.get_hot_flows(limit=2, window=60)
+
+    assert hot == [("f2", "app", ""), ("f1", "app", "")]
+    assert len(fake.pipelines) == 1
+
+
+@pytest.fixture
+def warm_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Warm start settings preparing one flow within a short timeout."""
+    config = warm_start_service.workflow_config.warm_start_config
+    monkeypatch.setattr(config, "top_flows", 1)
+    monkeypatch.setattr(config, "timeout", 0.05)
+    monkeypatch.setattr(config, "node_types", "")
+
+
+@pytest.mark.asyncio
+async def test_warm_start_stops_at_the_timeout(
+    monkeypatch: pytest.MonkeyPatch, warm_config: None
+) -> None:
+    """Test a slow warm start is abandoned once the timeout passes."""
+
+    async def warm_hot_flows(*args: Any) -> int:
+        await asyncio.sleep(10)
+        return 1
+
+    monkeypatch.setattr(warm_start_service, "_warm_hot_flows", warm_hot_flows)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    await warm_start_service.warm_start()
+
+    assert loop.time() - start < 1
+
+
+@pytest.mark.asyncio
+async def test_warm_start_swallows_errors(
+    monkeypatch: pytest.MonkeyPatch, warm_config: None
+) -> None:
+    """Test failures to preload or warm flows never fail startup."""
+
+    async def warm_hot_flows(*args: Any) -> int:
+        raise ConnectionError("redis down")
+
+    def preload_node_types(node_types: str) -> None:
+        raise ImportError(node_types)
+
+    monkeypatch.setattr(warm_start_service, "_warm_hot_flows", warm_hot_flows)
+    monkeypatch.setattr(warm_start_service, "_preload_node_types", preload_node_types)
+    monkeypatch.setattr(
+        warm_start_service.workflow_config.warm_start_config, "node_types", "x"
+    )
+
+    await warm_start_service.warm_start()
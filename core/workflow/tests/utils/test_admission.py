@@ -0,0 +1,92 @@
+"""
+Test module for chat admission control.
+
+This module contains unit tests for slot limits, per-app fair share, queueing
+with a deadline and shedding under pressure.
+"""
+
+import asyncio
+
+import pytest
+
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.utils.admission import AdmissionController
+
+
+@pytest.mark.asyncio
+async def test_app_share_limits_one_app() -> None:
+    """Test an app cannot take more than its share while others still can."""
+    controller = AdmissionController(max_inflight=4, app_share=0.5)
+
+    await controller.acquire("a")
+    await controller.acquire("a")
+    with pytest.raises(CustomException) as exc_info:
+        await controller.acquire("a")
+    await controller.acquire("b")
+
+    assert exc_info.value.code == CodeEnum.OPEN_API_OVERLOAD_ERROR.code
+    assert controller.inflight == 3
+
+
+@pytest.mark.asyncio
+async def test_queued_request_takes_released_slot() -> None:
+    """Test a queued request is admitted once a slot frees up."""
+    controller = AdmissionController(max_inflight=1, max_queue=1, queue_timeout=1)
+    await controller.acquire("a")
+
+    waiting = asyncio.create_task(controller.acquire("b"))
+    await asyncio.sleep(0)
+    with pytest.raises(CustomException):
+        await controller.acquire("c")
+    controller.release("a")
+    await waiting
+
+    assert controller.inflight == 1
+
+
+@pytest.mark.asyncio
+async def test_app_at_its_share_does_not_block_other_apps() -> None:
+    """Test a request queued behind its app's share leaves free slots to others."""
+    controller = AdmissionController(
+        max_inflight=4, app_share=0.5, max_queue=2, queue_timeout=1
+    )
+    await controller.acquire("a")
+    await controller.acquire("a")
+
+    waiting = asyncio.create_task(controller.acquire("a"))
+    await asyncio.sleep(0)
+    await asyncio.wait_for(controller.acquire("b"), 0.1)
+
+    assert controller.inflight == 3
+    assert not waiting.done()
+    controller.release("a")
+    await waiting
+    assert controller.inflight == 3
+
+
+@pytest.mark.asyncio
+async def test_queue_deadline_rejects() -> None:
+    """Test a queued request is rejected once its deadline passes."""
+    controller = AdmissionController(max_inflight=1, max_queue=1, queue_timeout=0.01)
+    await controller.acquire("a")
+
+    with pytest.raises(CustomException):
+        await controller.acquire("b")
+    controller.release("a")
+
+    assert controller.inflight == 0
+    await controller.acquire("b")
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_sheds_without_queueing() -> None:
+    """Test requests are rejected immediately while the event loop lags."""
+    controller = AdmissionController(
+        max_inflight=1, max_queue=1, queue_timeout=1, max_loop_lag=0.1
+    )
+    controller.loop_lag = 1.0
+
+    with pytest.raises(CustomException):
+        await controller.acquire("a")
+    assert controller.inflight == 0
@@ -0,0 +1,119 @@
+"""
+Test module for the in-process cache utilities.
+
+This module contains unit tests for coalescing concurrent loads with
+SingleFlight and for expiry and eviction in TTLCache.
+"""
+
+import asyncio
+import time
+from typing import List
+
+import pytest
+
+from workflow.utils.cache import SingleFlight, TTLCache
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_the_leader_result() -> None:
+    """Test concurrent callers of a key run the loader once and get its value."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls: List[int] = []
+
+    async def load() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(flight.do("k", load) for _ in range(5)))
+
+    assert results == [42] * 5
+    assert len(calls) == 1
+    assert not flight.is_running("k")
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_the_leader_exception() -> None:
+    """Test a failing load raises its exception in every waiting caller."""
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls: List[int] = []
+
+    async def load() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        *(flight.do("k", load) for _ in range(3)), return_exceptions=True
+    )
+
+    assert len(calls) == 1
+    assert all(isinstance(result, ValueError) for result in results)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_takes_over_after_the_leader_is_cancelled() -> None:
+    """Test a waiter runs its own loader once the leading caller is cancelled."""
+    flight: SingleFlight[str, str] = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow() -> str:
+        started.set()
+        await asyncio.sleep(10)
+        return "leader"
+
+    async def fast() -> str:
+        return "waiter"
+
+    leader = asyncio.create_task(flight.do("k", slow))
+    await started.wait()
+    waiter = asyncio.create_task(flight.do("k", fast))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    assert await waiter == "waiter"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert not flight.is_running("k")
+
+
+def test_entries_expire_after_the_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test an entry is served within its ttl and dropped after it."""
+    now = [100.0]
+    monkeypatch.setattr(time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(ttl=5)
+
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=20)
+    now[0] += 4
+    assert cache.get("a") == 1
+
+    now[0] += 1
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    """Test the cache keeps max_size entries, evicting the least recently used."""
+    cache: TTLCache[str, int] = TTLCache(ttl=60, max_size=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_zero_ttl_disables_caching() -> None:
+    """Test nothing is stored when the cache ttl is zero."""
+    cache: TTLCache[str, int] = TTLCache(ttl=0)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
@@ -0,0 +1,125 @@
+"""
+Test module for run recording and replay.
+
+This module contains unit tests checking recorded calls, streams and errors
+are served back from a tape in order, without calling through.
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Any, AsyncIterator, List
+
+import pytest
+
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+from workflow.utils.replay import (
+    RunRecorder,
+    RunReplayer,
+    RunTape,
+    activate,
+    interaction,
+    stream_interaction,
+)
+
+
+async def _stream(frames: List[str]) -> AsyncIterator[str]:
+    for frame in frames:
+        await asyncio.sleep(0.01)
+        yield frame
+
+
+async def _fail() -> str:
+    raise CustomException(CodeEnum.KNOWLEDGE_REQUEST_ERROR)
+
+
+@pytest.mark.asyncio
+async def test_recorded_run_replays_without_calling_through(tmp_path: Path) -> None:
+    """Test calls, streams and errors are answered from a saved tape."""
+    recorder = RunRecorder(RunTape(flow_id="flow"))
+    with activate(recorder):
+        first = await interaction("http", "k", lambda: asyncio.sleep(0, "a"))
+        second = await interaction("http", "k", lambda: asyncio.sleep(0, "b"))
+        frames = [
+            f
+            async for f in stream_interaction(
+                "llm", "node", lambda: _stream(["x", "y"])
+            )
+        ]
+        with pytest.raises(CustomException):
+            await interaction("knowledge", "q", _fail)
+    recorder.tape.save(str(tmp_path / "run.tape"))
+
+    assert (first, second, frames) == ("a", "b", ["x", "y"])
+
+    def unreachable() -> Any:
+        raise AssertionError("replay must not call through")
+
+    replayer = RunReplayer(RunTape.load(str(tmp_path / "run.tape")), speed=0)
+    with activate(replayer):
+        assert await interaction("http", "k", unreachable) == "a"
+        assert await interaction("http", "k", unreachable) == "b"
+        assert [f async for f in stream_interaction("llm", "node", unreachable)] == [
+            "x",
+            "y",
+        ]
+        with pytest.raises(CustomException) as exc_info:
+            await interaction("knowledge", "q", unreachable)
+        with pytest.raises(LookupError):
+            await interaction("http", "k", unreachable)
+
+    assert exc_info.value.code == CodeEnum.KNOWLEDGE_REQUEST_ERROR.code
+
+
+@pytest.mark.asyncio
+async def test_replay_keeps_recorded_pace_scaled_by_speed() -> None:
+    """Test stream frames are spaced by their recorded gaps divided by speed."""
+    recorder = RunRecorder(RunTape())
+    with activate(recorder):
+        async for _ in stream_interaction("llm", "node", lambda: _stream(["x"] * 5)):
+            pass
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with activate(RunReplayer(recorder.tape, speed=2)):
+        async for _ in stream_interaction("llm", "node", lambda: _stream([])):
+            pass
+
+    assert 0.02 <= loop.time() - start < 0.1
+
+
+@pytest.mark.asyncio
+async def test_tape_keeps_results_as_returned() -> None:
+    """Test callers mutating a result or frame do not change the tape."""
+
+    async def call() -> dict:
+        return {"answer": 1}
+
+    async def frames() -> AsyncIterator[dict]:
+        yield {"content": "x"}
+
+    recorder = RunRecorder(RunTape())
+    with activate(recorder):
+        (await interaction("http", "k", call))["answer"] = 2
+        async for frame in stream_interaction("llm", "node", frames):
+            frame["content"] = "y"
+
+    result, stream = recorder.tape.interactions
+    assert result.result == {"answer": 1}
+    assert [frame for _, frame in stream.frames or []] == [{"content": "x"}]
+
+
+def test_saved_tape_has_no_node_credentials(tmp_path: Path) -> None:
+    """Test node credentials of the DSL are redacted when a tape is saved."""
+    node_param = {"apiKey": "key", "apiSecret": "secret", "appId": "app"}
+    workflow_dsl = {"data": {"nodes": [{"data": {"nodeParam": node_param}}]}}
+    RunTape(workflow_dsl=workflow_dsl).save(str(tmp_path / "run.tape"))
+
+    tape = RunTape.load(str(tmp_path / "run.tape"))
+
+    assert tape.workflow_dsl["data"]["nodes"][0]["data"]["nodeParam"] == {
+        "apiKey": "***",
+        "apiSecret": "***",
+        "appId": "app",
+    }
+    assert node_param["apiKey"] == "key"
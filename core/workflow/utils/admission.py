@@ -0,0 +1,195 @@
+import asyncio
+import math
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+from workflow.exception.e import CustomException
+from workflow.exception.errors.err_code import CodeEnum
+
+
+class AdmissionController:
+    """
+    Admission control for long-running requests of one worker.
+
+    A request is admitted while the worker has a free slot and the caller's
+    app holds less than its fair share of the slots. Otherwise it waits in a
+    bounded queue until a slot frees up or its deadline passes. Requests are
+    rejected right away, without queueing, while the event loop lags or the
+    default executor is backed up, since waiting would only add to the load.
+    Rejections raise a retriable ``OPEN_API_OVERLOAD_ERROR``.
+    """
+
+    def __init__(
+        self,
+        max_inflight: int,
+        app_share: float = 1.0,
+        max_queue: int = 0,
+        queue_timeout: float = 0,
+        max_loop_lag: float = 0,
+        max_executor_queue: int = 0,
+        lag_interval: float = 0.1,
+    ) -> None:
+        """
+        Initialize the controller.
+
+        :param max_inflight: Maximum number of admitted requests, 0 disables
+                             admission control
+        :param app_share: Fraction of the slots a single app may hold
+        :param max_queue: Maximum number of requests waiting for a slot
+        :param queue_timeout: Seconds a request waits for a slot before it is
+                              rejected
+        :param max_loop_lag: Event loop lag in seconds above which requests are
+                             rejected, 0 disables the check
+        :param max_executor_queue: Default executor backlog above which requests
+                                   are rejected, 0 disables the check
+        :param lag_interval: Seconds between event loop lag samples
+        """
+        self.max_inflight = max_inflight
+        self.app_limit = max(1, math.ceil(max_inflight * app_share))
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.max_loop_lag = max_loop_lag
+        self.max_executor_queue = max_executor_queue
+        self.lag_interval = lag_interval
+        self.loop_lag = 0.0
+        self.inflight = 0
+        self._app_inflight: Dict[str, int] = {}
+        self._waiters: Deque[Tuple[str, "asyncio.Future[None]"]] = deque()
+        self._lag_task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Whether admission control is active.
+        """
+        return self.max_inflight > 0
+
+    async def acquire(self, app_id: str) -> None:
+        """
+        Admit a request or raise once it cannot be admitted in time.
+
+        Every successful call must be paired with a ``release`` of the same app.
+
+        :param app_id: App the request belongs to
+        :raises CustomException: If the request is shed or its deadline passes
+        """
+        if not self.enabled:
+            return
+        self._ensure_lag_monitor()
+        self._check_pressure()
+        if self._has_slot(app_id) and not self._is_waiting(app_id):
+            self._admit(app_id)
+            return
+        if len(self._waiters) >= self.max_queue or self.queue_timeout <= 0:
+            raise self._overload("too many requests in flight")
+
+        waiter: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        entry = (app_id, waiter)
+        self._waiters.append(entry)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except asyncio.TimeoutError:
+            self._abandon(entry)
+            raise self._overload("timed out waiting for a free slot")
+        except asyncio.CancelledError:
+            self._abandon(entry)
+            raise
+
+    def release(self, app_id: str) -> None:
+        """
+        Free the slot of an admitted request and hand it to a waiting one.
+
+        :param app_id: App the request belongs to
+        """
+        if not self.enabled:
+            return
+        self.inflight -= 1
+        count = self._app_inflight.get(app_id, 0) - 1
+        if count > 0:
+            self._app_inflight[app_id] = count
+        else:
+            self._app_inflight.pop(app_id, None)
+        self._wake_waiters()
+
+    def _has_slot(self, app_id: str) -> bool:
+        return (
+            self.inflight < self.max_inflight
+            and self._app_inflight.get(app_id, 0) < self.app_limit
+        )
+
+    def _is_waiting(self, app_id: str) -> bool:
+        # Waiters of other apps may be blocked by their own share only, so
+        # they do not hold back a request that fits in the free slots
+        return any(waiting == app_id for waiting, _ in self._waiters)
+
+    def _admit(self, app_id: str) -> None:
+        self.inflight += 1
+        self._app_inflight[app_id] = self._app_inflight.get(app_id, 0) + 1
+
+    def _wake_waiters(self) -> None:
+        """
+        Admit waiting requests in arrival order, skipping apps at their share.
+        """
+        for entry in list(self._waiters):
+            if self.inflight >= self.max_inflight:
+                return
+            app_id, waiter = entry
+            if waiter.done() or not self._has_slot(app_id):
+                continue
+            self._waiters.remove(entry)
+            self._admit(app_id)
+            waiter.set_result(None)
+
+    def _abandon(self, entry: Tuple[str, "asyncio.Future[None]"]) -> None:
+        """
+        Withdraw a waiting request, giving back a slot it was granted meanwhile.
+        """
+        app_id, waiter = entry
+        if entry in self._waiters:
+            self._waiters.remove(entry)
+        elif waiter.done() and not waiter.cancelled():
+            self.release(app_id)
+
+    def _check_pressure(self) -> None:
+        """
+        Shed the request while the event loop or the default executor is overloaded.
+
+        :raises CustomException: If the worker is overloaded
+        """
+        if self.max_loop_lag > 0 and self.loop_lag > self.max_loop_lag:
+            raise self._overload(f"event loop lag {self.loop_lag:.3f}s")
+        if self.max_executor_queue > 0:
+            depth = self._executor_queue_depth()
+            if depth > self.max_executor_queue:
+                raise self._overload(f"executor queue depth {depth}")
+
+    @staticmethod
+    def _executor_queue_depth() -> int:
+        # The default executor is created lazily and is not part of the public API
+        executor = getattr(asyncio.get_running_loop(), "_default_executor", None)
+        work_queue = getattr(executor, "_work_queue", None)
+        return work_queue.qsize() if work_queue is not None else 0
+
+    def _ensure_lag_monitor(self) -> None:
+        if self.max_loop_lag <= 0:
+            return
+        loop = asyncio.get_running_loop()
+        if self._lag_task is None or self._lag_task.done():
+            self._lag_task = loop.create_task(self._monitor_loop_lag())
+
+    async def _monitor_loop_lag(self) -> None:
+        """
+        Sample how late the event loop wakes up from a short sleep.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.lag_interval)
+            self.loop_lag = max(0.0, loop.time() - start - self.lag_interval)
+
+    @staticmethod
+    def _overload(reason: str) -> CustomException:
+        return CustomException(
+            CodeEnum.OPEN_API_OVERLOAD_ERROR,
+            cause_error=reason,
+        )
@@ -0,0 +1,158 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded in-process cache whose entries expire after a fixed time-to-live.
+
+    Entries are evicted in least-recently-used order once ``max_size`` is
+    reached. The cache is meant for short-lived, per-worker memoization and
+    is not shared between processes.
+    """
+
+    def __init__(self, ttl: float, max_size: int = 1024) -> None:
+        """
+        Initialize the cache.
+
+        :param ttl: Time-to-live of each entry in seconds
+        :param max_size: Maximum number of entries kept in memory
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Get a cached value.
+
+        :param key: Cache key
+        :return: The cached value, or None if absent or expired
+        """
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expire_at, value = item
+        if expire_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        :param key: Cache key
+        :param value: Value to store
+        :param ttl: Optional entry-specific time-to-live in seconds
+        """
+        if self.ttl <= 0 and ttl is None:
+            return
+        expire_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._data[key] = (expire_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """
+        Remove a key from the cache if present.
+
+        :param key: Cache key
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class _LeaderCancelled(Exception):
+    """
+    Raised to waiters of a flight whose leading caller was cancelled.
+    """
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesce concurrent async loads of the same key within one worker.
+
+    The first caller of a key runs the loader; callers arriving while it is
+    in flight await its outcome instead of starting their own load, so a
+    cache expiry costs one backend round trip rather than one per request.
+    Results are not kept once the flight completes.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[K, "asyncio.Future[V]"] = {}
+
+    async def do(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """
+        Run ``loader`` for ``key`` unless a load of the same key is in flight.
+
+        Waiters share the leader's result or exception. If the leader is
+        cancelled, one of the waiters takes over and runs its own loader.
+
+        :param key: Flight key
+        :param loader: Zero-argument coroutine factory performing the load
+        :return: The loaded value
+        """
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                break
+            try:
+                return await asyncio.shield(flight)
+            except _LeaderCancelled:
+                continue
+
+        flight = asyncio.get_running_loop().create_future()
+        # Mark the outcome as retrieved so flights without waiters do not log
+        flight.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._flights[key] = flight
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            flight.set_exception(_LeaderCancelled())
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+    def is_running(self, key: K) -> bool:
+        """
+        Check whether a load of the key is in flight.
+
+        :param key: Flight key
+        :return: True if a load is in flight
+        """
+        return key in self._flights
+
+    def __len__(self) -> int:
+        return len(self._flights)
@@ -0,0 +1,295 @@
+"""
+Record and replay of the external interactions of a workflow run.
+
+Call sites that leave the process (model streams, HTTP tools, knowledge
+retrieval, Redis) go through ``interaction`` or ``stream_interaction``. Outside
+a recording or replay session they call through unchanged. While a run is
+recorded, every call is timed and its result, stream frames or error are
+written to a tape. While a tape is replayed, calls are answered from the tape
+in their recorded order at the recorded pace, scaled by a speed factor,
+without touching the network.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import pickle
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+
+T = TypeVar("T")
+
+# Node credentials in the workflow DSL that are never written to a tape
+_REDACTED_FIELDS = frozenset({"apiKey", "apiSecret"})
+_REDACTED = "***"
+
+
+def _redact(value: Any) -> Any:
+    """
+    Copy a DSL value with every credential field replaced by a placeholder.
+
+    :param value: DSL value, nested dicts and lists are redacted too
+    :return: Redacted copy of the value
+    """
+    if isinstance(value, dict):
+        return {
+            key: _REDACTED if key in _REDACTED_FIELDS and item else _redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return value
+
+
+class Interaction(BaseModel):
+    """
+    One recorded external call.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    # Kind of dependency, such as "llm", "http", "knowledge" or "redis"
+    kind: str
+    # Identifies the call among calls of the same kind
+    key: str
+    # Seconds from the start of the run to the start of the call
+    started: float = 0.0
+    # Seconds the call took
+    duration: float = 0.0
+    result: Any = None
+    # (seconds since the start of the call, frame) of streamed calls
+    frames: Optional[List[Tuple[float, Any]]] = None
+    error: Optional[BaseException] = None
+
+
+class RunTape(BaseModel):
+    """
+    Everything needed to replay a workflow run offline.
+    """
+
+    model_config = {"arbitrary_types_allowed": True}
+
+    flow_id: str = ""
+    app_id: str = ""
+    uid: str = ""
+    chat_id: str = ""
+    workflow_dsl: Dict[str, Any] = Field(default_factory=dict)
+    inputs: Dict[str, Any] = Field(default_factory=dict)
+    history: List[Any] = Field(default_factory=list)
+    history_v2: Any = None
+    recorded_at: float = Field(default_factory=time.time)
+    interactions: List[Interaction] = Field(default_factory=list)
+
+    def save(self, path: str) -> None:
+        """
+        Write the tape to a file, without the node credentials of the DSL.
+
+        Replay never calls the providers, so the placeholders are enough to
+        build the engine again.
+
+        :param path: Destination file path
+        """
+        tape = self.model_copy(update={"workflow_dsl": _redact(self.workflow_dsl)})
+        with open(path, "wb") as f:
+            pickle.dump(tape, f)
+
+    @staticmethod
+    def load(path: str) -> "RunTape":
+        """
+        Read a tape written by ``save``.
+
+        :param path: Tape file path
+        :return: The recorded tape
+        """
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+class RunRecorder:
+    """
+    Session writing the external calls of a run onto a tape.
+    """
+
+    def __init__(self, tape: RunTape) -> None:
+        self.tape = tape
+        self._start = time.monotonic()
+
+    async def call(self, kind: str, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        started = time.monotonic()
+        record = Interaction(kind=kind, key=key, started=started - self._start)
+        try:
+            result = await call()
+            # Callers may mutate the result, the tape keeps it as returned
+            record.result = copy.deepcopy(result)
+            return result
+        except Exception as e:
+            record.error = e
+            raise
+        finally:
+            record.duration = time.monotonic() - started
+            self.tape.interactions.append(record)
+
+    async def stream(
+        self, kind: str, key: str, open_stream: Callable[[], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        started = time.monotonic()
+        record = Interaction(kind=kind, key=key, started=started - self._start)
+        frames: List[Tuple[float, Any]] = []
+        stream = open_stream()
+        try:
+            async for frame in stream:
+                frames.append((time.monotonic() - started, copy.deepcopy(frame)))
+                yield frame
+        except Exception as e:
+            record.error = e
+            raise
+        finally:
+            record.frames = frames
+            record.duration = time.monotonic() - started
+            self.tape.interactions.append(record)
+            # Stop the underlying stream too when the caller stops early
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+
+class RunReplayer:
+    """
+    Session answering the external calls of a run from a tape.
+    """
+
+    def __init__(self, tape: RunTape, speed: float = 1.0) -> None:
+        """
+        Initialize the replayer.
+
+        :param tape: Recorded run
+        :param speed: Pace factor, 1 keeps the recorded timing, 10 replays ten
+                      times faster and 0 skips all waiting
+        """
+        self.tape = tape
+        self.speed = speed
+        self._pending: Dict[Tuple[str, str], Deque[Interaction]] = {}
+        for record in tape.interactions:
+            self._pending.setdefault((record.kind, record.key), deque()).append(record)
+
+    def _next(self, kind: str, key: str) -> Interaction:
+        pending = self._pending.get((kind, key))
+        if not pending:
+            raise LookupError(f"No recorded {kind} interaction left for {key}")
+        return pending.popleft()
+
+    async def _wait(self, seconds: float) -> None:
+        if self.speed > 0 and seconds > 0:
+            await asyncio.sleep(seconds / self.speed)
+
+    async def call(self, kind: str, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        record = self._next(kind, key)
+        await self._wait(record.duration)
+        if record.error is not None:
+            raise copy.copy(record.error)
+        return copy.deepcopy(record.result)
+
+    async def stream(
+        self, kind: str, key: str, open_stream: Callable[[], AsyncIterator[T]]
+    ) -> AsyncIterator[T]:
+        record = self._next(kind, key)
+        elapsed = 0.0
+        for offset, frame in record.frames or []:
+            await self._wait(offset - elapsed)
+            elapsed = offset
+            yield copy.deepcopy(frame)
+        if record.error is not None:
+            await self._wait(record.duration - elapsed)
+            raise copy.copy(record.error)
+
+
+# Interaction key, or the values identifying the request it is derived from
+Key = Union[str, Tuple[Any, ...]]
+
+_session: ContextVar[Optional[Union[RunRecorder, RunReplayer]]] = ContextVar(
+    "run_replay_session", default=None
+)
+
+
+@contextmanager
+def activate(session: Union[RunRecorder, RunReplayer]) -> Iterator[None]:
+    """
+    Record or replay the external calls made in the current context.
+
+    Tasks and threads started inside the block inherit the session.
+
+    :param session: Recorder or replayer to route calls through
+    """
+    token = _session.set(session)
+    try:
+        yield
+    finally:
+        _session.reset(token)
+
+
+async def interaction(kind: str, key: Key, call: Callable[[], Awaitable[T]]) -> T:
+    """
+    Make an external call through the active record or replay session.
+
+    :param kind: Kind of dependency
+    :param key: Identifies the call among calls of the same kind, a tuple is
+                digested with ``request_key`` only while a session is active
+    :param call: Makes the call, not invoked while replaying
+    :return: Result of the call
+    """
+    session = _session.get()
+    if session is None:
+        return await call()
+    return await session.call(kind, _resolve_key(key), call)
+
+
+def stream_interaction(
+    kind: str, key: Key, open_stream: Callable[[], AsyncIterator[T]]
+) -> AsyncIterator[T]:
+    """
+    Open an external stream through the active record or replay session.
+
+    :param kind: Kind of dependency
+    :param key: Identifies the stream among streams of the same kind, a tuple
+                is digested with ``request_key`` only while a session is active
+    :param open_stream: Opens the stream, not invoked while replaying
+    :return: Async iterator over the stream frames
+    """
+    session = _session.get()
+    if session is None:
+        return open_stream()
+    return session.stream(kind, _resolve_key(key), open_stream)
+
+
+def _resolve_key(key: Key) -> str:
+    return key if isinstance(key, str) else request_key(*key)
+
+
+def request_key(*parts: Any) -> str:
+    """
+    Derive an interaction key from the content of a request.
+
+    :param parts: Values identifying the request
+    :return: Short digest of the values
+    """
+    content = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]